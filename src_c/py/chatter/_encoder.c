@@ -0,0 +1,284 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+
+#define MAX_INTEGER_SIZE 10
+
+
+static size_t encode_integer(uint8_t *data, int64_t value) {
+    uint8_t temp[MAX_INTEGER_SIZE];
+    size_t size = 0;
+
+    for (;;) {
+        uint8_t i = value & 0x7F;
+        if (!size)
+            i |= 0x80;
+        temp[size++] = i;
+        value >>= 7;
+        if (value == 0 && !(i & 0x40))
+            break;
+        if (value == -1 && (i & 0x40))
+            break;
+    }
+
+    if (data) {
+        for (size_t i = 0; i < size; ++i)
+            data[i] = temp[size - i - 1];
+    }
+
+    return size;
+}
+
+
+static int decode_integer(uint8_t *data, size_t data_len, size_t *pos,
+                          int64_t *value) {
+    if (*pos >= data_len)
+        return 1;
+
+    uint64_t result = (data[*pos] & 0x40) ? UINT64_MAX : 0;
+
+    for (size_t i = 0;; ++i) {
+        if (*pos >= data_len || i >= MAX_INTEGER_SIZE)
+            return 1;
+        uint8_t j = data[(*pos)++];
+        result = (result << 7) | (j & 0x7F);
+        if (j & 0x80)
+            break;
+    }
+
+    *value = (int64_t)result;
+    return 0;
+}
+
+
+static int decode_boolean(uint8_t *data, size_t data_len, size_t *pos,
+                          bool *value) {
+    if (*pos >= data_len)
+        return 1;
+
+    *value = data[(*pos)++];
+    return 0;
+}
+
+
+static int decode_bytes(uint8_t *data, size_t data_len, size_t *pos,
+                        uint8_t **value, size_t *value_len) {
+    int64_t len;
+    if (decode_integer(data, data_len, pos, &len))
+        return 1;
+
+    if (len < 0 || (uint64_t)len > data_len - *pos)
+        return 1;
+
+    *value = data + *pos;
+    *value_len = len;
+    *pos += len;
+    return 0;
+}
+
+
+static PyObject *decode_msg(uint8_t *data, size_t data_len) {
+    size_t pos = 0;
+    int64_t msg_id;
+    int64_t first;
+    bool owner;
+    bool token;
+    bool last;
+    uint8_t *type;
+    size_t type_len;
+    uint8_t *msg_data;
+    size_t msg_data_len;
+
+    if (decode_integer(data, data_len, &pos, &msg_id) ||
+        decode_integer(data, data_len, &pos, &first) ||
+        decode_boolean(data, data_len, &pos, &owner) ||
+        decode_boolean(data, data_len, &pos, &token) ||
+        decode_boolean(data, data_len, &pos, &last) ||
+        decode_bytes(data, data_len, &pos, &type, &type_len) ||
+        decode_bytes(data, data_len, &pos, &msg_data, &msg_data_len)) {
+        PyErr_SetString(PyExc_ValueError, "invalid message");
+        return NULL;
+    }
+
+    PyObject *type_str =
+        PyUnicode_DecodeUTF8((char *)type, type_len, "strict");
+    if (!type_str)
+        return NULL;
+
+    PyObject *msg_data_bytes =
+        PyBytes_FromStringAndSize((char *)msg_data, msg_data_len);
+    if (!msg_data_bytes) {
+        Py_DECREF(type_str);
+        return NULL;
+    }
+
+    PyObject *msg_data_dict =
+        Py_BuildValue("{sNsN}", "type", type_str, "data", msg_data_bytes);
+    if (!msg_data_dict)
+        return NULL;
+
+    return Py_BuildValue("{sLsLsNsNsNsN}", "id", (long long)msg_id, "first",
+                         (long long)first, "owner", PyBool_FromLong(owner),
+                         "token", PyBool_FromLong(token), "last",
+                         PyBool_FromLong(last), "data", msg_data_dict);
+}
+
+
+static PyObject *get_bytes(PyObject *obj, uint8_t **data, size_t *data_len) {
+    if (PyBytes_Check(obj)) {
+        Py_INCREF(obj);
+
+    } else if (!PyByteArray_Check(obj)) {
+        obj = PyObject_Bytes(obj);
+        if (!obj)
+            return NULL;
+
+    } else {
+        Py_INCREF(obj);
+        *data = (uint8_t *)PyByteArray_AsString(obj);
+        *data_len = PyByteArray_Size(obj);
+        return obj;
+    }
+
+    *data = (uint8_t *)PyBytes_AsString(obj);
+    *data_len = PyBytes_Size(obj);
+    return obj;
+}
+
+
+static PyObject *encode_msg(PyObject *self, PyObject *args) {
+    long long msg_id;
+    long long first;
+    int owner;
+    int token;
+    int last;
+    PyObject *type_obj;
+    PyObject *msg_data_obj;
+
+    if (!PyArg_ParseTuple(args, "LLpppUO", &msg_id, &first, &owner, &token,
+                          &last, &type_obj, &msg_data_obj))
+        return NULL;
+
+    Py_ssize_t type_len;
+    const char *type = PyUnicode_AsUTF8AndSize(type_obj, &type_len);
+    if (!type)
+        return NULL;
+
+    uint8_t *msg_data;
+    size_t msg_data_len;
+    msg_data_obj = get_bytes(msg_data_obj, &msg_data, &msg_data_len);
+    if (!msg_data_obj)
+        return NULL;
+
+    size_t msg_len = encode_integer(NULL, msg_id) +
+                     encode_integer(NULL, first) + 3 +
+                     encode_integer(NULL, type_len) + type_len +
+                     encode_integer(NULL, msg_data_len) + msg_data_len;
+
+    size_t msg_len_len = 1;
+    while (msg_len_len < sizeof(size_t) && (msg_len >> (8 * msg_len_len)))
+        msg_len_len += 1;
+
+    PyObject *result =
+        PyBytes_FromStringAndSize(NULL, 1 + msg_len_len + msg_len);
+    if (!result) {
+        Py_DECREF(msg_data_obj);
+        return NULL;
+    }
+
+    uint8_t *data = (uint8_t *)PyBytes_AsString(result);
+
+    *(data++) = msg_len_len;
+    for (size_t i = 0; i < msg_len_len; ++i)
+        *(data++) = (msg_len >> (8 * (msg_len_len - i - 1))) & 0xFF;
+
+    data += encode_integer(data, msg_id);
+    data += encode_integer(data, first);
+    *(data++) = owner ? 1 : 0;
+    *(data++) = token ? 1 : 0;
+    *(data++) = last ? 1 : 0;
+
+    data += encode_integer(data, type_len);
+    memcpy(data, type, type_len);
+    data += type_len;
+
+    data += encode_integer(data, msg_data_len);
+    memcpy(data, msg_data, msg_data_len);
+
+    Py_DECREF(msg_data_obj);
+    return result;
+}
+
+
+static PyObject *decode_msgs(PyObject *self, PyObject *data_obj) {
+    uint8_t *data;
+    size_t data_len;
+    data_obj = get_bytes(data_obj, &data, &data_len);
+    if (!data_obj)
+        return NULL;
+
+    PyObject *msgs = PyList_New(0);
+    if (!msgs) {
+        Py_DECREF(data_obj);
+        return NULL;
+    }
+
+    size_t size = 0;
+    while (size < data_len) {
+        size_t msg_len_len = data[size];
+        if (msg_len_len > sizeof(size_t)) {
+            PyErr_SetString(PyExc_ValueError, "invalid message length");
+            goto error;
+        }
+
+        size_t msg_start = size + 1 + msg_len_len;
+        if (msg_start > data_len)
+            break;
+
+        size_t msg_len = 0;
+        for (size_t i = size + 1; i < msg_start; ++i)
+            msg_len = (msg_len << 8) | data[i];
+
+        if (msg_len > data_len - msg_start)
+            break;
+
+        PyObject *msg = decode_msg(data + msg_start, msg_len);
+        if (!msg)
+            goto error;
+
+        int err = PyList_Append(msgs, msg);
+        Py_DECREF(msg);
+        if (err)
+            goto error;
+
+        size = msg_start + msg_len;
+    }
+
+    Py_DECREF(data_obj);
+    return Py_BuildValue("(Nn)", msgs, (Py_ssize_t)size);
+
+error:
+    Py_DECREF(msgs);
+    Py_DECREF(data_obj);
+    return NULL;
+}
+
+
+PyMethodDef methods[] = {{.ml_name = "encode_msg",
+                          .ml_meth = (PyCFunction)encode_msg,
+                          .ml_flags = METH_VARARGS},
+                         {.ml_name = "decode_msgs",
+                          .ml_meth = (PyCFunction)decode_msgs,
+                          .ml_flags = METH_O},
+                         {NULL}};
+
+
+PyModuleDef module_def = {.m_base = PyModuleDef_HEAD_INIT,
+                          .m_name = "_encoder",
+                          .m_methods = methods};
+
+
+PyMODINIT_FUNC PyInit__encoder() { return PyModule_Create(&module_def); }
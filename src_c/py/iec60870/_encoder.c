@@ -0,0 +1,637 @@
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+
+#define MAX_TIME_SIZE 7
+
+
+typedef struct {
+    uint8_t *data;
+    size_t len;
+    size_t cap;
+} buffer_t;
+
+
+static PyObject *tuple_new = NULL;
+static PyObject *asdu_cls = NULL;
+static PyObject *io_cls = NULL;
+static PyObject *time_cls = NULL;
+static PyObject *time_sizes[MAX_TIME_SIZE + 1] = {NULL};
+
+
+static PyObject *get_bytes(PyObject *obj, uint8_t **data, size_t *data_len) {
+    if (PyBytes_Check(obj)) {
+        Py_INCREF(obj);
+
+    } else if (!PyByteArray_Check(obj)) {
+        obj = PyObject_Bytes(obj);
+        if (!obj)
+            return NULL;
+
+    } else {
+        Py_INCREF(obj);
+        *data = (uint8_t *)PyByteArray_AsString(obj);
+        *data_len = PyByteArray_Size(obj);
+        return obj;
+    }
+
+    *data = (uint8_t *)PyBytes_AsString(obj);
+    *data_len = PyBytes_Size(obj);
+    return obj;
+}
+
+
+static PyObject *create_named_tuple(PyObject *cls, PyObject *items) {
+    if (!items)
+        return NULL;
+
+    PyObject *result =
+        PyObject_CallFunctionObjArgs(tuple_new, cls, items, NULL);
+    Py_DECREF(items);
+    return result;
+}
+
+
+static uint32_t decode_uint(uint8_t *data, size_t size) {
+    uint32_t result = 0;
+    for (size_t i = 0; i < size; ++i)
+        result |= (uint32_t)data[i] << (8 * i);
+    return result;
+}
+
+
+static int get_time_size(PyObject *time_sizes_dict, PyObject *asdu_type,
+                         size_t *time_size) {
+    PyObject *time_size_obj =
+        PyDict_GetItemWithError(time_sizes_dict, asdu_type);
+    if (!time_size_obj) {
+        if (PyErr_Occurred())
+            return 1;
+        *time_size = 0;
+        return 0;
+    }
+
+    Py_ssize_t value = PyLong_AsSsize_t(time_size_obj);
+    if (value == -1 && PyErr_Occurred())
+        return 1;
+
+    if (value < 0 || value > MAX_TIME_SIZE || !time_sizes[value]) {
+        PyErr_SetString(PyExc_ValueError, "unsupported time size");
+        return 1;
+    }
+
+    *time_size = value;
+    return 0;
+}
+
+
+static PyObject *decode_time(uint8_t *data, size_t time_size) {
+    PyObject *size = time_sizes[time_size];
+    long milliseconds = data[0] | (data[1] << 8);
+
+    if (time_size == 2)
+        return Py_BuildValue("(OlOOOOOOOOO)", size, milliseconds, Py_None,
+                             Py_None, Py_None, Py_None, Py_None, Py_None,
+                             Py_None, Py_None, Py_None);
+
+    PyObject *invalid = PyBool_FromLong(data[2] & 0x80);
+    PyObject *substituted = PyBool_FromLong(data[2] & 0x40);
+    long minutes = data[2] & 0x3F;
+
+    if (time_size == 3)
+        return Py_BuildValue("(OlNNlOOOOOO)", size, milliseconds, invalid,
+                             substituted, minutes, Py_None, Py_None, Py_None,
+                             Py_None, Py_None, Py_None);
+
+    PyObject *summer_time = PyBool_FromLong(data[3] & 0x80);
+    long hours = data[3] & 0x1F;
+
+    if (time_size == 4)
+        return Py_BuildValue("(OlNNlNlOOOO)", size, milliseconds, invalid,
+                             substituted, minutes, summer_time, hours, Py_None,
+                             Py_None, Py_None, Py_None);
+
+    return Py_BuildValue("(OlNNlNlllll)", size, milliseconds, invalid,
+                         substituted, minutes, summer_time, hours,
+                         (long)(data[4] >> 5), (long)(data[4] & 0x1F),
+                         (long)(data[5] & 0x0F), (long)(data[6] & 0x7F));
+}
+
+
+static PyObject *decode_elements(PyObject *data_obj, size_t data_len,
+                                 size_t *pos, size_t element_count,
+                                 PyObject *asdu_type, PyObject *decode_cb) {
+    PyObject *elements = PyList_New(element_count);
+    if (!elements)
+        return NULL;
+
+    if (!element_count)
+        return elements;
+
+    PyObject *rest = PySequence_GetSlice(data_obj, *pos, PY_SSIZE_T_MAX);
+    if (!rest)
+        goto error;
+
+    for (size_t i = 0; i < element_count; ++i) {
+        PyObject *result =
+            PyObject_CallFunctionObjArgs(decode_cb, rest, asdu_type, NULL);
+        Py_DECREF(rest);
+        if (!result)
+            goto error;
+
+        PyObject *element;
+        if (!PyArg_ParseTuple(result, "OO", &element, &rest)) {
+            Py_DECREF(result);
+            goto error;
+        }
+
+        Py_INCREF(element);
+        Py_INCREF(rest);
+        Py_DECREF(result);
+        PyList_SetItem(elements, i, element);
+    }
+
+    Py_ssize_t rest_len = PyObject_Length(rest);
+    Py_DECREF(rest);
+    if (rest_len < 0)
+        goto error;
+
+    if ((size_t)rest_len > data_len - *pos) {
+        PyErr_SetString(PyExc_ValueError, "invalid IO element");
+        goto error;
+    }
+
+    *pos = data_len - rest_len;
+    return elements;
+
+error:
+    Py_DECREF(elements);
+    return NULL;
+}
+
+
+static PyObject *decode_asdu(PyObject *self, PyObject *args) {
+    PyObject *data_obj;
+    Py_ssize_t cause_size;
+    Py_ssize_t asdu_address_size;
+    Py_ssize_t io_address_size;
+    PyObject *time_sizes_dict;
+    int inverted_sequence_bit;
+    PyObject *decode_cb;
+
+    if (!PyArg_ParseTuple(args, "OnnnO!pO", &data_obj, &cause_size,
+                          &asdu_address_size, &io_address_size, &PyDict_Type,
+                          &time_sizes_dict, &inverted_sequence_bit,
+                          &decode_cb))
+        return NULL;
+
+    uint8_t *data;
+    size_t data_len;
+    PyObject *data_bytes = get_bytes(data_obj, &data, &data_len);
+    if (!data_bytes)
+        return NULL;
+
+    PyObject *asdu_type = NULL;
+    PyObject *ios = NULL;
+    PyObject *elements = NULL;
+    PyObject *time = NULL;
+
+    size_t pos = 2 + cause_size + asdu_address_size;
+    if (pos > data_len)
+        goto invalid;
+
+    asdu_type = PyLong_FromLong(data[0]);
+    if (!asdu_type)
+        goto error;
+
+    uint8_t vsq = data[1];
+    size_t io_number = vsq & 0x7F;
+    bool is_sequence = (vsq & 0x80) != 0;
+    if (inverted_sequence_bit)
+        is_sequence = !is_sequence;
+
+    size_t io_count = is_sequence ? 1 : io_number;
+    size_t element_count = is_sequence ? io_number : 1;
+
+    uint32_t cause = decode_uint(data + 2, cause_size);
+    uint32_t address = decode_uint(data + 2 + cause_size, asdu_address_size);
+
+    size_t time_size;
+    if (get_time_size(time_sizes_dict, asdu_type, &time_size))
+        goto error;
+
+    ios = PyList_New(io_count);
+    if (!ios)
+        goto error;
+
+    for (size_t i = 0; i < io_count; ++i) {
+        if ((size_t)io_address_size > data_len - pos)
+            goto invalid;
+
+        uint32_t io_address = decode_uint(data + pos, io_address_size);
+        pos += io_address_size;
+
+        elements = decode_elements(data_obj, data_len, &pos, element_count,
+                                   asdu_type, decode_cb);
+        if (!elements)
+            goto error;
+
+        if (time_size) {
+            if (time_size > data_len - pos)
+                goto invalid;
+
+            time = create_named_tuple(time_cls,
+                                      decode_time(data + pos, time_size));
+            if (!time)
+                goto error;
+
+            pos += time_size;
+
+        } else {
+            Py_INCREF(Py_None);
+            time = Py_None;
+        }
+
+        PyObject *io = create_named_tuple(
+            io_cls,
+            Py_BuildValue("(kOO)", (unsigned long)io_address, elements, time));
+        Py_CLEAR(elements);
+        Py_CLEAR(time);
+        if (!io)
+            goto error;
+
+        PyList_SetItem(ios, i, io);
+    }
+
+    PyObject *asdu = create_named_tuple(
+        asdu_cls, Py_BuildValue("(OkkO)", asdu_type, (unsigned long)cause,
+                                (unsigned long)address, ios));
+    Py_DECREF(asdu_type);
+    Py_DECREF(ios);
+    Py_DECREF(data_bytes);
+    if (!asdu)
+        return NULL;
+
+    return Py_BuildValue("(Nn)", asdu, (Py_ssize_t)pos);
+
+invalid:
+    PyErr_SetString(PyExc_ValueError, "invalid ASDU length");
+
+error:
+    Py_XDECREF(asdu_type);
+    Py_XDECREF(ios);
+    Py_XDECREF(elements);
+    Py_XDECREF(time);
+    Py_DECREF(data_bytes);
+    return NULL;
+}
+
+
+static int buffer_append(buffer_t *buffer, uint8_t *data, size_t data_len) {
+    if (buffer->len + data_len > buffer->cap) {
+        size_t cap = buffer->cap ? buffer->cap : 64;
+        while (cap < buffer->len + data_len)
+            cap *= 2;
+
+        uint8_t *buffer_data = PyMem_Realloc(buffer->data, cap);
+        if (!buffer_data) {
+            PyErr_NoMemory();
+            return 1;
+        }
+
+        buffer->data = buffer_data;
+        buffer->cap = cap;
+    }
+
+    memcpy(buffer->data + buffer->len, data, data_len);
+    buffer->len += data_len;
+    return 0;
+}
+
+
+static int buffer_append_uint(buffer_t *buffer, PyObject *obj, size_t size) {
+    PyObject *index = PyNumber_Index(obj);
+    if (!index)
+        return 1;
+
+    unsigned long long value = PyLong_AsUnsignedLongLong(index);
+    Py_DECREF(index);
+    if (value == (unsigned long long)-1 && PyErr_Occurred())
+        return 1;
+
+    if (size < sizeof(value) && (value >> (8 * size))) {
+        PyErr_SetString(PyExc_ValueError, "value out of range");
+        return 1;
+    }
+
+    uint8_t data[sizeof(value)];
+    for (size_t i = 0; i < size; ++i)
+        data[i] = (value >> (8 * i)) & 0xFF;
+
+    return buffer_append(buffer, data, size);
+}
+
+
+static int get_time_field(PyObject *time, Py_ssize_t index, long *value) {
+    PyObject *item = PyTuple_GetItem(time, index);
+    if (!item)
+        return 1;
+
+    *value = PyLong_AsLong(item);
+    if (*value == -1 && PyErr_Occurred())
+        return 1;
+
+    return 0;
+}
+
+
+static int get_time_flag(PyObject *time, Py_ssize_t index, uint8_t flag,
+                         uint8_t *value) {
+    PyObject *item = PyTuple_GetItem(time, index);
+    if (!item)
+        return 1;
+
+    int is_true = PyObject_IsTrue(item);
+    if (is_true < 0)
+        return 1;
+
+    *value = is_true ? flag : 0;
+    return 0;
+}
+
+
+static int encode_time(buffer_t *buffer, PyObject *time, size_t time_size) {
+    if (!PyTuple_Check(time)) {
+        PyErr_SetString(PyExc_TypeError, "invalid time");
+        return 1;
+    }
+
+    PyObject *size_obj = PyTuple_GetItem(time, 0);
+    if (!size_obj)
+        return 1;
+
+    PyObject *size_value = PyObject_GetAttrString(size_obj, "value");
+    if (!size_value)
+        return 1;
+
+    Py_ssize_t size = PyLong_AsSsize_t(size_value);
+    Py_DECREF(size_value);
+    if (size == -1 && PyErr_Occurred())
+        return 1;
+
+    if ((Py_ssize_t)time_size > size) {
+        PyErr_SetString(PyExc_ValueError, "unsupported time size");
+        return 1;
+    }
+
+    uint8_t data[MAX_TIME_SIZE];
+    long milliseconds;
+    if (get_time_field(time, 1, &milliseconds))
+        return 1;
+
+    data[0] = milliseconds & 0xFF;
+    data[1] = (milliseconds >> 8) & 0xFF;
+
+    if (time_size > 2) {
+        uint8_t invalid;
+        uint8_t substituted;
+        long minutes;
+        if (get_time_flag(time, 2, 0x80, &invalid) ||
+            get_time_flag(time, 3, 0x40, &substituted) ||
+            get_time_field(time, 4, &minutes))
+            return 1;
+
+        data[2] = invalid | substituted | (minutes & 0x3F);
+    }
+
+    if (time_size > 3) {
+        uint8_t summer_time;
+        long hours;
+        if (get_time_flag(time, 5, 0x80, &summer_time) ||
+            get_time_field(time, 6, &hours))
+            return 1;
+
+        data[3] = summer_time | (hours & 0x1F);
+    }
+
+    if (time_size > 4) {
+        long day_of_week;
+        long day_of_month;
+        long months;
+        long years;
+        if (get_time_field(time, 7, &day_of_week) ||
+            get_time_field(time, 8, &day_of_month) ||
+            get_time_field(time, 9, &months) ||
+            get_time_field(time, 10, &years))
+            return 1;
+
+        data[4] = ((day_of_week & 0x07) << 5) | (day_of_month & 0x1F);
+        data[5] = months & 0x0F;
+        data[6] = years & 0x7F;
+    }
+
+    return buffer_append(buffer, data, time_size);
+}
+
+
+static int encode_element(buffer_t *buffer, PyObject *element,
+                          PyObject *asdu_type, PyObject *encode_cb) {
+    PyObject *result =
+        PyObject_CallFunctionObjArgs(encode_cb, element, asdu_type, NULL);
+    if (!result)
+        return 1;
+
+    PyObject *result_bytes = PyObject_Bytes(result);
+    Py_DECREF(result);
+    if (!result_bytes)
+        return 1;
+
+    int err = buffer_append(buffer, (uint8_t *)PyBytes_AsString(result_bytes),
+                            PyBytes_Size(result_bytes));
+    Py_DECREF(result_bytes);
+    return err;
+}
+
+
+static int encode_io(buffer_t *buffer, PyObject *io, PyObject *asdu_type,
+                     size_t io_address_size, size_t time_size,
+                     bool is_sequence, PyObject *encode_cb) {
+    if (!PyTuple_Check(io) || PyTuple_Size(io) != 3) {
+        PyErr_SetString(PyExc_TypeError, "invalid IO");
+        return 1;
+    }
+
+    PyObject *elements = PyTuple_GetItem(io, 1);
+    Py_ssize_t elements_len = PyObject_Length(elements);
+    if (elements_len < 0)
+        return 1;
+
+    if (!is_sequence && elements_len != 1) {
+        PyErr_SetString(PyExc_ValueError, "invalid number of IO elements");
+        return 1;
+    }
+
+    if (buffer_append_uint(buffer, PyTuple_GetItem(io, 0), io_address_size))
+        return 1;
+
+    for (Py_ssize_t i = 0; i < elements_len; ++i) {
+        PyObject *element = PySequence_GetItem(elements, i);
+        if (!element)
+            return 1;
+
+        int err = encode_element(buffer, element, asdu_type, encode_cb);
+        Py_DECREF(element);
+        if (err)
+            return 1;
+    }
+
+    if (time_size)
+        return encode_time(buffer, PyTuple_GetItem(io, 2), time_size);
+
+    return 0;
+}
+
+
+static PyObject *encode_asdu(PyObject *self, PyObject *args) {
+    PyObject *asdu;
+    Py_ssize_t cause_size;
+    Py_ssize_t asdu_address_size;
+    Py_ssize_t io_address_size;
+    PyObject *time_sizes_dict;
+    int inverted_sequence_bit;
+    PyObject *encode_cb;
+
+    if (!PyArg_ParseTuple(args, "OnnnO!pO", &asdu, &cause_size,
+                          &asdu_address_size, &io_address_size, &PyDict_Type,
+                          &time_sizes_dict, &inverted_sequence_bit,
+                          &encode_cb))
+        return NULL;
+
+    if (!PyTuple_Check(asdu) || PyTuple_Size(asdu) != 4) {
+        PyErr_SetString(PyExc_TypeError, "invalid ASDU");
+        return NULL;
+    }
+
+    PyObject *asdu_type = PyTuple_GetItem(asdu, 0);
+    PyObject *ios = PyTuple_GetItem(asdu, 3);
+
+    Py_ssize_t ios_len = PyObject_Length(ios);
+    if (ios_len < 0)
+        return NULL;
+
+    PyObject *first_io = NULL;
+    Py_ssize_t first_elements_len = 0;
+    if (ios_len == 1) {
+        first_io = PySequence_GetItem(ios, 0);
+        if (!first_io)
+            return NULL;
+
+        if (PyTuple_Check(first_io) && PyTuple_Size(first_io) == 3)
+            first_elements_len = PyObject_Length(PyTuple_GetItem(first_io, 1));
+        Py_DECREF(first_io);
+        if (first_elements_len < 0)
+            return NULL;
+    }
+
+    bool is_sequence = first_elements_len > 1;
+    Py_ssize_t count = is_sequence ? first_elements_len : ios_len;
+    if (count > 0x7F) {
+        PyErr_SetString(PyExc_ValueError, "invalid number of IOs");
+        return NULL;
+    }
+
+    uint8_t vsq = count;
+    if (is_sequence != (bool)inverted_sequence_bit)
+        vsq |= 0x80;
+
+    size_t time_size;
+    if (get_time_size(time_sizes_dict, asdu_type, &time_size))
+        return NULL;
+
+    buffer_t buffer = {.data = NULL, .len = 0, .cap = 0};
+
+    if (buffer_append_uint(&buffer, asdu_type, 1) ||
+        buffer_append(&buffer, &vsq, 1) ||
+        buffer_append_uint(&buffer, PyTuple_GetItem(asdu, 1), cause_size) ||
+        buffer_append_uint(&buffer, PyTuple_GetItem(asdu, 2),
+                           asdu_address_size))
+        goto error;
+
+    for (Py_ssize_t i = 0; i < ios_len; ++i) {
+        PyObject *io = PySequence_GetItem(ios, i);
+        if (!io)
+            goto error;
+
+        int err = encode_io(&buffer, io, asdu_type, io_address_size,
+                            time_size, is_sequence, encode_cb);
+        Py_DECREF(io);
+        if (err)
+            goto error;
+    }
+
+    PyObject *result =
+        PyBytes_FromStringAndSize((char *)buffer.data, buffer.len);
+    PyMem_Free(buffer.data);
+    return result;
+
+error:
+    PyMem_Free(buffer.data);
+    return NULL;
+}
+
+
+PyMethodDef methods[] = {{.ml_name = "decode_asdu",
+                          .ml_meth = (PyCFunction)decode_asdu,
+                          .ml_flags = METH_VARARGS},
+                         {.ml_name = "encode_asdu",
+                          .ml_meth = (PyCFunction)encode_asdu,
+                          .ml_flags = METH_VARARGS},
+                         {NULL}};
+
+
+PyModuleDef module_def = {.m_base = PyModuleDef_HEAD_INIT,
+                          .m_name = "_encoder",
+                          .m_methods = methods};
+
+
+PyMODINIT_FUNC PyInit__encoder() {
+    PyObject *common =
+        PyImport_ImportModule("hat.drivers.iec60870.encodings.common");
+    if (!common)
+        return NULL;
+
+    PyObject *time_size_cls = PyObject_GetAttrString(common, "TimeSize");
+    asdu_cls = PyObject_GetAttrString(common, "ASDU");
+    io_cls = PyObject_GetAttrString(common, "IO");
+    time_cls = PyObject_GetAttrString(common, "Time");
+    Py_DECREF(common);
+    if (!time_size_cls || !asdu_cls || !io_cls || !time_cls)
+        goto error;
+
+    size_t sizes[] = {2, 3, 4, 7};
+    for (size_t i = 0; i < sizeof(sizes) / sizeof(sizes[0]); ++i) {
+        time_sizes[sizes[i]] =
+            PyObject_CallFunction(time_size_cls, "n", (Py_ssize_t)sizes[i]);
+        if (!time_sizes[sizes[i]])
+            goto error;
+    }
+    Py_CLEAR(time_size_cls);
+
+    tuple_new = PyObject_GetAttrString((PyObject *)&PyTuple_Type, "__new__");
+    if (!tuple_new)
+        goto error;
+
+    return PyModule_Create(&module_def);
+
+error:
+    Py_XDECREF(time_size_cls);
+    Py_CLEAR(asdu_cls);
+    Py_CLEAR(io_cls);
+    Py_CLEAR(time_cls);
+    for (size_t i = 0; i <= MAX_TIME_SIZE; ++i)
+        Py_CLEAR(time_sizes[i]);
+    return NULL;
+}
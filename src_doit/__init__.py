@@ -45,7 +45,10 @@ def task_clean_all():
         *(common.src_py_dir / 'hat/drivers/ssl').glob('_ssl.*'),
         *(common.src_py_dir / 'hat/drivers/serial').glob('_native_serial.*'),
         *(common.src_py_dir /
-          'hat/drivers/modbus/transport').glob('_encoder.*')])]}
+          'hat/drivers/modbus/transport').glob('_encoder.*'),
+        *(common.src_py_dir / 'hat/drivers/chatter').glob('_encoder.*'),
+        *(common.src_py_dir /
+          'hat/drivers/iec60870/encodings').glob('_encoder.*')])]}
 
 
 def task_build():
@@ -1,13 +1,19 @@
+from .chatter import *  # NOQA
+from .iec60870 import *  # NOQA
 from .modbus import *  # NOQA
 from .serial import *  # NOQA
 from .ssl import *  # NOQA
 
+from . import chatter
+from . import iec60870
 from . import modbus
 from . import serial
 from . import ssl
 
 
 __all__ = ['task_pymodules',
+           *chatter.__all__,
+           *iec60870.__all__,
            *modbus.__all__,
            *serial.__all__,
            *ssl.__all__]
@@ -18,4 +24,6 @@ def task_pymodules():
     return {'actions': None,
             'task_dep': ['pymodules_ssl',
                          'pymodules_serial',
-                         'pymodules_modbus']}
+                         'pymodules_modbus',
+                         'pymodules_chatter',
+                         'pymodules_iec60870']}
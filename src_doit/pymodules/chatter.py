@@ -0,0 +1,58 @@
+from hat.doit.c import (get_py_c_flags,
+                        get_py_ld_flags,
+                        get_py_ld_libs,
+                        CBuild)
+
+from .. import common
+
+
+__all__ = ['task_pymodules_chatter',
+           'task_pymodules_chatter_obj',
+           'task_pymodules_chatter_dep',
+           'task_pymodules_chatter_cleanup']
+
+
+chatter_path = (common.src_py_dir / 'hat/drivers/chatter/_encoder'
+                ).with_suffix(common.py_ext_suffix)
+chatter_src_paths = [common.src_c_dir / 'py/chatter/_encoder.c']
+chatter_build_dir = (common.pymodules_build_dir / 'chatter' /
+                     f'{common.target_platform.name.lower()}')
+chatter_c_flags = [*get_py_c_flags(py_limited_api=common.py_limited_api),
+                   '-fPIC',
+                   '-O2']
+chatter_ld_flags = [*get_py_ld_flags(py_limited_api=common.py_limited_api)]
+chatter_ld_libs = [*get_py_ld_libs(py_limited_api=common.py_limited_api)]
+
+chatter_build = CBuild(src_paths=chatter_src_paths,
+                       build_dir=chatter_build_dir,
+                       c_flags=chatter_c_flags,
+                       ld_flags=chatter_ld_flags,
+                       ld_libs=chatter_ld_libs,
+                       task_dep=['pymodules_chatter_cleanup'])
+
+
+def task_pymodules_chatter():
+    """Build pymodules chatter"""
+    yield from chatter_build.get_task_lib(chatter_path)
+
+
+def task_pymodules_chatter_obj():
+    """Build pymodules chatter .o files"""
+    yield from chatter_build.get_task_objs()
+
+
+def task_pymodules_chatter_dep():
+    """Build pymodules chatter .d files"""
+    yield from chatter_build.get_task_deps()
+
+
+def task_pymodules_chatter_cleanup():
+    """Cleanup pymodules chatter"""
+
+    def cleanup():
+        for path in chatter_path.parent.glob('_encoder.*'):
+            if path == chatter_path:
+                continue
+            common.rm_rf(path)
+
+    return {'actions': [cleanup]}
@@ -0,0 +1,59 @@
+from hat.doit.c import (get_py_c_flags,
+                        get_py_ld_flags,
+                        get_py_ld_libs,
+                        CBuild)
+
+from .. import common
+
+
+__all__ = ['task_pymodules_iec60870',
+           'task_pymodules_iec60870_obj',
+           'task_pymodules_iec60870_dep',
+           'task_pymodules_iec60870_cleanup']
+
+
+iec60870_path = (common.src_py_dir /
+                 'hat/drivers/iec60870/encodings/_encoder'
+                 ).with_suffix(common.py_ext_suffix)
+iec60870_src_paths = [common.src_c_dir / 'py/iec60870/_encoder.c']
+iec60870_build_dir = (common.pymodules_build_dir / 'iec60870' /
+                      f'{common.target_platform.name.lower()}')
+iec60870_c_flags = [*get_py_c_flags(py_limited_api=common.py_limited_api),
+                    '-fPIC',
+                    '-O2']
+iec60870_ld_flags = [*get_py_ld_flags(py_limited_api=common.py_limited_api)]
+iec60870_ld_libs = [*get_py_ld_libs(py_limited_api=common.py_limited_api)]
+
+iec60870_build = CBuild(src_paths=iec60870_src_paths,
+                        build_dir=iec60870_build_dir,
+                        c_flags=iec60870_c_flags,
+                        ld_flags=iec60870_ld_flags,
+                        ld_libs=iec60870_ld_libs,
+                        task_dep=['pymodules_iec60870_cleanup'])
+
+
+def task_pymodules_iec60870():
+    """Build pymodules iec60870"""
+    yield from iec60870_build.get_task_lib(iec60870_path)
+
+
+def task_pymodules_iec60870_obj():
+    """Build pymodules iec60870 .o files"""
+    yield from iec60870_build.get_task_objs()
+
+
+def task_pymodules_iec60870_dep():
+    """Build pymodules iec60870 .d files"""
+    yield from iec60870_build.get_task_deps()
+
+
+def task_pymodules_iec60870_cleanup():
+    """Cleanup pymodules iec60870"""
+
+    def cleanup():
+        for path in iec60870_path.parent.glob('_encoder.*'):
+            if path == iec60870_path:
+                continue
+            common.rm_rf(path)
+
+    return {'actions': [cleanup]}
@@ -1,6 +1,7 @@
 """Chatter communication protocol"""
 
 import asyncio
+import collections
 import contextlib
 import importlib.resources
 import itertools
@@ -14,6 +15,12 @@ from hat import util
 
 from hat.drivers import tcp
 
+try:
+    from hat.drivers.chatter import _encoder
+
+except ImportError:
+    _encoder = None
+
 
 mlog: logging.Logger = logging.getLogger(__name__)
 """Module logger"""
@@ -137,7 +144,8 @@ class Connection(aio.Resource):
                  send_queue_size: int):
         self._conn = conn
         self._receive_queue = aio.Queue(receive_queue_size)
-        self._send_queue = aio.Queue(receive_queue_size)
+        self._send_queue = aio.Queue(send_queue_size)
+        self._input_buffer = bytearray()
         self._loop = asyncio.get_running_loop()
         self._next_msg_ids = itertools.count(1)
         self._ping_event = asyncio.Event()
@@ -213,31 +221,9 @@ class Connection(aio.Resource):
         self._log.debug("connection's read loop started")
         try:
             while True:
-                self._log.debug("waiting for incoming message")
-                data = await self._read()
-                msg = Msg(
-                    data=Data(type=data['data']['type'],
-                              data=data['data']['data']),
-                    conv=Conversation(owner=not data['owner'],
-                                      first_id=data['first']),
-                    first=data['owner'] and data['first'] == data['id'],
-                    last=data['last'],
-                    token=data['token'])
-
-                self._ping_event.set()
-
-                if msg.data.type == 'HatChatter.Ping':
-                    self._log.debug("received ping request - "
-                                    "sending ping response")
-                    await self.send(Data('HatChatter.Pong', b''),
-                                    conv=msg.conv)
-
-                elif msg.data.type == 'HatChatter.Pong':
-                    self._log.debug("received ping response")
-
-                else:
-                    self._log.debug("received message %s", msg.data.type)
-                    await self._receive_queue.put(msg)
+                self._log.debug("waiting for incoming messages")
+                for msg in await self._read():
+                    await self._process_msg(msg)
 
         except ConnectionError:
             self._log.debug("connection error")
@@ -256,19 +242,34 @@ class Connection(aio.Resource):
 
         try:
             while True:
-                self._log.debug("waiting for outgoing message")
+                self._log.debug("waiting for outgoing messages")
                 msg, future = await self._send_queue.get()
+                data = bytearray()
 
-                if msg is None:
-                    self._log.debug("draining output buffer")
-                    await self._conn.drain()
+                while True:
+                    if msg is None:
+                        if data:
+                            await self._conn.write(data)
+                            data = bytearray()
 
-                else:
-                    self._log.debug("writing message %s", msg['data']['type'])
-                    await self._write(msg)
+                        self._log.debug("draining output buffer")
+                        await self._conn.drain()
 
-                if future and not future.done():
-                    future.set_result(None)
+                    else:
+                        self._log.debug("writing message %s",
+                                        msg['data']['type'])
+                        _encode_msg(data, msg)
+
+                    if future and not future.done():
+                        future.set_result(None)
+
+                    if self._send_queue.empty():
+                        break
+
+                    msg, future = self._send_queue.get_nowait()
+
+                if data:
+                    await self._conn.write(data)
 
         except ConnectionError:
             self._log.debug("connection error")
@@ -316,27 +317,88 @@ class Connection(aio.Resource):
             self._log.debug("ping loop stopped")
             self.close()
 
+    async def _process_msg(self, data):
+        msg = Msg(
+            data=Data(type=data['data']['type'],
+                      data=data['data']['data']),
+            conv=Conversation(owner=not data['owner'],
+                              first_id=data['first']),
+            first=data['owner'] and data['first'] == data['id'],
+            last=data['last'],
+            token=data['token'])
+
+        self._ping_event.set()
+
+        if msg.data.type == 'HatChatter.Ping':
+            self._log.debug("received ping request - "
+                            "sending ping response")
+            await self.send(Data('HatChatter.Pong', b''),
+                            conv=msg.conv)
+
+        elif msg.data.type == 'HatChatter.Pong':
+            self._log.debug("received ping response")
+
+        else:
+            self._log.debug("received message %s", msg.data.type)
+            await self._receive_queue.put(msg)
+
     async def _read(self):
-        msg_len_len_bytes = await self._conn.readexactly(1)
-        msg_len_len = msg_len_len_bytes[0]
+        while True:
+            msgs, size = _decode_msgs(self._input_buffer)
+
+            if msgs:
+                del self._input_buffer[:size]
+                return msgs
+
+            self._input_buffer.extend(await self._conn.read())
+
+
+def _encode_msg(data, msg):
+    if _encoder:
+        data.extend(_encoder.encode_msg(msg['id'], msg['first'], msg['owner'],
+                                        msg['token'], msg['last'],
+                                        msg['data']['type'],
+                                        msg['data']['data']))
+        return
+
+    msg_bytes = _sbs_repo.encode('HatChatter.Msg', msg)
+    msg_len = len(msg_bytes)
+    msg_len_bytes = _uint_to_bebytes(msg_len)
+
+    data.append(len(msg_len_bytes))
+    data.extend(msg_len_bytes)
+    data.extend(msg_bytes)
+
+
+def _decode_msgs(data):
+    if _encoder:
+        return _encoder.decode_msgs(data)
+
+    with memoryview(data) as data:
+        return _decode_msgs_view(data)
+
 
-        msg_len_bytes = await self._conn.readexactly(msg_len_len)
-        msg_len = _bebytes_to_uint(msg_len_bytes)
+def _decode_msgs_view(data):
+    msgs = collections.deque()
+    size = 0
 
-        msg_bytes = await self._conn.readexactly(msg_len)
-        msg = _sbs_repo.decode('HatChatter.Msg', msg_bytes)
+    while size < len(data):
+        msg_len_len = data[size]
+        msg_start = size + 1 + msg_len_len
+        if msg_start > len(data):
+            break
 
-        return msg
+        msg_len = _bebytes_to_uint(data[size + 1:msg_start])
+        msg_end = msg_start + msg_len
+        if msg_end > len(data):
+            break
 
-    async def _write(self, msg):
-        msg_bytes = _sbs_repo.encode('HatChatter.Msg', msg)
-        msg_len = len(msg_bytes)
-        msg_len_bytes = _uint_to_bebytes(msg_len)
-        msg_len_len_bytes = [len(msg_len_bytes)]
+        msg = _sbs_repo.decode('HatChatter.Msg',
+                               bytes(data[msg_start:msg_end]))
+        msgs.append(msg)
+        size = msg_end
 
-        await self._conn.write(bytes(itertools.chain(msg_len_len_bytes,
-                                                     msg_len_bytes,
-                                                     msg_bytes)))
+    return msgs, size
 
 
 def _uint_to_bebytes(x):
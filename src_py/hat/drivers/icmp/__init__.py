@@ -1,8 +1,10 @@
-from hat.drivers.icmp.common import EndpointInfo
+from hat.drivers.icmp.common import (EndpointInfo,
+                                     PingStats)
 from hat.drivers.icmp.endpoint import (create_endpoint,
                                        Endpoint)
 
 
 __all__ = ['EndpointInfo',
+           'PingStats',
            'create_endpoint',
            'Endpoint']
@@ -18,3 +18,17 @@ Msg: typing.TypeAlias = EchoMsg
 class EndpointInfo(typing.NamedTuple):
     name: str | None
     local_host: str
+
+
+class PingStats(typing.NamedTuple):
+    remote_host: str
+    sent: int
+    received: int
+    rtt_min: float | None
+    """minimal round-trip time in seconds"""
+    rtt_avg: float | None
+    """average round-trip time in seconds"""
+    rtt_max: float | None
+    """maximal round-trip time in seconds"""
+    rtt_jitter: float | None
+    """average difference between consecutive round-trip times in seconds"""
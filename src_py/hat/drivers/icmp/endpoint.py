@@ -1,9 +1,12 @@
 import asyncio
+import collections
 import itertools
 import logging
 import math
 import socket
 import sys
+import time
+import typing
 import uuid
 
 from hat import aio
@@ -27,7 +30,8 @@ async def create_endpoint(local_host: str = '0.0.0.0',
     endpoint._async_group = aio.Group()
     endpoint._loop = loop
     endpoint._echo_data = _echo_data_iter()
-    endpoint._echo_futures = {}
+    endpoint._sequence_numbers = itertools.cycle(range(1, 0x10000))
+    endpoint._echo_requests = {}
     endpoint._info = common.EndpointInfo(name=name,
                                          local_host=local_addr[0])
 
@@ -55,32 +59,100 @@ class Endpoint(aio.Resource):
     def info(self) -> common.EndpointInfo:
         return self._info
 
-    async def ping(self, remote_host: str):
+    async def ping(self, remote_host: str) -> float:
+        """Send echo request and wait for echo reply
+
+        Returns round-trip time in seconds.
+
+        """
         if not self.is_open:
             raise ConnectionError()
 
         remote_addr = await _get_host_addr(self._loop, remote_host)
 
+        return await self._ping(remote_addr)
+
+    async def sweep(self,
+                    remote_hosts: typing.Iterable[str],
+                    *,
+                    count: int = 1,
+                    rate: float = 100,
+                    timeout: float = 1
+                    ) -> list[common.PingStats]:
+        """Ping multiple remote hosts
+
+        Each remote host is resolved only once. Echo requests are sent to
+        all remote hosts `count` times, with at most `rate` echo requests
+        per second. Echo request which is not replied in `timeout` seconds
+        is considered lost.
+
+        Resulting statistics are ordered as `remote_hosts`.
+
+        """
         if not self.is_open:
             raise ConnectionError()
 
+        remote_hosts = list(remote_hosts)
+        unique_remote_hosts = list(dict.fromkeys(remote_hosts))
+        remote_addrs = dict(zip(
+            unique_remote_hosts,
+            await asyncio.gather(*(_get_host_addr(self._loop, i)
+                                   for i in unique_remote_hosts))))
+
+        rtts = [[None] * count for _ in remote_hosts]
+        interval = 1 / rate
+        next_send_time = self._loop.time()
+
+        async def ping(i, j, remote_addr):
+            try:
+                rtts[i][j] = await aio.wait_for(self._ping(remote_addr),
+                                                timeout)
+
+            except asyncio.TimeoutError:
+                pass
+
+        async with self.async_group.create_subgroup() as subgroup:
+            tasks = collections.deque()
+
+            for j in range(count):
+                for i, remote_host in enumerate(remote_hosts):
+                    delay = next_send_time - self._loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                    next_send_time += interval
+                    tasks.append(subgroup.spawn(ping, i, j,
+                                                remote_addrs[remote_host]))
+
+            await asyncio.gather(*tasks)
+
+        return [_get_ping_stats(remote_host, i)
+                for remote_host, i in zip(remote_hosts, rtts)]
+
+    async def _ping(self, remote_addr):
+        if not self.is_open:
+            raise ConnectionError()
+
+        sequence_number = self._get_next_sequence_number()
         data = next(self._echo_data)
 
         # on linux, echo message identifier is chaged to
         # `self._socket.getsockname()[1]`
         req = common.EchoMsg(is_reply=False,
                              identifier=1,
-                             sequence_number=1,
+                             sequence_number=sequence_number,
                              data=data)
         req_bytes = encoder.encode_msg(req)
 
         future = self._loop.create_future()
 
         try:
-            self._echo_futures[data] = future
+            self._echo_requests[sequence_number] = data, future
 
             self._comm_log.log(common.CommLogAction.SEND, req)
 
+            send_time = time.monotonic()
+
             if sys.version_info[:2] >= (3, 11):
                 await self._loop.sock_sendto(self._socket, req_bytes,
                                              remote_addr)
@@ -88,15 +160,25 @@ class Endpoint(aio.Resource):
             else:
                 self._socket.sendto(req_bytes, remote_addr)
 
-            await future
+            receive_time = await future
+            return receive_time - send_time
 
         finally:
-            self._echo_futures.pop(data)
+            self._echo_requests.pop(sequence_number)
+
+    def _get_next_sequence_number(self):
+        for _ in range(0xffff):
+            sequence_number = next(self._sequence_numbers)
+            if sequence_number not in self._echo_requests:
+                return sequence_number
+
+        raise Exception('no available sequence number')
 
     async def _receive_loop(self):
         try:
             while True:
                 msg_bytes = await self._loop.sock_recv(self._socket, 1024)
+                receive_time = time.monotonic()
 
                 try:
                     msg = encoder.decode_msg(memoryview(msg_bytes))
@@ -109,7 +191,7 @@ class Endpoint(aio.Resource):
                 self._comm_log.log(common.CommLogAction.RECEIVE, msg)
 
                 if isinstance(msg, common.EchoMsg):
-                    self._process_echo_msg(msg)
+                    self._process_echo_msg(msg, receive_time)
 
         except Exception as e:
             self._log.error("receive loop error: %s", e, exc_info=e)
@@ -117,25 +199,26 @@ class Endpoint(aio.Resource):
         finally:
             self.close()
 
-            for future in self._echo_futures.values():
+            for _, future in self._echo_requests.values():
                 if not future.done():
                     future.set_exception(ConnectionError())
 
             self._socket.close()
 
-    def _process_echo_msg(self, msg):
+    def _process_echo_msg(self, msg, receive_time):
         if not msg.is_reply:
             return
 
-        # TODO check identifier and sequence number
-
-        data = bytes(msg.data)
+        # identifier is not checked because it can be changed by the os
+        req = self._echo_requests.get(msg.sequence_number)
+        if not req:
+            return
 
-        future = self._echo_futures.get(data)
-        if not future or future.done():
+        data, future = req
+        if future.done() or data != msg.data:
             return
 
-        future.set_result(None)
+        future.set_result(receive_time)
 
 
 def _create_socket(local_addr):
@@ -165,6 +248,31 @@ async def _get_host_addr(loop, host):
     return infos[0][4]
 
 
+def _get_ping_stats(remote_host, rtts):
+    received = [i for i in rtts if i is not None]
+
+    if not received:
+        return common.PingStats(remote_host=remote_host,
+                                sent=len(rtts),
+                                received=0,
+                                rtt_min=None,
+                                rtt_avg=None,
+                                rtt_max=None,
+                                rtt_jitter=None)
+
+    rtt_jitter = (sum(abs(i - j) for i, j in zip(received, received[1:])) /
+                  (len(received) - 1)
+                  if len(received) > 1 else None)
+
+    return common.PingStats(remote_host=remote_host,
+                            sent=len(rtts),
+                            received=len(received),
+                            rtt_min=min(received),
+                            rtt_avg=sum(received) / len(received),
+                            rtt_max=max(received),
+                            rtt_jitter=rtt_jitter)
+
+
 def _echo_data_iter():
     prefix = uuid.uuid1().bytes
 
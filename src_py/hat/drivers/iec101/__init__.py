@@ -95,7 +95,8 @@ from hat.drivers.iec101.common import (AsduTypeError,
                                        ParameterActivationMsg,
                                        Msg,
                                        time_from_datetime,
-                                       time_to_datetime)
+                                       time_to_datetime,
+                                       times_to_timestamps)
 from hat.drivers.iec101.connection import Connection
 
 
@@ -195,4 +196,5 @@ __all__ = ['AsduTypeError',
            'Msg',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'Connection']
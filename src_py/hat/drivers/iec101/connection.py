@@ -39,14 +39,43 @@ class Connection(aio.Resource):
 
     async def send(self,
                    msgs: list[common.Msg],
-                   sent_cb: aio.AsyncCallable[[], None] | None = None):
+                   sent_cb: aio.AsyncCallable[[], None] | None = None,
+                   *,
+                   data_class: link.DataClass | None = None):
+        """Send messages
+
+        `data_class` is supported only by unbalanced slave connections.
+        Buffered class 2 data messages are replaced by newer data messages
+        with the same ASDU and IO address.
+
+        """
         self._comm_log.log(common.CommLogAction.SEND, msgs)
 
-        data = collections.deque(self._encoder.encode(msgs))
+        if data_class is None:
+            data = collections.deque(self._encoder.encode(msgs))
+
+            while data:
+                i = data.popleft()
+                await self._conn.send(i, sent_cb=None if data else sent_cb)
+
+            return
+
+        msgs = collections.deque(msgs)
 
-        while data:
-            i = data.popleft()
-            await self._conn.send(i, sent_cb=None if data else sent_cb)
+        while msgs:
+            msg = msgs.popleft()
+            key = (_get_class2_key(msg)
+                   if data_class == link.DataClass.CLASS_2 else None)
+
+            data = collections.deque(self._encoder.encode([msg]))
+
+            while data:
+                i = data.popleft()
+                await self._conn.send(
+                    i,
+                    sent_cb=None if data or msgs else sent_cb,
+                    data_class=data_class,
+                    key=key)
 
     async def receive(self) -> list[common.Msg]:
         data = await self._conn.receive()
@@ -55,3 +84,8 @@ class Connection(aio.Resource):
         self._comm_log.log(common.CommLogAction.RECEIVE, msgs)
 
         return msgs
+
+
+def _get_class2_key(msg):
+    if isinstance(msg, common.DataMsg):
+        return msg.asdu_address, msg.io_address
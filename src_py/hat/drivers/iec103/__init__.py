@@ -2,6 +2,7 @@
 
 from hat.drivers.iec103.common import (Description,
                                        IoAddress,
+                                       Channel,
                                        Identification,
                                        TimeSize,
                                        Time,
@@ -38,8 +39,15 @@ from hat.drivers.iec103.common import (Description,
                                        MeasurandValues,
                                        Data,
                                        GenericData,
+                                       Disturbance,
+                                       DisturbanceRecord,
+                                       DisturbanceTags,
+                                       DisturbanceChannel,
+                                       DisturbanceValues,
+                                       DisturbanceData,
                                        time_from_datetime,
-                                       time_to_datetime)
+                                       time_to_datetime,
+                                       times_to_timestamps)
 from hat.drivers.iec103.master import (DataCb,
                                        GenericDataCb,
                                        MasterConnection)
@@ -47,6 +55,7 @@ from hat.drivers.iec103.master import (DataCb,
 
 __all__ = ['Description',
            'IoAddress',
+           'Channel',
            'Identification',
            'TimeSize',
            'Time',
@@ -83,8 +92,15 @@ __all__ = ['Description',
            'MeasurandValues',
            'Data',
            'GenericData',
+           'Disturbance',
+           'DisturbanceRecord',
+           'DisturbanceTags',
+           'DisturbanceChannel',
+           'DisturbanceValues',
+           'DisturbanceData',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'DataCb',
            'GenericDataCb',
            'MasterConnection']
@@ -12,6 +12,7 @@ AsduAddress: typing.TypeAlias = iec103.AsduAddress
 OtherCause: typing.TypeAlias = iec103.OtherCause
 Description: typing.TypeAlias = iec103.Description
 IoAddress: typing.TypeAlias = iec103.IoAddress
+Channel: typing.TypeAlias = iec103.Channel
 Identification: typing.TypeAlias = iec103.Identification
 TimeSize: typing.TypeAlias = iec103.TimeSize
 Time: typing.TypeAlias = iec103.Time
@@ -106,5 +107,59 @@ class GenericData(typing.NamedTuple):
     value: ArrayValue
 
 
+class Disturbance(typing.NamedTuple):
+    fault_number: int
+    """fault_number in range [0, 65535]"""
+    trip: bool
+    transmitted: bool
+    test: bool
+    other: bool
+    time: Time
+    """time size is SEVEN"""
+
+
+class DisturbanceRecord(typing.NamedTuple):
+    fault_number: int
+    """fault_number in range [0, 65535]"""
+    number_of_faults: int
+    """number_of_faults in range [0, 65535]"""
+    number_of_channels: int
+    """number_of_channels in range [0, 255]"""
+    number_of_elements: int
+    """number_of_elements in range [1, 65535]"""
+    interval: int
+    """interval in microseconds in range [1, 65535]"""
+    time: Time
+    """time size is FOUR"""
+
+
+class DisturbanceTags(typing.NamedTuple):
+    tag_position: int
+    """tag_position in range [0, 65535]"""
+    values: list[tuple[IoAddress, DoubleValue]]
+
+
+class DisturbanceChannel(typing.NamedTuple):
+    channel: Channel
+    primary: float
+    secondary: float
+    reference: float
+
+
+class DisturbanceValues(typing.NamedTuple):
+    channel: Channel
+    element_number: int
+    """element_number in range [0, 65535]"""
+    values: list[float]
+    """values are in range [-1.0, 1.0)"""
+
+
+DisturbanceData: typing.TypeAlias = (DisturbanceRecord |
+                                     DisturbanceTags |
+                                     DisturbanceChannel |
+                                     DisturbanceValues)
+
+
 time_from_datetime = iec103.time_from_datetime
 time_to_datetime = iec103.time_to_datetime
+times_to_timestamps = iec103.times_to_timestamps
@@ -49,6 +49,14 @@ class MasterConnection(aio.Resource):
         self._interrogate_generic_req_id = None
         self._interrogate_generic_future = None
 
+        self._get_disturbances_lock = asyncio.Lock()
+        self._get_disturbances_asdu_address = None
+        self._get_disturbances_future = None
+
+        self._read_disturbance_lock = asyncio.Lock()
+        self._read_disturbance_asdu_address = None
+        self._read_disturbance_queue = None
+
         self._next_req_ids = (i % 0x100 for i in itertools.count(0))
 
         self._process_single_element_fns = {
@@ -203,6 +211,202 @@ class MasterConnection(aio.Resource):
                 self._interrogate_generic_req_id = None
                 self._interrogate_generic_future = None
 
+    async def get_disturbances(self,
+                               asdu_address: common.AsduAddress,
+                               function_type: int
+                               ) -> list[common.Disturbance]:
+        """Get list of recorded disturbances"""
+        async with self._get_disturbances_lock:
+            if not self.is_open:
+                raise ConnectionError()
+
+            try:
+                self._get_disturbances_asdu_address = asdu_address
+                self._get_disturbances_future = asyncio.Future()
+                await self._send_disturbance_order(
+                    asdu_address=asdu_address,
+                    function_type=function_type,
+                    order_type=iec103.OrderType.REQUEST_FOR_LIST_OF_RECORDED_DISTURBANCES,  # NOQA
+                    fault_number=0,
+                    channel=common.Channel.GLOBAL)
+                return await self._get_disturbances_future
+
+            finally:
+                self._get_disturbances_asdu_address = None
+                self._get_disturbances_future = None
+
+    async def read_disturbance(self,
+                               asdu_address: common.AsduAddress,
+                               function_type: int,
+                               fault_number: int
+                               ) -> typing.AsyncIterator[common.DisturbanceData]:  # NOQA
+        """Read disturbance data
+
+        Disturbance data is transferred from protection equipment and
+        provided as it is received: `common.DisturbanceRecord` is always
+        provided first, followed by `common.DisturbanceTags` and, for each
+        channel, `common.DisturbanceChannel` with associated
+        `common.DisturbanceValues`.
+
+        Values are not accumulated - if needed, consumer is responsible
+        for storing values provided with `common.DisturbanceValues`.
+
+        If iteration is stopped before transfer is completed, abortion of
+        disturbance data transmission is requested.
+
+        """
+        async with self._read_disturbance_lock:
+            if not self.is_open:
+                raise ConnectionError()
+
+            queue = aio.Queue()
+
+            async def send_order(order_type, channel=common.Channel.GLOBAL):
+                await self._send_disturbance_order(
+                    asdu_address=asdu_address,
+                    function_type=function_type,
+                    order_type=order_type,
+                    fault_number=fault_number,
+                    channel=channel)
+
+            async def send_ack(order_type, channel=common.Channel.GLOBAL):
+                await self._send_disturbance_ack(
+                    asdu_address=asdu_address,
+                    function_type=function_type,
+                    order_type=order_type,
+                    fault_number=fault_number,
+                    channel=channel)
+
+            async def get_element():
+                while True:
+                    try:
+                        element = await queue.get()
+
+                    except aio.QueueClosedError:
+                        raise ConnectionError()
+
+                    if element.fault_number == fault_number:
+                        return element
+
+            try:
+                self._read_disturbance_asdu_address = asdu_address
+                self._read_disturbance_queue = queue
+
+                await send_order(iec103.OrderType.SELECTION_OF_FAULT)
+
+                element = await get_element()
+                if not isinstance(element, iec103.IoElement_READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA):  # NOQA
+                    raise Exception('unexpected disturbance data element')
+
+                yield common.DisturbanceRecord(
+                    fault_number=element.fault_number,
+                    number_of_faults=element.number_of_faults,
+                    number_of_channels=element.number_of_channels,
+                    number_of_elements=element.number_of_elements,
+                    interval=element.interval,
+                    time=element.time)
+
+                await send_order(iec103.OrderType.REQUEST_FOR_DISTURBANCE_DATA)
+
+                while True:
+                    element = await get_element()
+
+                    if isinstance(element, iec103.IoElement_READY_FOR_TRANSMISSION_OF_TAGS):  # NOQA
+                        await send_order(iec103.OrderType.REQUEST_FOR_TAGS)
+
+                    elif isinstance(element, iec103.IoElement_TRANSMISSION_OF_TAGS):  # NOQA
+                        yield common.DisturbanceTags(
+                            tag_position=element.tag_position,
+                            values=element.values)
+
+                    elif isinstance(element, iec103.IoElement_READY_FOR_TRANSMISSION_OF_A_CHANNEL):  # NOQA
+                        yield common.DisturbanceChannel(
+                            channel=element.channel,
+                            primary=element.primary.value,
+                            secondary=element.secondary.value,
+                            reference=element.reference.value)
+
+                        await send_order(iec103.OrderType.REQUEST_FOR_CHANNEL,
+                                         element.channel)
+
+                    elif isinstance(element, iec103.IoElement_TRANSMISSION_OF_DISTURBANCE_VALUES):  # NOQA
+                        yield common.DisturbanceValues(
+                            channel=element.channel,
+                            element_number=element.element_number,
+                            values=element.values)
+
+                    elif isinstance(element, iec103.IoElement_END_OF_TRANSMISSION):  # NOQA
+                        order_type = element.order_type
+
+                        if order_type == iec103.OrderType.END_OF_TAG_TRANSMISSION_WITHOUT_ABORTION:  # NOQA
+                            await send_ack(
+                                iec103.OrderType.TAGS_TRANSMITTED_SUCCESSFULLY)
+
+                        elif order_type == iec103.OrderType.END_OF_CHANNEL_TRANSMISSION_WITHOUT_ABORTION:  # NOQA
+                            await send_ack(
+                                iec103.OrderType.CHANNEL_TRANSMITTED_SUCCESSFULLY,  # NOQA
+                                element.channel)
+
+                        elif order_type == iec103.OrderType.END_OF_DISTURBANCE_DATA_TRANSMISSION_WITHOUT_ABORTION:  # NOQA
+                            await send_ack(
+                                iec103.OrderType.DISTURBANCE_DATA_TRANSMITTED_SUCCESSFULLY)  # NOQA
+                            break
+
+                        else:
+                            raise Exception(f'transmission aborted '
+                                            f'({order_type.name})')
+
+            except GeneratorExit:
+                if self.is_open:
+                    await send_order(
+                        iec103.OrderType.ABORTION_OF_DISTURBANCE_DATA)
+
+                raise
+
+            finally:
+                self._read_disturbance_asdu_address = None
+                self._read_disturbance_queue = None
+
+    async def _send_disturbance_order(self, asdu_address, function_type,
+                                      order_type, fault_number, channel):
+        asdu = iec103.ASDU(
+            type=iec103.AsduType.ORDER_FOR_DISTURBANCE_DATA_TRANSMISSION,
+            cause=iec103.Cause.TRANSMISSION_OF_DISTURBANCE_DATA,
+            address=asdu_address,
+            ios=[iec103.IO(
+                address=iec103.IoAddress(function_type=function_type,
+                                         information_number=0),
+                elements=[iec103.IoElement_ORDER_FOR_DISTURBANCE_DATA_TRANSMISSION(  # NOQA
+                    order_type=order_type,
+                    fault_number=fault_number,
+                    channel=channel)])])
+
+        data = self._encoder.encode_asdu(asdu)
+
+        self._comm_log.log(common.CommLogAction.SEND, asdu)
+
+        await self._conn.send(data)
+
+    async def _send_disturbance_ack(self, asdu_address, function_type,
+                                    order_type, fault_number, channel):
+        asdu = iec103.ASDU(
+            type=iec103.AsduType.ACKNOWLEDGEMENT_FOR_DISTURBANCE_DATA_TRANSMISSION,  # NOQA
+            cause=iec103.Cause.TRANSMISSION_OF_DISTURBANCE_DATA,
+            address=asdu_address,
+            ios=[iec103.IO(
+                address=iec103.IoAddress(function_type=function_type,
+                                         information_number=0),
+                elements=[iec103.IoElement_ACKNOWLEDGEMENT_FOR_DISTURBANCE_DATA_TRANSMISSION(  # NOQA
+                    order_type=order_type,
+                    fault_number=fault_number,
+                    channel=channel)])])
+
+        data = self._encoder.encode_asdu(asdu)
+
+        self._comm_log.log(common.CommLogAction.SEND, asdu)
+
+        await self._conn.send(data)
+
     async def _receive_loop(self):
         try:
             while True:
@@ -240,6 +444,11 @@ class MasterConnection(aio.Resource):
             _try_set_exception(self._send_command_future, ConnectionError())
             _try_set_exception(self._interrogate_generic_future,
                                ConnectionError())
+            _try_set_exception(self._get_disturbances_future,
+                               ConnectionError())
+
+            if self._read_disturbance_queue is not None:
+                self._read_disturbance_queue.close()
 
     async def _process_TIME_TAGGED_MESSAGE(self, cause, asdu_address, io_address, element):  # NOQA
         if cause == iec103.Cause.GENERAL_COMMAND:
@@ -333,25 +542,44 @@ class MasterConnection(aio.Resource):
         pass
 
     async def _process_LIST_OF_RECORDED_DISTURBANCES(self, cause, asdu_address, io_address, elements):  # NOQA
-        pass
+        if asdu_address != self._get_disturbances_asdu_address:
+            return
+
+        _try_set_result(self._get_disturbances_future, [
+            common.Disturbance(fault_number=element.fault_number,
+                               trip=element.trip,
+                               transmitted=element.transmitted,
+                               test=element.test,
+                               other=element.other,
+                               time=element.time)
+            for element in elements])
 
     async def _process_READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
 
     async def _process_READY_FOR_TRANSMISSION_OF_A_CHANNEL(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
 
     async def _process_READY_FOR_TRANSMISSION_OF_TAGS(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
 
     async def _process_TRANSMISSION_OF_TAGS(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
 
     async def _process_TRANSMISSION_OF_DISTURBANCE_VALUES(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
 
     async def _process_END_OF_TRANSMISSION(self, cause, asdu_address, io_address, element):  # NOQA
-        pass
+        self._process_disturbance_element(asdu_address, element)
+
+    def _process_disturbance_element(self, asdu_address, element):
+        if asdu_address != self._read_disturbance_asdu_address:
+            return
+
+        if self._read_disturbance_queue is None:
+            return
+
+        self._read_disturbance_queue.put_nowait(element)
 
 
 class _FunctionType(enum.Enum):
@@ -89,11 +89,14 @@ from hat.drivers.iec104.common import (AsduTypeError,
                                        ParameterActivationMsg,
                                        Msg,
                                        time_from_datetime,
-                                       time_to_datetime)
+                                       time_to_datetime,
+                                       times_to_timestamps)
 from hat.drivers.iec104.connection import (ConnectionCb,
                                            connect,
                                            listen,
-                                           Connection)
+                                           Connection,
+                                           create_broadcaster,
+                                           Broadcaster)
 
 
 __all__ = ['AsduTypeError',
@@ -186,7 +189,10 @@ __all__ = ['AsduTypeError',
            'Msg',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'ConnectionCb',
            'connect',
            'listen',
-           'Connection']
+           'Connection',
+           'create_broadcaster',
+           'Broadcaster']
@@ -152,3 +152,4 @@ Msg: typing.TypeAlias = (DataMsg |
 
 time_from_datetime = iec101.time_from_datetime
 time_to_datetime = iec101.time_to_datetime
+times_to_timestamps = iec101.times_to_timestamps
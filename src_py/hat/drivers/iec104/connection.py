@@ -25,6 +25,7 @@ async def connect(addr: tcp.Address,
                   test_timeout: float = 20,
                   send_window_size: int = 12,
                   receive_window_size: int = 8,
+                  coalesce_spontaneous_data: bool = False,
                   **kwargs
                   ) -> 'Connection':
     conn = await apci.connect(addr=addr,
@@ -35,7 +36,8 @@ async def connect(addr: tcp.Address,
                               receive_window_size=receive_window_size,
                               **kwargs)
 
-    return Connection(conn)
+    return Connection(conn,
+                      coalesce_spontaneous_data=coalesce_spontaneous_data)
 
 
 async def listen(connection_cb: ConnectionCb,
@@ -46,6 +48,7 @@ async def listen(connection_cb: ConnectionCb,
                  test_timeout: float = 20,
                  send_window_size: int = 12,
                  receive_window_size: int = 8,
+                 coalesce_spontaneous_data: bool = False,
                  **kwargs
                  ) -> tcp.Server:
     log = logger.create_server_logger(mlog, kwargs.get('name'), None)
@@ -53,7 +56,8 @@ async def listen(connection_cb: ConnectionCb,
     async def on_connection(conn):
         try:
             try:
-                conn = Connection(conn)
+                conn = Connection(
+                    conn, coalesce_spontaneous_data=coalesce_spontaneous_data)
                 await aio.call(connection_cb, conn)
 
             except BaseException:
@@ -78,9 +82,20 @@ async def listen(connection_cb: ConnectionCb,
 
 
 class Connection(aio.Resource):
+    """Connection
 
-    def __init__(self, conn: apci.Connection):
+    If `coalesce_spontaneous_data` is set, spontaneous data messages which
+    are still waiting in send queue are replaced with newer data messages
+    with the same ASDU address and IO address. Single and double point
+    data with time tags are never coalesced.
+
+    """
+
+    def __init__(self,
+                 conn: apci.Connection,
+                 coalesce_spontaneous_data: bool = False):
         self._conn = conn
+        self._coalesce_spontaneous_data = coalesce_spontaneous_data
         self._encoder = encoder.Encoder()
         self._comm_log = logger.CommunicationLogger(mlog, conn.info)
 
@@ -105,16 +120,16 @@ class Connection(aio.Resource):
                             ) -> util.RegisterCallbackHandle:
         return self._conn.register_enabled_cb(cb)
 
+    @property
+    def send_queue_stats(self) -> apci.SendQueueStats:
+        return self._conn.send_queue_stats
+
     async def send(self,
                    msgs: typing.List[common.Msg],
                    wait_ack: bool = False):
-        self._comm_log.log(common.CommLogAction.SEND, msgs)
-
-        data = collections.deque(self._encoder.encode(msgs))
-        while data:
-            head = data.popleft()
-            head_wait_ack = False if data else wait_ack
-            await self._conn.send(head, head_wait_ack)
+        data = _encode_msgs(self._encoder, msgs,
+                            self._coalesce_spontaneous_data)
+        await self._send(msgs, data, wait_ack)
 
     async def drain(self, wait_ack: bool = False):
         await self._conn.drain(wait_ack)
@@ -126,3 +141,124 @@ class Connection(aio.Resource):
         self._comm_log.log(common.CommLogAction.RECEIVE, msgs)
 
         return msgs
+
+    async def _send(self, msgs, data, wait_ack):
+        self._comm_log.log(common.CommLogAction.SEND, msgs)
+
+        data = collections.deque(data)
+        while data:
+            head, key = data.popleft()
+            head_wait_ack = False if data else wait_ack
+            await self._conn.send(head, head_wait_ack, key=key)
+
+
+async def create_broadcaster(addr: tcp.Address = tcp.Address('0.0.0.0', 2404),
+                             *,
+                             connection_cb: ConnectionCb | None = None,
+                             max_lag: int = 512,
+                             coalesce_spontaneous_data: bool = False,
+                             **kwargs
+                             ) -> 'Broadcaster':
+    """Create broadcaster
+
+    Broadcaster listens for incoming connections and sends the same
+    messages to all enabled connections, encoding them only once.
+
+    Connection with more than `max_lag` ASDUs waiting in its send queue is
+    considered lagging and is closed, so that master can reconnect and
+    interrogate current state. `max_lag` should be smaller than
+    `send_queue_size`, so broadcasting never blocks on slow connection.
+
+    Additional arguments are passed directly to `listen`.
+
+    """
+    broadcaster = Broadcaster()
+    broadcaster._connection_cb = connection_cb
+    broadcaster._max_lag = max_lag
+    broadcaster._coalesce_spontaneous_data = coalesce_spontaneous_data
+    broadcaster._encoder = encoder.Encoder()
+    broadcaster._conns = []
+
+    broadcaster._server = await listen(
+        broadcaster._on_connection, addr,
+        coalesce_spontaneous_data=coalesce_spontaneous_data,
+        **kwargs)
+
+    broadcaster._log = logger.create_server_logger(
+        mlog, broadcaster._server.info.name, broadcaster._server.info)
+
+    return broadcaster
+
+
+class Broadcaster(aio.Resource):
+    """Broadcaster
+
+    For creating new Broadcaster instances see `create_broadcaster`
+    coroutine.
+
+    """
+
+    @property
+    def async_group(self) -> aio.Group:
+        return self._server.async_group
+
+    @property
+    def info(self) -> tcp.ServerInfo:
+        return self._server.info
+
+    @property
+    def connections(self) -> list[Connection]:
+        return list(self._conns)
+
+    async def broadcast(self, msgs: list[common.Msg]):
+        """Send messages to all enabled connections"""
+        conns = [conn for conn in self._conns
+                 if conn.is_open and conn.is_enabled]
+        if not conns:
+            return
+
+        data = _encode_msgs(self._encoder, msgs,
+                            self._coalesce_spontaneous_data)
+
+        for conn in conns:
+            if conn.send_queue_stats.queued + len(data) > self._max_lag:
+                self._log.warning("connection %s lagging - closing connection",
+                                  conn.info.remote_addr)
+                conn.close()
+                continue
+
+            try:
+                await conn._send(msgs, data, False)
+
+            except ConnectionError:
+                pass
+
+    async def _on_connection(self, conn):
+        self._conns.append(conn)
+        conn.async_group.spawn(aio.call_on_cancel, self._conns.remove, conn)
+
+        if self._connection_cb:
+            await aio.call(self._connection_cb, conn)
+
+
+def _encode_msgs(msgs_encoder, msgs, coalesce_spontaneous_data):
+    if coalesce_spontaneous_data:
+        return [(data, _get_coalesce_key(msg))
+                for msg in msgs
+                for data in msgs_encoder.encode([msg])]
+
+    return [(data, None) for data in msgs_encoder.encode(msgs)]
+
+
+def _get_coalesce_key(msg):
+    if not isinstance(msg, common.DataMsg):
+        return
+
+    if msg.cause != common.DataResCause.SPONTANEOUS:
+        return
+
+    if (msg.time is not None and
+            isinstance(msg.data, (common.SingleData, common.DoubleData))):
+        return
+
+    return msg.asdu_address, msg.io_address
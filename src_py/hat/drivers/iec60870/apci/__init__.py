@@ -1,6 +1,7 @@
 """IEC 60870-5 APCI layer"""
 
-from hat.drivers.iec60870.apci.common import SequenceNumber
+from hat.drivers.iec60870.apci.common import (SequenceNumber,
+                                              SendQueueStats)
 from hat.drivers.iec60870.apci.connection import (ConnectionCb,
                                                   ConnectionDisabledError,
                                                   connect,
@@ -9,6 +10,7 @@ from hat.drivers.iec60870.apci.connection import (ConnectionCb,
 
 
 __all__ = ['SequenceNumber',
+           'SendQueueStats',
            'ConnectionCb',
            'ConnectionDisabledError',
            'connect',
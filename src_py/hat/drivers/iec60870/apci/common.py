@@ -34,3 +34,12 @@ class APDUU(typing.NamedTuple):
 
 
 APDU: typing.TypeAlias = APDUI | APDUS | APDUU
+
+
+class SendQueueStats(typing.NamedTuple):
+    queued: int
+    """number of entries waiting in send queue"""
+    waiting_ack: int
+    """number of sent APDUs waiting for acknowledgement"""
+    coalesced: int
+    """number of queued data replaced with newer data before sending"""
@@ -165,6 +165,8 @@ class Connection(aio.Resource):
         self._receive_window_size = receive_window_size
         self._receive_queue = aio.Queue(receive_queue_size)
         self._send_queue = aio.Queue(send_queue_size)
+        self._send_queue_keys = {}
+        self._coalesced_count = 0
         self._test_event = asyncio.Event()
         self._ssn = 0
         self._rsn = 0
@@ -206,18 +208,47 @@ class Connection(aio.Resource):
         """Register enable callback"""
         return self._enabled_cbs.register(cb)
 
+    @property
+    def send_queue_stats(self) -> common.SendQueueStats:
+        """Send queue statistics"""
+        return common.SendQueueStats(
+            queued=self._send_queue.qsize(),
+            waiting_ack=len(self._waiting_ack_handles),
+            coalesced=self._coalesced_count)
+
     async def send(self,
                    data: util.Bytes,
-                   wait_ack: bool = False):
+                   wait_ack: bool = False,
+                   *,
+                   key: typing.Hashable | None = None):
         """Send data and optionally wait for acknowledgement
 
+        If `key` is not ``None`` and data queued with the same `key` is
+        still waiting in send queue, queued data is replaced with `data`
+        (retaining its position in queue). Data sent with `wait_ack` is
+        never replaced.
+
         Raises:
             ConnectionDisabledError
             ConnectionError
 
         """
+        if wait_ack:
+            key = None
+
+        if key is not None and key in self._send_queue_keys:
+            if self._send_queue.is_closed:
+                raise ConnectionError()
+
+            self._send_queue_keys[key] = data
+            self._coalesced_count += 1
+            return
+
         future = self._loop.create_future() if wait_ack else None
-        entry = _SendQueueEntry(data, future, wait_ack)
+        entry = _SendQueueEntry(data, future, wait_ack, key)
+
+        if key is not None:
+            self._send_queue_keys[key] = data
 
         try:
             await self._send_queue.put(entry)
@@ -228,6 +259,10 @@ class Connection(aio.Resource):
         except aio.QueueClosedError:
             raise ConnectionError()
 
+        finally:
+            if key is not None and self._send_queue.is_closed:
+                self._send_queue_keys.pop(key, None)
+
     async def drain(self, wait_ack: bool = False):
         """Drain and optionally wait for acknowledgement
 
@@ -312,7 +347,9 @@ class Connection(aio.Resource):
                     handle = self._waiting_ack_handles.get(ssn)
 
                 else:
-                    handle = await self._write_apdui(entry.data)
+                    data = (self._send_queue_keys.pop(entry.key, entry.data)
+                            if entry.key is not None else entry.data)
+                    handle = await self._write_apdui(data)
                     if not handle and entry.future and not entry.future.done():
                         entry.future.set_exception(ConnectionDisabledError())
 
@@ -489,6 +526,7 @@ class _SendQueueEntry(typing.NamedTuple):
     data: util.Bytes | None
     future: asyncio.Future | None
     wait_ack: bool
+    key: typing.Hashable | None = None
 
 
 async def _wait_startdt_con(transport):
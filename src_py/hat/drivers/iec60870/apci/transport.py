@@ -1,3 +1,4 @@
+import collections
 import logging
 
 from hat import aio
@@ -16,6 +17,7 @@ class Transport(aio.Resource):
 
     def __init__(self, conn: tcp.Connection):
         self._conn = conn
+        self._frames = collections.deque()
         self._comm_log = logger.CommunicationLogger(mlog, conn.info)
 
         self.async_group.spawn(aio.call_on_cancel, self._comm_log.log,
@@ -38,15 +40,11 @@ class Transport(aio.Resource):
         await self._conn.drain()
 
     async def read(self) -> common.APDU:
-        data = bytearray()
+        if not self._frames:
+            self._frames.extend(
+                await self._conn.read_frames(encoder.get_next_apdu_size))
 
-        while True:
-            size = encoder.get_next_apdu_size(data)
-            if size <= len(data):
-                break
-            data.extend(await self._conn.readexactly(size - len(data)))
-
-        apdu = encoder.decode(memoryview(data))
+        apdu = encoder.decode(self._frames.popleft())
 
         self._comm_log.log(common.CommLogAction.RECEIVE, apdu)
 
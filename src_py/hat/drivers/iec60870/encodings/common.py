@@ -1,5 +1,6 @@
 import datetime
 import enum
+import functools
 import time
 import typing
 
@@ -75,24 +76,12 @@ def time_from_datetime(dt: datetime.datetime,
     """Create Time from datetime.datetime"""
     # TODO document edge cases (local time, os implementation, ...)
     #  rounding microseconds to the nearest millisecond
-    dt_rounded = (
-        dt.replace(microsecond=0) +
-        datetime.timedelta(milliseconds=round(dt.microsecond / 1000)))
-    local_time = time.localtime(dt_rounded.timestamp())
-
-    return Time(
-        size=TimeSize.SEVEN,
-        milliseconds=(local_time.tm_sec * 1000 +
-                      dt_rounded.microsecond // 1000),
-        invalid=invalid,
-        substituted=substituted,
-        minutes=local_time.tm_min,
-        summer_time=bool(local_time.tm_isdst),
-        hours=local_time.tm_hour,
-        day_of_week=local_time.tm_wday + 1,
-        day_of_month=local_time.tm_mday,
-        months=local_time.tm_mon,
-        years=local_time.tm_year % 100)
+    timestamp_ms = (int(dt.replace(microsecond=0).timestamp()) * 1000 +
+                    round(dt.microsecond / 1000))
+    timestamp_minutes, milliseconds = divmod(timestamp_ms, 60_000)
+
+    return Time(TimeSize.SEVEN, milliseconds, invalid, substituted,
+                *_get_local_minute_fields(timestamp_minutes))
 
 
 def time_to_datetime(t: Time
@@ -136,17 +125,76 @@ def time_to_datetime(t: Time
                 local_dt = local_dt + datetime.timedelta(hours=1)
 
     elif t.size == TimeSize.SEVEN:
-        local_dt = datetime.datetime(
-            year=2000 + t.years if t.years < 70 else 1900 + t.years,
-            month=t.months,
-            day=t.day_of_month,
-            hour=t.hours,
-            minute=t.minutes,
-            second=int(t.milliseconds / 1000),
-            microsecond=(t.milliseconds % 1000) * 1000,
-            fold=not t.summer_time)
+        return (_get_hour_datetime(t.years, t.months, t.day_of_month,
+                                   t.hours, t.summer_time) +
+                datetime.timedelta(minutes=t.minutes,
+                                   milliseconds=t.milliseconds))
 
     else:
         raise ValueError('unsupported time size')
 
     return local_dt.astimezone(tz=datetime.timezone.utc)
+
+
+def times_to_timestamps(times: typing.Iterable[Time],
+                        ns: bool = False
+                        ) -> list[float] | list[int]:
+    """Convert multiple Time values to POSIX timestamps
+
+    If `ns` is ``True``, timestamps are integer number of nanoseconds,
+    otherwise timestamps are float number of seconds.
+
+    Conversion of `TimeSize.SEVEN` times reuses local time conversion of
+    previously converted times with same date and hour.
+
+    """
+    timestamps_ns = [_time_to_timestamp_ns(t) for t in times]
+
+    if ns:
+        return timestamps_ns
+
+    return [i / 1e9 for i in timestamps_ns]
+
+
+def _time_to_timestamp_ns(t):
+    if t.size != TimeSize.SEVEN:
+        dt = time_to_datetime(t)
+        return (int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 +
+                dt.microsecond * 1_000)
+
+    hour_timestamp = _get_hour_timestamp(t.years, t.months, t.day_of_month,
+                                         t.hours, t.summer_time)
+
+    return ((hour_timestamp * 1000 + t.minutes * 60_000 + t.milliseconds) *
+            1_000_000)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_local_minute_fields(timestamp_minutes):
+    local_time = time.localtime(timestamp_minutes * 60)
+
+    return (local_time.tm_min,
+            bool(local_time.tm_isdst),
+            local_time.tm_hour,
+            local_time.tm_wday + 1,
+            local_time.tm_mday,
+            local_time.tm_mon,
+            local_time.tm_year % 100)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_hour_datetime(years, months, day_of_month, hours, summer_time):
+    local_dt = datetime.datetime(
+        year=2000 + years if years < 70 else 1900 + years,
+        month=months,
+        day=day_of_month,
+        hour=hours,
+        fold=not summer_time)
+
+    return local_dt.astimezone(tz=datetime.timezone.utc)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_hour_timestamp(years, months, day_of_month, hours, summer_time):
+    dt = _get_hour_datetime(years, months, day_of_month, hours, summer_time)
+    return int(dt.timestamp())
@@ -1,10 +1,18 @@
 import collections
+import functools
+import struct
 import typing
 
 from hat import util
 
 from hat.drivers.iec60870.encodings import common
 
+try:
+    from hat.drivers.iec60870.encodings import _encoder
+
+except ImportError:
+    _encoder = None
+
 
 AsduType: typing.TypeAlias = int
 AsduTypeTimeSizes: typing.TypeAlias = dict[AsduType, common.TimeSize]
@@ -18,53 +26,79 @@ EncodeIoElementCb: typing.TypeAlias = typing.Callable[[typing.Any, AsduType],
 def decode_time(time_bytes: util.Bytes,
                 time_size: common.TimeSize
                 ) -> common.Time:
-    milliseconds = (time_bytes[1] << 8) | time_bytes[0]
-    invalid = (bool(time_bytes[2] & 0x80) if time_size.value > 2 else None)
-    substituted = (bool(time_bytes[2] & 0x40) if time_size.value > 2 else None)
-    minutes = (time_bytes[2] & 0x3F if time_size.value > 2 else None)
-    summer_time = (bool(time_bytes[3] & 0x80) if time_size.value > 3 else None)
-    hours = (time_bytes[3] & 0x1F if time_size.value > 3 else None)
-    day_of_week = (time_bytes[4] >> 5 if time_size.value > 4 else None)
-    day_of_month = (time_bytes[4] & 0x1F if time_size.value > 4 else None)
-    months = (time_bytes[5] & 0x0F if time_size.value > 4 else None)
-    years = (time_bytes[6] & 0x7F if time_size.value > 4 else None)
-
-    return common.Time(size=time_size,
-                       milliseconds=milliseconds,
-                       invalid=invalid,
-                       substituted=substituted,
-                       minutes=minutes,
-                       summer_time=summer_time,
-                       hours=hours,
-                       day_of_week=day_of_week,
-                       day_of_month=day_of_month,
-                       months=months,
-                       years=years)
+    if time_size == common.TimeSize.SEVEN:
+        milliseconds, minutes_byte, upper = _time_seven_struct.unpack_from(
+            time_bytes)
+        return common.Time(time_size,
+                           milliseconds,
+                           bool(minutes_byte & 0x80),
+                           bool(minutes_byte & 0x40),
+                           minutes_byte & 0x3F,
+                           *_decode_time_upper(upper))
+
+    if time_size == common.TimeSize.FOUR:
+        milliseconds, minutes_byte, hours_byte = \
+            _time_four_struct.unpack_from(time_bytes)
+        return common.Time(time_size,
+                           milliseconds,
+                           bool(minutes_byte & 0x80),
+                           bool(minutes_byte & 0x40),
+                           minutes_byte & 0x3F,
+                           bool(hours_byte & 0x80),
+                           hours_byte & 0x1F,
+                           None, None, None, None)
+
+    if time_size == common.TimeSize.THREE:
+        milliseconds, minutes_byte = _time_three_struct.unpack_from(
+            time_bytes)
+        return common.Time(time_size,
+                           milliseconds,
+                           bool(minutes_byte & 0x80),
+                           bool(minutes_byte & 0x40),
+                           minutes_byte & 0x3F,
+                           None, None, None, None, None, None)
+
+    if time_size == common.TimeSize.TWO:
+        milliseconds, = _time_two_struct.unpack_from(time_bytes)
+        return common.Time(time_size,
+                           milliseconds,
+                           None, None, None, None, None, None, None, None,
+                           None)
+
+    raise ValueError('unsupported time size')
 
 
 def encode_time(time: common.Time,
                 time_size: common.TimeSize
-                ) -> typing.Iterable[int]:
+                ) -> util.Bytes:
     if time_size.value > time.size.value:
         raise ValueError('unsupported time size')
 
-    yield time.milliseconds & 0xFF
-    yield (time.milliseconds >> 8) & 0xFF
+    milliseconds = time.milliseconds & 0xFFFF
+
+    if time_size == common.TimeSize.TWO:
+        return _time_two_struct.pack(milliseconds)
+
+    minutes_byte = ((0x80 if time.invalid else 0) |
+                    (0x40 if time.substituted else 0) |
+                    (time.minutes & 0x3F))
 
-    if time_size.value > 2:
-        yield ((0x80 if time.invalid else 0) |
-               (0x40 if time.substituted else 0) |
-               (time.minutes & 0x3F))
+    if time_size == common.TimeSize.THREE:
+        return _time_three_struct.pack(milliseconds, minutes_byte)
 
-    if time_size.value > 3:
-        yield ((0x80 if time.summer_time else 0) |
-               (time.hours & 0x1F))
+    hours_byte = ((0x80 if time.summer_time else 0) |
+                  (time.hours & 0x1F))
 
-    if time_size.value > 4:
-        yield (((time.day_of_week & 0x07) << 5) |
-               (time.day_of_month & 0x1F))
-        yield time.months & 0x0F
-        yield time.years & 0x7F
+    if time_size == common.TimeSize.FOUR:
+        return _time_four_struct.pack(milliseconds, minutes_byte, hours_byte)
+
+    return _time_seven_full_struct.pack(
+        milliseconds,
+        minutes_byte,
+        hours_byte,
+        ((time.day_of_week & 0x07) << 5) | (time.day_of_month & 0x1F),
+        time.months & 0x0F,
+        time.years & 0x7F)
 
 
 class Encoder:
@@ -84,6 +118,19 @@ class Encoder:
         self._inverted_sequence_bit = inverted_sequence_bit
         self._decode_io_element_cb = decode_io_element_cb
         self._encode_io_element_cb = encode_io_element_cb
+        self._header_struct = struct.Struct(
+            '<BB' +
+            _int_struct_formats[cause_size.value] +
+            _int_struct_formats[asdu_address_size.value])
+        self._io_address_struct = (
+            struct.Struct('<' + _int_struct_formats[io_address_size.value])
+            if io_address_size.value in _int_struct_formats else None)
+        self._native_params = (cause_size.value,
+                               asdu_address_size.value,
+                               io_address_size.value,
+                               {k: v.value
+                                for k, v in asdu_type_time_sizes.items()},
+                               inverted_sequence_bit)
 
     @property
     def cause_size(self) -> common.CauseSize:
@@ -100,86 +147,127 @@ class Encoder:
     def decode_asdu(self,
                     asdu_bytes: util.Bytes
                     ) -> tuple[common.ASDU, util.Bytes]:
-        asdu_type = asdu_bytes[0]
-        io_number = asdu_bytes[1] & 0x7F
-        is_sequence = bool(asdu_bytes[1] & 0x80)
+        if _encoder:
+            asdu, size = _encoder.decode_asdu(asdu_bytes,
+                                              *self._native_params,
+                                              self._decode_io_element_cb)
+            return asdu, asdu_bytes[size:]
+
+        asdu_type, vsq, cause, address = self._header_struct.unpack_from(
+            asdu_bytes)
+
+        io_number = vsq & 0x7F
+        is_sequence = bool(vsq & 0x80)
         if self._inverted_sequence_bit:
             is_sequence = not is_sequence
         io_count = 1 if is_sequence else io_number
         ioe_element_count = io_number if is_sequence else 1
 
-        rest = asdu_bytes[2:]
-        cause, rest = _decode_int(rest, self._cause_size.value)
-        address, rest = _decode_int(rest, self._asdu_address_size.value)
+        time_size = self._asdu_type_time_sizes.get(asdu_type)
+        asdu_bytes_len = len(asdu_bytes)
+        offset = self._header_struct.size
 
         ios = collections.deque()
         for _ in range(io_count):
-            io, rest = self._decode_io(asdu_type, ioe_element_count, rest)
-            ios.append(io)
+            io_address = self._decode_io_address(asdu_bytes, offset)
+            offset += self._io_address_size.value
+
+            elements = collections.deque()
+            if ioe_element_count:
+                rest = asdu_bytes[offset:]
+                for _ in range(ioe_element_count):
+                    element, rest = self._decode_io_element_cb(rest,
+                                                               asdu_type)
+                    elements.append(element)
+                offset = asdu_bytes_len - len(rest)
+
+            if time_size:
+                time = decode_time(asdu_bytes[offset:offset + time_size.value],
+                                   time_size)
+                offset += time_size.value
+
+            else:
+                time = None
+
+            ios.append(common.IO(address=io_address,
+                                 elements=list(elements),
+                                 time=time))
 
         asdu = common.ASDU(type=asdu_type,
                            cause=cause,
                            address=address,
                            ios=list(ios))
-        return asdu, rest
+        return asdu, asdu_bytes[offset:]
 
     def encode_asdu(self, asdu: common.ASDU) -> util.Bytes:
-        data = collections.deque()
-        data.append(asdu.type)
+        if _encoder:
+            return _encoder.encode_asdu(asdu, *self._native_params,
+                                        self._encode_io_element_cb)
 
         is_sequence = len(asdu.ios) == 1 and len(asdu.ios[0].elements) > 1
         if is_sequence:
-            data.append(
-                (0x00 if self._inverted_sequence_bit else 0x80) |
-                len(asdu.ios[0].elements))
+            vsq = ((0x00 if self._inverted_sequence_bit else 0x80) |
+                   len(asdu.ios[0].elements))
         else:
-            data.append(
-                (0x80 if self._inverted_sequence_bit else 0x00) |
-                len(asdu.ios))
+            vsq = ((0x80 if self._inverted_sequence_bit else 0x00) |
+                   len(asdu.ios))
 
-        data.extend(_encode_int(asdu.cause, self._cause_size.value))
-        data.extend(_encode_int(asdu.address, self._asdu_address_size.value))
+        data = bytearray(self._header_struct.pack(asdu.type, vsq, asdu.cause,
+                                                  asdu.address))
+
+        time_size = self._asdu_type_time_sizes.get(asdu.type)
 
         for io in asdu.ios:
             if not is_sequence and len(io.elements) != 1:
                 raise ValueError('invalid number of IO elements')
-            data.extend(self._encode_io(asdu.type, io))
+
+            data += self._encode_io_address(io.address)
+
+            for element in io.elements:
+                data.extend(self._encode_io_element_cb(element, asdu.type))
+
+            if time_size:
+                data += encode_time(io.time, time_size)
 
         return bytes(data)
 
-    def _decode_io(self, asdu_type, ioe_element_count, io_bytes):
-        address, rest = _decode_int(io_bytes, self._io_address_size.value)
+    def _decode_io_address(self, data, offset):
+        if self._io_address_struct:
+            return self._io_address_struct.unpack_from(data, offset)[0]
 
-        elements = collections.deque()
-        for _ in range(ioe_element_count):
-            element, rest = self._decode_io_element_cb(rest, asdu_type)
-            elements.append(element)
+        low, high = _io_address_three_struct.unpack_from(data, offset)
+        return low | (high << 16)
 
-        time_size = self._asdu_type_time_sizes.get(asdu_type)
-        if time_size:
-            time, rest = decode_time(rest, time_size), rest[time_size.value:]
-        else:
-            time = None
+    def _encode_io_address(self, io_address):
+        if self._io_address_struct:
+            return self._io_address_struct.pack(io_address)
 
-        io = common.IO(address=address,
-                       elements=list(elements),
-                       time=time)
-        return io, rest
+        return _io_address_three_struct.pack(io_address & 0xFFFF,
+                                             io_address >> 16)
 
-    def _encode_io(self, asdu_type, io):
-        yield from _encode_int(io.address, self._io_address_size.value)
 
-        for element in io.elements:
-            yield from self._encode_io_element_cb(element, asdu_type)
+_int_struct_formats = {1: 'B',
+                       2: 'H'}
 
-        time_size = self._asdu_type_time_sizes.get(asdu_type)
-        if time_size:
-            yield from encode_time(io.time, time_size)
+_io_address_three_struct = struct.Struct('<HB')
 
+_time_two_struct = struct.Struct('<H')
+_time_three_struct = struct.Struct('<HB')
+_time_four_struct = struct.Struct('<HBB')
+_time_seven_struct = struct.Struct('<HBI')
+_time_seven_full_struct = struct.Struct('<HBBBBB')
 
-def _decode_int(data, size):
-    return int.from_bytes(data[:size], 'little'), data[size:]
 
+@functools.lru_cache(maxsize=256)
+def _decode_time_upper(upper):
+    # decoding of hours, day, month and year bytes is reused for
+    # consecutive times with same upper bytes
+    hours_byte = upper & 0xFF
+    day_byte = (upper >> 8) & 0xFF
 
-def _encode_int(x, size):
-    return x.to_bytes(size, 'little')
+    return (bool(hours_byte & 0x80),
+            hours_byte & 0x1F,
+            day_byte >> 5,
+            day_byte & 0x1F,
+            (upper >> 16) & 0x0F,
+            (upper >> 24) & 0x7F)
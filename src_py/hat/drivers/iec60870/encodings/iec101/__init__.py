@@ -9,6 +9,7 @@ from hat.drivers.iec60870.encodings.iec101.common import (
     Time,
     time_from_datetime,
     time_to_datetime,
+    times_to_timestamps,
     OriginatorAddress,
     AsduAddress,
     IoAddress,
@@ -136,6 +137,7 @@ __all__ = ['AsduTypeError',
            'Time',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'OriginatorAddress',
            'AsduAddress',
            'IoAddress',
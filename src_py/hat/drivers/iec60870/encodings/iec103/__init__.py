@@ -6,6 +6,7 @@ from hat.drivers.iec60870.encodings.iec103.common import (
     Time,
     time_from_datetime,
     time_to_datetime,
+    times_to_timestamps,
     AsduAddress,
     OtherCause,
     AsduType,
@@ -75,6 +76,7 @@ __all__ = ['AsduTypeError',
            'Time',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'AsduAddress',
            'OtherCause',
            'AsduType',
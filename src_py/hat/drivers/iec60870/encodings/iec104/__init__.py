@@ -6,6 +6,7 @@ from hat.drivers.iec60870.encodings.iec104.common import (
     Time,
     time_from_datetime,
     time_to_datetime,
+    times_to_timestamps,
     OriginatorAddress,
     AsduAddress,
     IoAddress,
@@ -99,6 +100,7 @@ __all__ = ['AsduTypeError',
            'Time',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'OriginatorAddress',
            'AsduAddress',
            'IoAddress',
@@ -8,6 +8,7 @@ from hat.drivers.iec60870.encodings.security.common import (
     Time,
     time_from_datetime,
     time_to_datetime,
+    times_to_timestamps,
     OriginatorAddress,
     AsduAddress,
     IoAddress,
@@ -54,6 +55,7 @@ __all__ = ['CauseSize',
            'Time',
            'time_from_datetime',
            'time_to_datetime',
+           'times_to_timestamps',
            'OriginatorAddress',
            'AsduAddress',
            'IoAddress',
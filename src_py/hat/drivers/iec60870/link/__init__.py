@@ -3,6 +3,8 @@
 from hat.drivers.iec60870.link.common import (Address,
                                               AddressSize,
                                               Direction,
+                                              DataClass,
+                                              OverflowPolicy,
                                               ConnectionInfo,
                                               Connection)
 from hat.drivers.iec60870.link.unbalanced import (PollClass2Cb,
@@ -17,6 +19,8 @@ from hat.drivers.iec60870.link.balanced import (create_balanced_link,
 __all__ = ['Address',
            'AddressSize',
            'Direction',
+           'DataClass',
+           'OverflowPolicy',
            'ConnectionInfo',
            'Connection',
            'PollClass2Cb',
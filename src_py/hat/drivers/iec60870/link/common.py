@@ -23,6 +23,20 @@ class Direction(enum.Enum):
     A_TO_B = 1
 
 
+class DataClass(enum.Enum):
+    CLASS_1 = 1
+    """events and command responses, signaled with access demand"""
+    CLASS_2 = 2
+    """cyclic data, only sent in response to class 2 requests"""
+
+
+class OverflowPolicy(enum.Enum):
+    BLOCK = 'BLOCK'
+    """wait until there is space available"""
+    DROP_OLDEST = 'DROP_OLDEST'
+    """discard oldest buffered data"""
+
+
 class ReqFunction(enum.Enum):
     RESET_LINK = 0
     RESET_PROCESS = 1
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import logging
 import time
 import typing
@@ -63,8 +64,20 @@ class SlaveLink(aio.Resource):
                               poll_class2_cb: PollClass2Cb | None = None,
                               keep_alive_timeout: float = 30,
                               receive_queue_size: int = 1024,
-                              send_queue_size: int = 1024
-                              ) -> common.Connection:
+                              send_queue_size: int = 1024,
+                              class2_queue_size: int = 1024,
+                              overflow_policy: common.OverflowPolicy = (
+                                  common.OverflowPolicy.BLOCK)
+                              ) -> 'SlaveConnection':
+        """Open connection
+
+        Data sent with `SlaveConnection.send` is buffered in separate
+        class 1 and class 2 buffers, limited by `send_queue_size` and
+        `class2_queue_size`. Once buffer is full, `overflow_policy`
+        determines whether sending waits for available space or oldest
+        buffered data is discarded.
+
+        """
         if addr >= self._broadcast_address:
             raise ValueError('unsupported address')
 
@@ -78,7 +91,8 @@ class SlaveLink(aio.Resource):
         conn._frame_count_bit = None
         conn._res = None
         conn._keep_alive_event = asyncio.Event()
-        conn._send_queue = aio.Queue(send_queue_size)
+        conn._class1_buffer = _SendBuffer(send_queue_size, overflow_policy)
+        conn._class2_buffer = _SendBuffer(class2_queue_size, overflow_policy)
         conn._receive_queue = aio.Queue(receive_queue_size)
         conn._async_group = self.async_group.create_subgroup()
         conn._info = common.ConnectionInfo(name=name,
@@ -86,7 +100,8 @@ class SlaveLink(aio.Resource):
                                            address=addr)
         conn._log = logger.create_connection_logger(mlog, conn._info)
 
-        conn.async_group.spawn(aio.call_on_cancel, conn._send_queue.close)
+        conn.async_group.spawn(aio.call_on_cancel, conn._class1_buffer.close)
+        conn.async_group.spawn(aio.call_on_cancel, conn._class2_buffer.close)
         conn.async_group.spawn(aio.call_on_cancel, conn._receive_queue.close)
 
         conn.async_group.spawn(aio.call_on_cancel, self._conns.pop, addr,
@@ -164,15 +179,41 @@ class SlaveConnection(common.Connection):
     def info(self):
         return self._info
 
-    async def send(self, data, sent_cb=None):
+    @property
+    def overflow(self) -> bool:
+        """Buffered data was discarded since last `reset_overflow`"""
+        return self._class1_buffer.overflow or self._class2_buffer.overflow
+
+    def reset_overflow(self):
+        self._class1_buffer.overflow = False
+        self._class2_buffer.overflow = False
+
+    async def send(self,
+                   data: util.Bytes,
+                   sent_cb: aio.AsyncCallable[[], None] | None = None,
+                   *,
+                   data_class: common.DataClass = common.DataClass.CLASS_1,
+                   key: typing.Hashable | None = None):
+        """Send data
+
+        If `key` is not ``None``, data replaces previously buffered data
+        with the same key, which is discarded together with its `sent_cb`
+        (latest value wins).
+
+        """
         if not data:
             return
 
-        try:
-            await self._send_queue.put((data, sent_cb))
+        if data_class == common.DataClass.CLASS_1:
+            buffer = self._class1_buffer
 
-        except aio.QueueClosedError:
-            raise ConnectionError()
+        elif data_class == common.DataClass.CLASS_2:
+            buffer = self._class2_buffer
+
+        else:
+            raise ValueError('unsupported data class')
+
+        await buffer.put(data, sent_cb, key)
 
     async def receive(self):
         try:
@@ -209,7 +250,7 @@ class SlaveConnection(common.Connection):
 
         if req.function in [common.ReqFunction.RESET_LINK,
                             common.ReqFunction.RESET_PROCESS]:
-            # TODO: clear self._send_queue ???
+            # TODO: clear send buffers ???
             if not req.frame_count_valid:
                 self._frame_count_bit = False
 
@@ -233,13 +274,13 @@ class SlaveConnection(common.Connection):
             data = b''
 
         elif req.function == common.ReqFunction.REQ_DATA_1:
-            if self._send_queue.empty():
+            if self._class1_buffer.empty():
                 function = common.ResFunction.RES_NACK
                 data = b''
 
             else:
                 function = common.ResFunction.RES_DATA
-                data, sent_cb = self._send_queue.get_nowait()
+                data, sent_cb = self._class1_buffer.get_nowait()
 
         elif req.function == common.ReqFunction.REQ_DATA_2:
             if self._poll_class2_cb:
@@ -248,23 +289,26 @@ class SlaveConnection(common.Connection):
             else:
                 data = None
 
-            if data is None:
-                if not self._send_queue.empty():
-                    function = common.ResFunction.RES_DATA
-                    data, sent_cb = self._send_queue.get_nowait()
+            if data is not None:
+                function = common.ResFunction.RES_DATA
 
-                else:
-                    function = common.ResFunction.RES_NACK
-                    data = b''
+            elif not self._class2_buffer.empty():
+                function = common.ResFunction.RES_DATA
+                data, sent_cb = self._class2_buffer.get_nowait()
 
-            else:
+            elif not self._class1_buffer.empty():
                 function = common.ResFunction.RES_DATA
+                data, sent_cb = self._class1_buffer.get_nowait()
+
+            else:
+                function = common.ResFunction.RES_NACK
+                data = b''
 
         else:
             function = common.ResFunction.NOT_IMPLEMENTED
             data = b''
 
-        access_demand = not self._send_queue.empty()
+        access_demand = not self._class1_buffer.empty()
 
         if not access_demand and function in (common.ResFunction.ACK,
                                               common.ResFunction.RES_NACK):
@@ -282,3 +326,57 @@ class SlaveConnection(common.Connection):
         self._res = res
 
         return res, sent_cb
+
+
+class _SendBuffer:
+
+    def __init__(self,
+                 size: int,
+                 overflow_policy: common.OverflowPolicy):
+        if size < 1:
+            raise ValueError('invalid size')
+
+        self._size = size
+        self._overflow_policy = overflow_policy
+        self._entries = collections.OrderedDict()
+        self._closed = False
+        self._event = asyncio.Event()
+        self.overflow = False
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def close(self):
+        self._closed = True
+        self._event.set()
+
+    async def put(self,
+                  data: util.Bytes,
+                  sent_cb: aio.AsyncCallable[[], None] | None,
+                  key: typing.Hashable | None):
+        if self._closed:
+            raise ConnectionError()
+
+        if key is not None and key in self._entries:
+            self._entries[key] = data, sent_cb
+            return
+
+        while len(self._entries) >= self._size:
+            if self._overflow_policy == common.OverflowPolicy.DROP_OLDEST:
+                self._entries.popitem(last=False)
+                self.overflow = True
+                break
+
+            self._event.clear()
+            await self._event.wait()
+
+            if self._closed:
+                raise ConnectionError()
+
+        self._entries[object() if key is None else key] = data, sent_cb
+
+    def get_nowait(self) -> tuple[util.Bytes,
+                                  aio.AsyncCallable[[], None] | None]:
+        _, entry = self._entries.popitem(last=False)
+        self._event.set()
+        return entry
@@ -64,10 +64,12 @@ async def connect(addr: tcp.Address,
     client._loop = asyncio.get_running_loop()
     client._status_event = asyncio.Event()
     client._last_appl_errors = {}
-    client._report_data_defs = {
-        report_id: [encoder.DataDef(ref=data_ref,
-                                    value_type=data_value_types[data_ref])
-                    for data_ref in data_refs]
+    client._data_value_decoders = {}
+    client._report_decoders = {
+        report_id: encoder.create_report_decoder(
+            [encoder.DataDef(ref=data_ref,
+                             value_type=data_value_types[data_ref])
+             for data_ref in data_refs])
         for report_id, data_refs in report_data_refs.items()}
 
     client._log = logger.create_logger(mlog, kwargs.get('name'), None)
@@ -80,6 +82,9 @@ async def connect(addr: tcp.Address,
                                      **kwargs)
 
     try:
+        client._read_semaphore = asyncio.Semaphore(
+            client._conn.max_outstanding)
+
         client._log = logger.create_logger(mlog, client._conn.info.name,
                                            client._conn.info)
         client._comm_log = logger.CommunicationLogger(
@@ -443,6 +448,50 @@ class Client(aio.Resource):
 
         return results
 
+    async def read_data(self,
+                        refs: Collection[common.DataRef]
+                        ) -> list[common.Value | common.ServiceError]:
+        """Read data
+
+        Data references are grouped into MMS read requests which should not
+        exceed negotiated maximum PDU size (request and response size is
+        estimated based on data references and data value types). Read
+        requests are sent concurrently - number of pending requests is
+        limited by negotiated maximum number of outstanding requests.
+
+        Results are returned in the same order as `refs`.
+
+        """
+        max_pdu_size = self._conn.max_pdu_size or _default_max_pdu_size
+
+        batches = collections.deque()
+        batch = collections.deque()
+        batch_size = _read_pdu_overhead
+
+        for i, ref in enumerate(refs):
+            value_type = self._data_value_types[ref]
+            object_name = encoder.data_ref_to_object_name(ref)
+            size = max(_get_object_name_size(object_name),
+                       _get_value_size(value_type))
+
+            if batch and batch_size + size > max_pdu_size:
+                batches.append(batch)
+                batch = collections.deque()
+                batch_size = _read_pdu_overhead
+
+            batch.append((i, ref, object_name))
+            batch_size += size
+
+        if batch:
+            batches.append(batch)
+
+        results = [None] * len(refs)
+
+        await asyncio.gather(*(self._read_data_batch(batch, results)
+                               for batch in batches))
+
+        return results
+
     async def write_data(self,
                          ref: common.DataRef,
                          value: common.Value
@@ -471,23 +520,7 @@ class Client(aio.Resource):
                 raise Exception('invalid results size')
 
             if res.results[0] is not None:
-                if res.results[0] == mms.DataAccessError.OBJECT_ACCESS_DENIED:
-                    result = common.ServiceError.ACCESS_VIOLATION
-
-                elif res.results[0] == mms.DataAccessError.OBJECT_NON_EXISTENT:
-                    result = common.ServiceError.INSTANCE_NOT_AVAILABLE
-
-                elif res.results[0] == mms.DataAccessError.TEMPORARILY_UNAVAILABLE:  # NOQA
-                    result = common.ServiceError.INSTANCE_LOCKED_BY_OTHER_CLIENT  # NOQA
-
-                elif res.results[0] == mms.DataAccessError.TYPE_INCONSISTENT:
-                    result = common.ServiceError.TYPE_CONFLICT
-
-                elif res.results[0] == mms.DataAccessError.OBJECT_VALUE_INVALID:  # NOQA
-                    result = common.ServiceError.PARAMETER_VALUE_INCONSISTENT
-
-                else:
-                    result = common.ServiceError.FAILED_DUE_TO_COMMUNICATIONS_CONSTRAINT  # NOQA
+                result = _service_error_from_data_access_error(res.results[0])
 
             else:
                 result = None
@@ -640,13 +673,13 @@ class Client(aio.Resource):
         report_id = encoder.value_from_mms_data(
             mms_data[0], common.BasicValueType.VISIBLE_STRING)
 
-        data_defs = self._report_data_defs.get(report_id)
-        if data_defs is None:
+        report_decoder = self._report_decoders.get(report_id)
+        if report_decoder is None:
             self._log.info("report id %s not defined - skipping report",
                            report_id)
             return
 
-        report = encoder.report_from_mms_data(mms_data, data_defs)
+        report = report_decoder(mms_data)
 
         self._comm_log.log(common.CommLogAction.RECEIVE, report)
 
@@ -693,6 +726,60 @@ class Client(aio.Resource):
 
         await aio.call(self._termination_cb, termination)
 
+    async def _read_data_batch(self, batch, results):
+        refs = [ref for _, ref, _ in batch]
+
+        req = mms.ReadRequest([
+            mms.NameVariableSpecification(object_name)
+            for _, _, object_name in batch])
+
+        if self._comm_log.is_enabled:
+            self._comm_log.log(common.CommLogAction.SEND,
+                               logger.ReadDataReq(refs))
+
+        async with self._read_semaphore:
+            res = await self._send(req)
+
+        if isinstance(res, mms.Error):
+            batch_results = [
+                common.ServiceError.FAILED_DUE_TO_COMMUNICATIONS_CONSTRAINT
+                for _ in batch]
+
+        elif isinstance(res, mms.ReadResponse):
+            if len(res.results) != len(batch):
+                raise Exception('invalid results length')
+
+            batch_results = [self._data_from_mms_data(ref, mms_data)
+                             for ref, mms_data in zip(refs, res.results)]
+
+        else:
+            raise Exception('unsupported response type')
+
+        for (i, _, _), result in zip(batch, batch_results):
+            results[i] = result
+
+        if self._comm_log.is_enabled:
+            self._comm_log.log(common.CommLogAction.RECEIVE,
+                               logger.ReadDataRes(batch_results))
+
+    def _data_from_mms_data(self, ref, mms_data):
+        if isinstance(mms_data, mms.DataAccessError):
+            return _service_error_from_data_access_error(mms_data)
+
+        value_decoder = self._data_value_decoders.get(ref)
+        if value_decoder is None:
+            value_decoder = encoder.create_value_decoder(
+                self._data_value_types[ref])
+            self._data_value_decoders[ref] = value_decoder
+
+        try:
+            return value_decoder(mms_data)
+
+        except Exception as e:
+            self._log.warning("error decoding data %s: %s",
+                              encoder.data_ref_to_str(ref), e, exc_info=e)
+            return common.ServiceError.TYPE_CONFLICT
+
     async def _send(self, req):
         res = await self._conn.send_confirmed(req)
         self._status_event.set()
@@ -825,6 +912,63 @@ class Client(aio.Resource):
         return result
 
 
+_default_max_pdu_size = 65000
+
+_read_pdu_overhead = 32
+
+_value_sizes = {
+    common.BasicValueType.BOOLEAN: 3,
+    common.BasicValueType.INTEGER: 6,
+    common.BasicValueType.UNSIGNED: 6,
+    common.BasicValueType.FLOAT: 7,
+    common.BasicValueType.BIT_STRING: 8,
+    common.BasicValueType.OCTET_STRING: 68,
+    common.BasicValueType.VISIBLE_STRING: 68,
+    common.BasicValueType.MMS_STRING: 68,
+    common.AcsiValueType.QUALITY: 5,
+    common.AcsiValueType.TIMESTAMP: 10,
+    common.AcsiValueType.DOUBLE_POINT: 4,
+    common.AcsiValueType.DIRECTION: 3,
+    common.AcsiValueType.SEVERITY: 3,
+    common.AcsiValueType.ANALOGUE: 15,
+    common.AcsiValueType.VECTOR: 32,
+    common.AcsiValueType.STEP_POSITION: 11,
+    common.AcsiValueType.BINARY_CONTROL: 4}
+
+
+def _get_object_name_size(object_name):
+    return len(object_name.domain_id) + len(object_name.item_id) + 12
+
+
+def _get_value_size(value_type):
+    if isinstance(value_type, common.ArrayValueType):
+        return 4 + value_type.length * _get_value_size(value_type.type)
+
+    if isinstance(value_type, common.StructValueType):
+        return 4 + sum(_get_value_size(t) for _, t in value_type.elements)
+
+    return _value_sizes[value_type]
+
+
+def _service_error_from_data_access_error(error):
+    if error == mms.DataAccessError.OBJECT_ACCESS_DENIED:
+        return common.ServiceError.ACCESS_VIOLATION
+
+    if error == mms.DataAccessError.OBJECT_NON_EXISTENT:
+        return common.ServiceError.INSTANCE_NOT_AVAILABLE
+
+    if error == mms.DataAccessError.TEMPORARILY_UNAVAILABLE:
+        return common.ServiceError.INSTANCE_LOCKED_BY_OTHER_CLIENT
+
+    if error == mms.DataAccessError.TYPE_INCONSISTENT:
+        return common.ServiceError.TYPE_CONFLICT
+
+    if error == mms.DataAccessError.OBJECT_VALUE_INVALID:
+        return common.ServiceError.PARAMETER_VALUE_INCONSISTENT
+
+    return common.ServiceError.FAILED_DUE_TO_COMMUNICATIONS_CONSTRAINT
+
+
 def _create_command_error(service_error, last_appl_error):
     additional_cause = (last_appl_error.additional_cause
                         if last_appl_error else None)
@@ -62,6 +62,14 @@ class SetRcbAttrsRes(typing.NamedTuple):
     results: dict[common.RcbAttrType, common.ServiceError | None]
 
 
+class ReadDataReq(typing.NamedTuple):
+    refs: Collection[common.DataRef]
+
+
+class ReadDataRes(typing.NamedTuple):
+    results: Collection[common.Value | common.ServiceError]
+
+
 class WriteDataReq(typing.NamedTuple):
     ref: common.DataRef
     value: common.Value
@@ -97,6 +105,8 @@ Msg: typing.TypeAlias = (CreateDatasetReq |
                          GetRcbAttrsRes |
                          SetRcbAttrsReq |
                          SetRcbAttrsRes |
+                         ReadDataReq |
+                         ReadDataRes |
                          WriteDataReq |
                          WriteDataRes |
                          CommandReq |
@@ -259,6 +269,22 @@ def _format_msg(msg):
 
             segments.append(_format_segments(subsegments))
 
+    elif isinstance(msg, ReadDataReq):
+        segments.append('ReadDataReq')
+
+        refs = [encoder.data_ref_to_str(i) for i in msg.refs]
+        segments.append(f"refs={_format_segments(refs)}")
+
+    elif isinstance(msg, ReadDataRes):
+        segments.append('ReadDataRes')
+
+        for result in msg.results:
+            if isinstance(result, common.ServiceError):
+                segments.append(result.name)
+
+            else:
+                segments.append(_format_value(result))
+
     elif isinstance(msg, WriteDataReq):
         segments.append('WriteDataReq')
         segments.append(f"ref={encoder.data_ref_to_str(msg.ref)}")
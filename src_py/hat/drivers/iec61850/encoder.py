@@ -22,6 +22,12 @@ class DataDef(typing.NamedTuple):
     value_type: common.ValueType
 
 
+ValueDecoder: typing.TypeAlias = typing.Callable[[mms.Data], common.Value]
+
+ReportDecoder: typing.TypeAlias = typing.Callable[[Collection[mms.Data]],
+                                                  common.Report]
+
+
 def dataset_ref_to_object_name(ref: common.DatasetRef) -> mms.ObjectName:
     if isinstance(ref, common.PersistedDatasetRef):
         return mms.DomainSpecificObjectName(
@@ -121,185 +127,208 @@ def data_ref_from_str(ref_str: str) -> common.DataRef:
 def value_from_mms_data(mms_data: mms.Data,
                         value_type: common.ValueType
                         ) -> common.Value:
-    if value_type == common.BasicValueType.BOOLEAN:
-        if not isinstance(mms_data, mms.BooleanData):
-            raise Exception('unexpected data type')
+    return create_value_decoder(value_type)(mms_data)
 
-        return mms_data.value
 
-    if value_type == common.BasicValueType.INTEGER:
-        if not isinstance(mms_data, mms.IntegerData):
-            raise Exception('unexpected data type')
+def create_value_decoder(value_type: common.ValueType) -> ValueDecoder:
+    if isinstance(value_type, common.ArrayValueType):
+        return _create_array_decoder(value_type)
 
-        return mms_data.value
+    if isinstance(value_type, common.StructValueType):
+        return _create_struct_decoder(value_type)
 
-    if value_type == common.BasicValueType.UNSIGNED:
-        if not isinstance(mms_data, mms.UnsignedData):
-            raise Exception('unexpected data type')
+    decoder = _value_decoders.get(value_type)
+    if decoder is None:
+        raise TypeError('unsupported value type')
 
-        return mms_data.value
+    return decoder
 
-    if value_type == common.BasicValueType.FLOAT:
-        if not isinstance(mms_data, mms.FloatingPointData):
-            raise Exception('unexpected data type')
 
-        return mms_data.value
+def _create_basic_decoder(data_cls):
 
-    if value_type == common.BasicValueType.BIT_STRING:
-        if not isinstance(mms_data, mms.BitStringData):
+    def decode(mms_data):
+        if not isinstance(mms_data, data_cls):
             raise Exception('unexpected data type')
 
         return mms_data.value
 
-    if value_type == common.BasicValueType.OCTET_STRING:
-        if not isinstance(mms_data, mms.OctetStringData):
-            raise Exception('unexpected data type')
+    return decode
 
-        return mms_data.value
 
-    if value_type == common.BasicValueType.VISIBLE_STRING:
-        if not isinstance(mms_data, mms.VisibleStringData):
-            raise Exception('unexpected data type')
+def _decode_quality(mms_data):
+    if not isinstance(mms_data, mms.BitStringData):
+        raise Exception('unexpected data type')
 
-        return mms_data.value
+    if len(mms_data.value) != 13:
+        raise Exception('invalid bit string length')
 
-    if value_type == common.BasicValueType.MMS_STRING:
-        if not isinstance(mms_data, mms.MmsStringData):
-            raise Exception('unexpected data type')
+    return common.Quality(
+        validity=common.QualityValidity((mms_data.value[0] << 1) |
+                                        mms_data.value[1]),
+        details={common.QualityDetail(index)
+                 for index, i in enumerate(mms_data.value)
+                 if index >= 2 and index <= 9 and i},
+        source=common.QualitySource(int(mms_data.value[10])),
+        test=mms_data.value[11],
+        operator_blocked=mms_data.value[12])
 
-        return mms_data.value
 
-    if value_type == common.AcsiValueType.QUALITY:
-        if not isinstance(mms_data, mms.BitStringData):
-            raise Exception('unexpected data type')
+def _decode_timestamp(mms_data):
+    if not isinstance(mms_data, mms.UtcTimeData):
+        raise Exception('unexpected data type')
 
-        if len(mms_data.value) != 13:
-            raise Exception('invalid bit string length')
+    return common.Timestamp(**mms_data._asdict())
 
-        return common.Quality(
-            validity=common.QualityValidity((mms_data.value[0] << 1) |
-                                            mms_data.value[1]),
-            details={common.QualityDetail(index)
-                     for index, i in enumerate(mms_data.value)
-                     if index >= 2 and index <= 9 and i},
-            source=common.QualitySource(int(mms_data.value[10])),
-            test=mms_data.value[11],
-            operator_blocked=mms_data.value[12])
 
-    if value_type == common.AcsiValueType.TIMESTAMP:
-        if not isinstance(mms_data, mms.UtcTimeData):
-            raise Exception('unexpected data type')
+def _decode_double_point(mms_data):
+    if not isinstance(mms_data, mms.BitStringData):
+        raise Exception('unexpected data type')
 
-        return common.Timestamp(**mms_data._asdict())
+    if len(mms_data.value) != 2:
+        raise Exception('invalid bit string length')
 
-    if value_type == common.AcsiValueType.DOUBLE_POINT:
-        if not isinstance(mms_data, mms.BitStringData):
-            raise Exception('unexpected data type')
+    return common.DoublePoint((mms_data.value[0] << 1) |
+                              mms_data.value[1])
 
-        if len(mms_data.value) != 2:
-            raise Exception('invalid bit string length')
 
-        return common.DoublePoint((mms_data.value[0] << 1) |
-                                  mms_data.value[1])
+def _decode_direction(mms_data):
+    if not isinstance(mms_data, mms.IntegerData):
+        raise Exception('unexpected data type')
 
-    if value_type == common.AcsiValueType.DIRECTION:
-        if not isinstance(mms_data, mms.IntegerData):
-            raise Exception('unexpected data type')
+    return common.Direction(mms_data.value)
 
-        return common.Direction(mms_data.value)
 
-    if value_type == common.AcsiValueType.SEVERITY:
-        if not isinstance(mms_data, mms.IntegerData):
-            raise Exception('unexpected data type')
+def _decode_severity(mms_data):
+    if not isinstance(mms_data, mms.IntegerData):
+        raise Exception('unexpected data type')
 
-        return common.Severity(mms_data.value)
+    return common.Severity(mms_data.value)
 
-    if value_type == common.AcsiValueType.ANALOGUE:
-        if not isinstance(mms_data, mms.StructureData):
+
+def _decode_analogue(mms_data):
+    if not isinstance(mms_data, mms.StructureData):
+        raise Exception('unexpected data type')
+
+    if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
+        raise Exception('invalid structure size')
+
+    value = common.Analogue()
+
+    for i in mms_data.elements:
+        if isinstance(i, mms.IntegerData):
+            value = value._replace(i=i.value)
+
+        elif isinstance(i, mms.FloatingPointData):
+            value = value._replace(f=i.value)
+
+        else:
             raise Exception('unexpected data type')
 
-        if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
-            raise Exception('invalid structure size')
+    return value
 
-        value = common.Analogue()
 
-        for i in mms_data.elements:
-            if isinstance(i, mms.IntegerData):
-                value = value._replace(i=i.value)
+def _decode_vector(mms_data):
+    if not isinstance(mms_data, mms.StructureData):
+        raise Exception('unexpected data type')
 
-            elif isinstance(i, mms.FloatingPointData):
-                value = value._replace(f=i.value)
+    if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
+        raise Exception('invalid structure size')
 
-            else:
-                raise Exception('unexpected data type')
+    elements = list(mms_data.elements)
 
-        return value
+    return common.Vector(
+        magnitude=_decode_analogue(elements[0]),
+        angle=(_decode_analogue(elements[1])
+               if len(elements) > 1 else None))
 
-    if value_type == common.AcsiValueType.VECTOR:
-        if not isinstance(mms_data, mms.StructureData):
-            raise Exception('unexpected data type')
 
-        if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
-            raise Exception('invalid structure size')
+def _decode_step_position(mms_data):
+    if not isinstance(mms_data, mms.StructureData):
+        raise Exception('unexpected data type')
 
-        elements = list(mms_data.elements)
+    if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
+        raise Exception('invalid structure size')
 
-        return common.Vector(
-            magnitude=value_from_mms_data(
-                elements[0], common.AcsiValueType.ANALOGUE),
-            angle=(
-                value_from_mms_data(
-                    elements[1], common.AcsiValueType.ANALOGUE)
-                if len(elements) > 1 else None))
+    elements = list(mms_data.elements)
 
-    if value_type == common.AcsiValueType.STEP_POSITION:
-        if not isinstance(mms_data, mms.StructureData):
-            raise Exception('unexpected data type')
+    return common.StepPosition(
+        value=_decode_integer(elements[0]),
+        transient=(_decode_boolean(elements[1])
+                   if len(elements) > 1 else None))
 
-        if len(mms_data.elements) < 1 or len(mms_data.elements) > 2:
-            raise Exception('invalid structure size')
 
-        elements = list(mms_data.elements)
+def _decode_binary_control(mms_data):
+    if not isinstance(mms_data, mms.BitStringData):
+        raise Exception('unexpected data type')
 
-        return common.StepPosition(
-            value=value_from_mms_data(
-                elements[0], common.BasicValueType.INTEGER),
-            transient=(
-                value_from_mms_data(
-                    elements[1], common.BasicValueType.BOOLEAN)
-                if len(elements) > 1 else None))
+    if len(mms_data.value) != 2:
+        raise Exception('invalid bit string length')
 
-    if value_type == common.AcsiValueType.BINARY_CONTROL:
-        if not isinstance(mms_data, mms.BitStringData):
-            raise Exception('unexpected data type')
+    return common.BinaryControl((mms_data.value[0] << 1) |
+                                mms_data.value[1])
 
-        if len(mms_data.value) != 2:
-            raise Exception('invalid bit string length')
 
-        return common.BinaryControl((mms_data.value[0] << 1) |
-                                    mms_data.value[1])
+def _create_array_decoder(value_type):
+    length = value_type.length
+    element_decoder = create_value_decoder(value_type.type)
 
-    if isinstance(value_type, common.ArrayValueType):
+    def decode(mms_data):
         if not isinstance(mms_data, mms.ArrayData):
             raise Exception('unexpected data type')
 
-        if len(mms_data.elements) != value_type.length:
+        if len(mms_data.elements) != length:
             raise Exception('invalid array length')
 
-        return [value_from_mms_data(i, value_type.type)
-                for i in mms_data.elements]
+        return [element_decoder(i) for i in mms_data.elements]
 
-    if isinstance(value_type, common.StructValueType):
+    return decode
+
+
+def _create_struct_decoder(value_type):
+    element_decoders = [(k, create_value_decoder(t))
+                        for k, t in value_type.elements]
+
+    def decode(mms_data):
         if not isinstance(mms_data, mms.StructureData):
             raise Exception('unexpected data type')
 
-        if len(mms_data.elements) != len(value_type.elements):
+        if len(mms_data.elements) != len(element_decoders):
             raise Exception('invalid structure size')
 
-        return {k: value_from_mms_data(i, t)
-                for i, (k, t) in zip(mms_data.elements, value_type.elements)}
-
-    raise TypeError('unsupported value type')
+        return {k: decoder(i)
+                for i, (k, decoder) in zip(mms_data.elements,
+                                           element_decoders)}
+
+    return decode
+
+
+_decode_boolean = _create_basic_decoder(mms.BooleanData)
+_decode_integer = _create_basic_decoder(mms.IntegerData)
+_decode_unsigned = _create_basic_decoder(mms.UnsignedData)
+_decode_bit_string = _create_basic_decoder(mms.BitStringData)
+_decode_octet_string = _create_basic_decoder(mms.OctetStringData)
+_decode_visible_string = _create_basic_decoder(mms.VisibleStringData)
+
+_value_decoders = {
+    common.BasicValueType.BOOLEAN: _decode_boolean,
+    common.BasicValueType.INTEGER: _decode_integer,
+    common.BasicValueType.UNSIGNED: _decode_unsigned,
+    common.BasicValueType.FLOAT: _create_basic_decoder(
+        mms.FloatingPointData),
+    common.BasicValueType.BIT_STRING: _decode_bit_string,
+    common.BasicValueType.OCTET_STRING: _decode_octet_string,
+    common.BasicValueType.VISIBLE_STRING: _decode_visible_string,
+    common.BasicValueType.MMS_STRING: _create_basic_decoder(
+        mms.MmsStringData),
+    common.AcsiValueType.QUALITY: _decode_quality,
+    common.AcsiValueType.TIMESTAMP: _decode_timestamp,
+    common.AcsiValueType.DOUBLE_POINT: _decode_double_point,
+    common.AcsiValueType.DIRECTION: _decode_direction,
+    common.AcsiValueType.SEVERITY: _decode_severity,
+    common.AcsiValueType.ANALOGUE: _decode_analogue,
+    common.AcsiValueType.VECTOR: _decode_vector,
+    common.AcsiValueType.STEP_POSITION: _decode_step_position,
+    common.AcsiValueType.BINARY_CONTROL: _decode_binary_control}
 
 
 def value_to_mms_data(value: common.Value,
@@ -726,139 +755,130 @@ def last_appl_error_from_mms_data(mms_data: mms.Data) -> LastApplError:
 def report_from_mms_data(mms_data: Collection[mms.Data],
                          data_defs: Collection[DataDef]
                          ) -> common.Report:
-    elements = iter(mms_data)
+    return create_report_decoder(data_defs)(mms_data)
 
-    report_id = value_from_mms_data(next(elements),
-                                    common.BasicValueType.VISIBLE_STRING)
 
-    optional_fields_bits = value_from_mms_data(
-        next(elements), common.BasicValueType.BIT_STRING)
-    if len(optional_fields_bits) != 10:
-        raise Exception('invalid optional fields size')
+def create_report_decoder(data_defs: Collection[DataDef]) -> ReportDecoder:
+    data_defs = [
+        (data_def.ref,
+         data_ref_to_str(data_def.ref),
+         create_value_decoder(data_def.value_type))
+        for data_def in data_defs]
 
-    optional_fields = {common.OptionalField(index)
-                       for index, i in enumerate(optional_fields_bits[:-1])
-                       if i}
-    segmentation = optional_fields_bits[-1]
+    def decode(mms_data):
+        elements = iter(mms_data)
 
-    if common.OptionalField.SEQUENCE_NUMBER in optional_fields:
-        sequence_number = value_from_mms_data(next(elements),
-                                              common.BasicValueType.UNSIGNED)
+        report_id = _decode_visible_string(next(elements))
 
-    else:
-        sequence_number = None
+        optional_fields_bits = _decode_bit_string(next(elements))
+        if len(optional_fields_bits) != 10:
+            raise Exception('invalid optional fields size')
 
-    if common.OptionalField.REPORT_TIME_STAMP in optional_fields:
-        time_of_entry_data = next(elements)
-        if not isinstance(time_of_entry_data, mms.BinaryTimeData):
-            raise Exception('unexpected data type')
+        optional_fields = {common.OptionalField(index)
+                           for index, i in enumerate(optional_fields_bits[:-1])
+                           if i}
+        segmentation = optional_fields_bits[-1]
 
-        time_of_entry = time_of_entry_data.value
+        if common.OptionalField.SEQUENCE_NUMBER in optional_fields:
+            sequence_number = _decode_unsigned(next(elements))
 
-    else:
-        time_of_entry = None
+        else:
+            sequence_number = None
 
-    if common.OptionalField.DATA_SET_NAME in optional_fields:
-        dataset_str = value_from_mms_data(next(elements),
-                                          common.BasicValueType.VISIBLE_STRING)
-        dataset = dataset_ref_from_str(dataset_str)
+        if common.OptionalField.REPORT_TIME_STAMP in optional_fields:
+            time_of_entry_data = next(elements)
+            if not isinstance(time_of_entry_data, mms.BinaryTimeData):
+                raise Exception('unexpected data type')
 
-    else:
-        dataset = None
+            time_of_entry = time_of_entry_data.value
 
-    if common.OptionalField.BUFFER_OVERFLOW in optional_fields:
-        buffer_overflow = value_from_mms_data(next(elements),
-                                              common.BasicValueType.BOOLEAN)
+        else:
+            time_of_entry = None
 
-    else:
-        buffer_overflow = None
+        if common.OptionalField.DATA_SET_NAME in optional_fields:
+            dataset_str = _decode_visible_string(next(elements))
+            dataset = dataset_ref_from_str(dataset_str)
 
-    if common.OptionalField.ENTRY_ID in optional_fields:
-        entry_id = value_from_mms_data(next(elements),
-                                       common.BasicValueType.OCTET_STRING)
+        else:
+            dataset = None
 
-    else:
-        entry_id = None
+        if common.OptionalField.BUFFER_OVERFLOW in optional_fields:
+            buffer_overflow = _decode_boolean(next(elements))
 
-    if common.OptionalField.CONF_REVISION in optional_fields:
-        conf_revision = value_from_mms_data(next(elements),
-                                            common.BasicValueType.UNSIGNED)
+        else:
+            buffer_overflow = None
 
-    else:
-        conf_revision = None
+        if common.OptionalField.ENTRY_ID in optional_fields:
+            entry_id = _decode_octet_string(next(elements))
 
-    if segmentation:
-        subsequence_number = value_from_mms_data(
-            next(elements), common.BasicValueType.UNSIGNED)
-        more_segments_follow = value_from_mms_data(
-            next(elements), common.BasicValueType.BOOLEAN)
+        else:
+            entry_id = None
 
-    else:
-        subsequence_number = None
-        more_segments_follow = None
+        if common.OptionalField.CONF_REVISION in optional_fields:
+            conf_revision = _decode_unsigned(next(elements))
 
-    inclusion = value_from_mms_data(next(elements),
-                                    common.BasicValueType.BIT_STRING)
-    if len(inclusion) != len(data_defs):
-        raise Exception('unexpected number of inclusion bits')
+        else:
+            conf_revision = None
 
-    if common.OptionalField.DATA_REFERENCE in optional_fields:
-        for exists, data_def in zip(inclusion, data_defs):
-            if not exists:
-                continue
+        if segmentation:
+            subsequence_number = _decode_unsigned(next(elements))
+            more_segments_follow = _decode_boolean(next(elements))
 
-            data_ref_str = value_from_mms_data(
-                next(elements), common.BasicValueType.VISIBLE_STRING)
-            data_ref = data_ref_from_str(data_ref_str)
+        else:
+            subsequence_number = None
+            more_segments_follow = None
 
-            if data_ref != data_def.ref:
-                raise Exception('data reference mismatch')
+        inclusion = _decode_bit_string(next(elements))
+        if len(inclusion) != len(data_defs):
+            raise Exception('unexpected number of inclusion bits')
 
-    values = collections.deque()
-    for exists, data_def in zip(inclusion, data_defs):
-        if not exists:
-            continue
+        included_data_defs = [data_def
+                              for exists, data_def in zip(inclusion, data_defs)
+                              if exists]
 
-        values.append(value_from_mms_data(next(elements), data_def.value_type))
+        if common.OptionalField.DATA_REFERENCE in optional_fields:
+            for ref, ref_str, _ in included_data_defs:
+                data_ref_str = _decode_visible_string(next(elements))
 
-    if common.OptionalField.REASON_FOR_INCLUSION in optional_fields:
-        reasons = collections.deque()
-        for exists in inclusion:
-            if not exists:
-                continue
+                if (data_ref_str != ref_str and
+                        data_ref_from_str(data_ref_str) != ref):
+                    raise Exception('data reference mismatch')
 
-            reason_bits = value_from_mms_data(
-                next(elements), common.BasicValueType.BIT_STRING)
+        values = [value_decoder(next(elements))
+                  for _, _, value_decoder in included_data_defs]
 
-            reasons.append({
-                common.Reason(index)
-                for index, i in enumerate(itertools.islice(reason_bits, 7))
-                if i})
+        if common.OptionalField.REASON_FOR_INCLUSION in optional_fields:
+            reasons = [_reasons_from_bits(_decode_bit_string(next(elements)))
+                       for _ in included_data_defs]
 
-    else:
-        reasons = None
-
-    data = collections.deque()
-    for exists, data_def in zip(inclusion, data_defs):
-        if not exists:
-            continue
-
-        data.append(
-            common.ReportData(
-                ref=data_def.ref,
-                value=values.popleft(),
-                reasons=(reasons.popleft() if reasons is not None else None)))
-
-    return common.Report(report_id=report_id,
-                         sequence_number=sequence_number,
-                         subsequence_number=subsequence_number,
-                         more_segments_follow=more_segments_follow,
-                         dataset=dataset,
-                         buffer_overflow=buffer_overflow,
-                         conf_revision=conf_revision,
-                         entry_time=time_of_entry,
-                         entry_id=entry_id,
-                         data=data)
+        else:
+            reasons = itertools.repeat(None)
+
+        data = [common.ReportData(ref=ref,
+                                  value=value,
+                                  reasons=reason)
+                for (ref, _, _), value, reason in zip(included_data_defs,
+                                                      values,
+                                                      reasons)]
+
+        return common.Report(report_id=report_id,
+                             sequence_number=sequence_number,
+                             subsequence_number=subsequence_number,
+                             more_segments_follow=more_segments_follow,
+                             dataset=dataset,
+                             buffer_overflow=buffer_overflow,
+                             conf_revision=conf_revision,
+                             entry_time=time_of_entry,
+                             entry_id=entry_id,
+                             data=data)
+
+    return decode
+
+
+def _reasons_from_bits(reason_bits):
+    return {common.Reason(index)
+            for index, i in enumerate(itertools.islice(reason_bits, 7))
+            if i}
 
 
 def _origin_to_mms_data(origin):
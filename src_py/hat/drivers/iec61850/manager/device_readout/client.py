@@ -1,4 +1,5 @@
 from collections.abc import Collection
+import asyncio
 import collections
 
 from hat import aio
@@ -12,6 +13,7 @@ class Client(aio.Resource):
 
     def __init__(self, conn: mms.Connection):
         self._conn = conn
+        self._send_semaphore = asyncio.Semaphore(conn.max_outstanding)
 
     @property
     def async_group(self) -> aio.Group:
@@ -50,7 +52,7 @@ class Client(aio.Resource):
         req = mms.GetVariableAccessAttributesRequest(
             encoder.data_ref_to_object_name(ref))
 
-        res = await self._conn.send_confirmed(req)
+        res = await self._send(req)
 
         if isinstance(res, mms.Error):
             raise Exception(f'received mms error {res}')
@@ -83,7 +85,7 @@ class Client(aio.Resource):
         req = mms.GetNamedVariableListAttributesRequest(
             encoder.dataset_ref_to_object_name(ref))
 
-        res = await self._conn.send_confirmed(req)
+        res = await self._send(req)
 
         if isinstance(res, mms.Error):
             raise Exception(f'received mms error {res}')
@@ -112,7 +114,7 @@ class Client(aio.Resource):
                                    fc='CF',
                                    names=(ref.name, 'ctlModel'))))])
 
-        res = await self._conn.send_confirmed(req)
+        res = await self._send(req)
 
         if isinstance(res, mms.Error):
             raise Exception(f'received mms error {res}')
@@ -153,7 +155,7 @@ class Client(aio.Resource):
                                    names=(ref.name, attr_type.value))))
             for attr_type in attr_types])
 
-        res = await self._conn.send_confirmed(req)
+        res = await self._send(req)
 
         if isinstance(res, mms.Error):
             raise Exception(f'received mms error {res}')
@@ -175,6 +177,10 @@ class Client(aio.Resource):
 
         return results
 
+    async def _send(self, req):
+        async with self._send_semaphore:
+            return await self._conn.send_confirmed(req)
+
     async def _get_name_list(self,
                              object_class: mms.ObjectClass,
                              object_scope: mms.ObjectScope
@@ -188,7 +194,7 @@ class Client(aio.Resource):
                 object_scope=object_scope,
                 continue_after=continue_after)
 
-            res = await self._conn.send_confirmed(req)
+            res = await self._send(req)
 
             if isinstance(res, mms.Error):
                 raise Exception(f'received mms error {res}')
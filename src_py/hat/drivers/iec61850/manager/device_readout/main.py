@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import logging
 import sys
+import time
 
 from hat import aio
 from hat import json
@@ -75,16 +76,25 @@ def create_argument_parser(subparsers) -> argparse.ArgumentParser:
         '--local-detail-calling', metavar='N', type=int, default=None,
         help="local detail calling (default not set)")
 
+    parser.add_argument(
+        '--max-devices', metavar='N', type=int, default=10,
+        help="maximum number of devices read out in parallel (default 10)")
+
     parser.add_argument(
         '--output', metavar='PATH', type=Path, default=Path('-'),
         help="output devices file path or - for stdout (default -)")
 
+    parser.add_argument(
+        '--output-dir', metavar='PATH', type=Path, default=None,
+        help="directory where readout result of each device is written "
+             "as soon as device readout is completed (default not set)")
+
     parser.add_argument(
         '--validate-output', action='store_true',
         help="validate output with JSON schema")
 
     parser.add_argument(
-        'host',
+        'hosts', metavar='host', nargs='+',
         help="remote host name or IP address")
 
     return parser
@@ -98,28 +108,20 @@ def main(args):
 
 
 async def async_main(args):
-    try:
-        result = await readout(
-            addr=tcp.Address(args.host, args.port),
-            local_tsel=args.local_tsel,
-            remote_tsel=args.remote_tsel,
-            local_ssel=args.local_ssel,
-            remote_ssel=args.remote_ssel,
-            local_psel=args.local_psel,
-            remote_psel=args.remote_psel,
-            local_ap_title=args.local_ap_title,
-            remote_ap_title=args.remote_ap_title,
-            local_ae_qualifier=args.local_ae_qualifier,
-            remote_ae_qualifier=args.remote_ae_qualifier,
-            local_detail_calling=args.local_detail_calling)
+    semaphore = asyncio.Semaphore(args.max_devices)
 
-    except Exception as e:
-        mlog.error('readout error: %s', e, exc_info=e)
+    results = await asyncio.gather(
+        *(_readout_device(args, host, semaphore) for host in args.hosts))
+
+    devices = [device
+               for result in results if result is not None
+               for device in result['devices']]
+    if not devices:
         return
 
-    if args.validate_output:
-        validator = json.DefaultSchemaValidator(common.json_schema_repo)
-        validator.validate('hat-drivers://iec61850/readout.yaml', result)
+    result = {'type': 'iec61850-readout',
+              'version': '1',
+              'devices': devices}
 
     try:
         if args.output == Path('-'):
@@ -130,3 +132,53 @@ async def async_main(args):
 
     except Exception as e:
         mlog.error('write output error: %s', e, exc_info=e)
+
+
+async def _readout_device(args, host, semaphore):
+    name = f'{host}:{args.port}'
+
+    async with semaphore:
+        start = time.monotonic()
+
+        try:
+            result = await readout(
+                addr=tcp.Address(host, args.port),
+                local_tsel=args.local_tsel,
+                remote_tsel=args.remote_tsel,
+                local_ssel=args.local_ssel,
+                remote_ssel=args.remote_ssel,
+                local_psel=args.local_psel,
+                remote_psel=args.remote_psel,
+                local_ap_title=args.local_ap_title,
+                remote_ap_title=args.remote_ap_title,
+                local_ae_qualifier=args.local_ae_qualifier,
+                remote_ae_qualifier=args.remote_ae_qualifier,
+                local_detail_calling=args.local_detail_calling)
+
+        except Exception as e:
+            mlog.error('%s: readout error after %.3f seconds: %s',
+                       name, time.monotonic() - start, e, exc_info=e)
+            return
+
+        mlog.info('%s: readout completed in %.3f seconds',
+                  name, time.monotonic() - start)
+
+    if args.validate_output:
+        try:
+            validator = json.DefaultSchemaValidator(common.json_schema_repo)
+            validator.validate('hat-drivers://iec61850/readout.yaml', result)
+
+        except Exception as e:
+            mlog.error('%s: output validation error: %s', name, e, exc_info=e)
+            return
+
+    if args.output_dir is not None:
+        try:
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+            json.encode_file(result,
+                             args.output_dir / f'{host}_{args.port}.json')
+
+        except Exception as e:
+            mlog.error('%s: write output error: %s', name, e, exc_info=e)
+
+    return result
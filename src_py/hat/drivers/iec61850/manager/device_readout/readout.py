@@ -1,5 +1,7 @@
 from collections.abc import Collection
+import asyncio
 import logging
+import typing
 
 from hat import aio
 from hat import asn1
@@ -28,13 +30,21 @@ async def readout(addr: tcp.Address,
                   remote_ae_qualifier: int | None = None,
                   local_detail_calling: int | None = None
                   ) -> common.ReadoutResult:
+    """Read out device configuration
+
+    Independent MMS requests are sent concurrently, limited by negotiated
+    maximum number of outstanding requests.
+
+    """
     value_types: dict[common.RootDataRef, common.ValueType | None] = {}
     dataset_data_refs: dict[common.DatasetRef, Collection[common.DataRef]] = {}
     rcb_attr_values: dict[common.RcbRef, dict[common.RcbAttrType,
                                               common.RcbAttrValue]] = {}
     cmd_models: dict[common.CommandRef, common.ControlModel] = {}
 
-    mlog.info('connecting to %s:%s...', addr.host, addr.port)
+    name = f'{addr.host}:{addr.port}'
+
+    mlog.info('%s: connecting...', name)
     conn = await mms.connect(addr=addr,
                              local_tsel=local_tsel,
                              remote_tsel=remote_tsel,
@@ -49,94 +59,23 @@ async def readout(addr: tcp.Address,
                              local_detail_calling=local_detail_calling)
 
     try:
-        mlog.info('connected')
+        mlog.info('%s: connected', name)
         client = Client(conn)
 
-        mlog.info('getting logical devices...')
+        mlog.info('%s: getting logical devices...', name)
         logical_devices = await client.get_logical_devices()
 
-        mlog.info('got %s logical devices', len(logical_devices))
-
-        for logical_device in logical_devices:
-            mlog.info('logical device %s: getting root data refs..',
-                      logical_device)
-            root_data_refs = await client.get_root_data_refs(logical_device)
-
-            mlog.info('logical device %s: got %s root data refs',
-                      logical_device, len(root_data_refs))
-
-            for root_data_ref in root_data_refs:
-                data_ref = common.DataRef(
-                    logical_device=root_data_ref.logical_device,
-                    logical_node=root_data_ref.logical_node,
-                    fc=root_data_ref.fc,
-                    names=(root_data_ref.name, ))
-                data_ref_str = encoder.data_ref_to_str(data_ref)
-
-                mlog.info('logical device %s: getting value type for %s...',
-                          logical_device, data_ref_str)
-                value_type = await client.get_value_type(data_ref)
-                value_types[root_data_ref] = value_type
-
-                mlog.info('logical device %s: got value type for %s',
-                          logical_device, data_ref_str)
-
-                if root_data_ref.fc == 'CO':
-                    cmd_ref = common.CommandRef(
-                        logical_device=root_data_ref.logical_device,
-                        logical_node=root_data_ref.logical_node,
-                        name=root_data_ref.name)
-
-                    mlog.info('logical device %s: getting control model '
-                              'for %s...',
-                              logical_device, data_ref_str)
-                    try:
-                        cmd_model = await client.get_control_model(cmd_ref)
-                        cmd_models[cmd_ref] = cmd_model
-
-                        mlog.info('logical device %s: got control model %s '
-                                  'for %s',
-                                  logical_device, cmd_model.name, data_ref_str)
-
-                    except Exception:
-                        mlog.info('logical device %s: could not get control '
-                                  'model for %s',
-                                  logical_device, data_ref_str)
-
-                elif root_data_ref.fc in ('BR', 'RP'):
-                    rcb_ref = common.RcbRef(
-                        logical_device=root_data_ref.logical_device,
-                        logical_node=root_data_ref.logical_node,
-                        type=common.RcbType(root_data_ref.fc),
-                        name=root_data_ref.name)
-
-                    mlog.info('logical device %s: getting rcb attr values '
-                              'for %s...',
-                              logical_device, data_ref_str)
-                    attr_values = await client.get_rcb_attr_values(rcb_ref)
-                    rcb_attr_values[rcb_ref] = attr_values
-
-                    mlog.info('logical device %s: got rcb attr values '
-                              'for %s...',
-                              logical_device, data_ref_str)
-
-            mlog.info('logical device %s: getting dataset refs..',
-                      logical_device)
-            dataset_refs = await client.get_dataset_refs(logical_device)
-
-            mlog.info('logical device %s: got %s dataset refs',
-                      logical_device, len(dataset_refs))
-
-            for dataset_ref in dataset_refs:
-                dataset_ref_str = encoder.dataset_ref_to_str(dataset_ref)
-
-                mlog.info('logical device %s: getting data refs for %s...',
-                          logical_device, dataset_ref_str)
-                data_refs = await client.get_dataset_data_refs(dataset_ref)
-                dataset_data_refs[dataset_ref] = data_refs
-
-                mlog.info('logical device %s: got %s data refs for %s',
-                          logical_device, len(data_refs), dataset_ref_str)
+        mlog.info('%s: got %s logical devices', name, len(logical_devices))
+
+        results = await asyncio.gather(
+            *(_readout_logical_device(client, name, logical_device)
+              for logical_device in logical_devices))
+
+        for result in results:
+            value_types.update(result.value_types)
+            dataset_data_refs.update(result.dataset_data_refs)
+            rcb_attr_values.update(result.rcb_attr_values)
+            cmd_models.update(result.cmd_models)
 
     finally:
         await aio.uncancellable(conn.async_close())
@@ -155,3 +94,118 @@ async def readout(addr: tcp.Address,
     return {'type': 'iec61850-readout',
             'version': '1',
             'devices': [device_conf]}
+
+
+class _LogicalDeviceResult(typing.NamedTuple):
+    value_types: dict[common.RootDataRef, common.ValueType | None]
+    dataset_data_refs: dict[common.DatasetRef, Collection[common.DataRef]]
+    rcb_attr_values: dict[common.RcbRef, dict[common.RcbAttrType,
+                                              common.RcbAttrValue]]
+    cmd_models: dict[common.CommandRef, common.ControlModel]
+
+
+async def _readout_logical_device(client, name, logical_device):
+    mlog.info('%s: logical device %s: getting root data refs and '
+              'dataset refs...', name, logical_device)
+    root_data_refs, dataset_refs = await asyncio.gather(
+        client.get_root_data_refs(logical_device),
+        client.get_dataset_refs(logical_device))
+
+    mlog.info('%s: logical device %s: got %s root data refs and '
+              '%s dataset refs',
+              name, logical_device, len(root_data_refs), len(dataset_refs))
+
+    root_data_results, dataset_results = await asyncio.gather(
+        asyncio.gather(*(_readout_root_data_ref(client, name, root_data_ref)
+                         for root_data_ref in root_data_refs)),
+        asyncio.gather(*(_readout_dataset(client, name, dataset_ref)
+                         for dataset_ref in dataset_refs)))
+
+    result = _LogicalDeviceResult(value_types={},
+                                  dataset_data_refs={},
+                                  rcb_attr_values={},
+                                  cmd_models={})
+
+    for root_data_ref, (value_type, cmd_model, attr_values) in zip(
+            root_data_refs, root_data_results):
+        result.value_types[root_data_ref] = value_type
+
+        if cmd_model is not None:
+            cmd_ref = common.CommandRef(
+                logical_device=root_data_ref.logical_device,
+                logical_node=root_data_ref.logical_node,
+                name=root_data_ref.name)
+            result.cmd_models[cmd_ref] = cmd_model
+
+        if attr_values is not None:
+            rcb_ref = common.RcbRef(
+                logical_device=root_data_ref.logical_device,
+                logical_node=root_data_ref.logical_node,
+                type=common.RcbType(root_data_ref.fc),
+                name=root_data_ref.name)
+            result.rcb_attr_values[rcb_ref] = attr_values
+
+    for dataset_ref, data_refs in zip(dataset_refs, dataset_results):
+        result.dataset_data_refs[dataset_ref] = data_refs
+
+    return result
+
+
+async def _readout_root_data_ref(client, name, root_data_ref):
+    data_ref = common.DataRef(logical_device=root_data_ref.logical_device,
+                              logical_node=root_data_ref.logical_node,
+                              fc=root_data_ref.fc,
+                              names=(root_data_ref.name, ))
+    data_ref_str = encoder.data_ref_to_str(data_ref)
+
+    mlog.debug('%s: getting value type for %s...', name, data_ref_str)
+    value_type = await client.get_value_type(data_ref)
+
+    mlog.debug('%s: got value type for %s', name, data_ref_str)
+
+    cmd_model = None
+    attr_values = None
+
+    if root_data_ref.fc == 'CO':
+        cmd_ref = common.CommandRef(
+            logical_device=root_data_ref.logical_device,
+            logical_node=root_data_ref.logical_node,
+            name=root_data_ref.name)
+
+        mlog.debug('%s: getting control model for %s...', name, data_ref_str)
+        try:
+            cmd_model = await client.get_control_model(cmd_ref)
+
+            mlog.debug('%s: got control model %s for %s',
+                       name, cmd_model.name, data_ref_str)
+
+        except Exception:
+            mlog.info('%s: could not get control model for %s',
+                      name, data_ref_str)
+
+    elif root_data_ref.fc in ('BR', 'RP'):
+        rcb_ref = common.RcbRef(
+            logical_device=root_data_ref.logical_device,
+            logical_node=root_data_ref.logical_node,
+            type=common.RcbType(root_data_ref.fc),
+            name=root_data_ref.name)
+
+        mlog.debug('%s: getting rcb attr values for %s...',
+                   name, data_ref_str)
+        attr_values = await client.get_rcb_attr_values(rcb_ref)
+
+        mlog.debug('%s: got rcb attr values for %s', name, data_ref_str)
+
+    return value_type, cmd_model, attr_values
+
+
+async def _readout_dataset(client, name, dataset_ref):
+    dataset_ref_str = encoder.dataset_ref_to_str(dataset_ref)
+
+    mlog.debug('%s: getting data refs for %s...', name, dataset_ref_str)
+    data_refs = await client.get_dataset_data_refs(dataset_ref)
+
+    mlog.debug('%s: got %s data refs for %s',
+               name, len(data_refs), dataset_ref_str)
+
+    return data_refs
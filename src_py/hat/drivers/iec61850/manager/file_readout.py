@@ -1,5 +1,7 @@
+from collections.abc import Collection, Iterable
 from pathlib import Path
 import argparse
+import collections
 import functools
 import logging
 import sys
@@ -25,6 +27,12 @@ def create_argument_parser(subparsers) -> argparse.ArgumentParser:
         '--validate-output', action='store_true',
         help="validate output with JSON schema")
 
+    parser.add_argument(
+        '--ied', metavar='NAME', dest='ied_names', action='append',
+        default=None,
+        help="read out only IED with provided name (can be set multiple "
+             "times) (default all IEDs)")
+
     parser.add_argument(
         'source', type=Path, default=Path('-'), nargs='?',
         help="input source file path or - for stdin (default -)")
@@ -35,7 +43,7 @@ def create_argument_parser(subparsers) -> argparse.ArgumentParser:
 def main(args):
     source = args.source if args.source != Path('-') else sys.stdin
 
-    result = readout(source)
+    result = readout(source, args.ied_names)
 
     if args.validate_output:
         validator = json.DefaultSchemaValidator(common.json_schema_repo)
@@ -48,39 +56,125 @@ def main(args):
         json.encode_file(result, args.output)
 
 
-def readout(source: typing.TextIO | Path
+def readout(source: typing.TextIO | Path,
+            ied_names: Collection[str] | None = None
             ) -> common.ReadoutResult:
-    root_el = _read_xml(source)
     return {'type': 'iec61850-readout',
             'version': '1',
-            'devices': list(_get_ieds(root_el))}
+            'devices': list(iter_devices(source, ied_names))}
+
+
+def iter_devices(source: typing.TextIO | Path,
+                 ied_names: Collection[str] | None = None
+                 ) -> Iterable[json.Data]:
+    """Iterate device configurations
+
+    Device configuration is yielded as soon as its IED is parsed. If
+    `source` is path, document is parsed in two passes (templates and
+    communication first, IEDs second) so that only single IED is kept in
+    memory at any time. If `ied_names` is set, only IEDs with those names
+    are parsed.
+
+    """
+    if isinstance(source, Path):
+        index = _read_index(source, ied_names, None)
+        ied_els = (el for el in _iter_top_els(source)
+                   if _is_selected_ied_el(el, ied_names))
+
+    else:
+        selected_ied_els = collections.deque()
+        index = _read_index(source, ied_names, selected_ied_els)
+        ied_els = _pop_ied_els(selected_ied_els)
+
+    for ied_el in ied_els:
+        yield from _get_ieds(index, ied_el)
+        ied_el.clear()
+
+
+class _Index(typing.NamedTuple):
+    types: dict[str, dict[str, xml.etree.ElementTree.Element]]
+    connected_aps: dict[tuple[str, str], xml.etree.ElementTree.Element]
+    value_types: dict[tuple[str, str, bool], list[json.Data] | None]
+    enumerated: dict[str, json.Data]
+
+
+def _read_index(source, ied_names, ied_els):
+    index = _Index(types={},
+                   connected_aps={},
+                   value_types={},
+                   enumerated={})
+
+    for el in _iter_top_els(source):
+        if el.tag == 'DataTypeTemplates':
+            for type_el in el:
+                index.types.setdefault(type_el.tag, {}).setdefault(
+                    type_el.get('id'), type_el)
 
+        elif el.tag == 'Communication':
+            for connected_ap_el in el.iterfind('./SubNetwork/ConnectedAP'):
+                key = (connected_ap_el.get('iedName'),
+                       connected_ap_el.get('apName'))
+                index.connected_aps.setdefault(key, connected_ap_el)
+
+        elif ied_els is not None and _is_selected_ied_el(el, ied_names):
+            ied_els.append(el)
+
+        else:
+            el.clear()
+
+    return index
+
+
+def _iter_top_els(source):
+    depth = 0
+    for event, el in xml.etree.ElementTree.iterparse(source,
+                                                     ('start', 'end')):
+        if event == 'start':
+            depth += 1
+            continue
+
+        depth -= 1
 
-def _read_xml(source):
-    it = xml.etree.ElementTree.iterparse(source)
-    for _, el in it:
         prefix, has_namespace, postfix = el.tag.partition('}')
         if has_namespace:
             el.tag = postfix
-    return it.root
 
+        if depth == 1:
+            yield el
 
-def _get_ieds(root_el):
-    for ied_el in root_el.findall("./IED"):
-        ied_name = ied_el.get('name')
-        if ied_name == 'TEMPLATE':
-            mlog.warning(
-                "ied name is 'TEMPLATE': possible insufficient structure")
 
-        for ap_el in ied_el.findall("./AccessPoint"):
-            if ap_el.find("./Server/LDevice") is None:
-                continue
+def _is_selected_ied_el(el, ied_names):
+    if el.tag != 'IED':
+        el.clear()
+        return False
+
+    if ied_names is not None and el.get('name') not in ied_names:
+        el.clear()
+        return False
+
+    return True
+
 
-            mlog.info('IED %s', ied_name)
-            yield _get_device(root_el=root_el,
-                              ied_el=ied_el,
-                              ap_el=ap_el,
-                              ied_name=ied_name)
+def _pop_ied_els(ied_els):
+    while ied_els:
+        yield ied_els.popleft()
+
+
+def _get_ieds(index, ied_el):
+    ied_name = ied_el.get('name')
+    if ied_name == 'TEMPLATE':
+        mlog.warning(
+            "ied name is 'TEMPLATE': possible insufficient structure")
+
+    for ap_el in ied_el.findall("./AccessPoint"):
+        if ap_el.find("./Server/LDevice") is None:
+            continue
+
+        mlog.info('IED %s', ied_name)
+        yield _get_device(index=index,
+                          ied_el=ied_el,
+                          ap_el=ap_el,
+                          ied_name=ied_name)
 
 
 def _get_dynamic(ied_el):
@@ -135,7 +229,7 @@ def _get_dynamic_max_dataset_attrs(ied_el):
         return int(max_dataset_attrs)
 
 
-def _get_device(root_el, ied_el, ap_el, ied_name):
+def _get_device(index, ied_el, ap_el, ied_name):
     ap_name = ap_el.get('name')
     datasets = []
     rcbs = []
@@ -153,19 +247,18 @@ def _get_device(root_el, ied_el, ap_el, ied_name):
                                                 ln_el.get('lnClass'),
                                                 ln_el.get('inst'))
             ln_type = ln_el.get('lnType')
-            ln_type_el = root_el.find(f"./DataTypeTemplates/LNodeType"
-                                      f"[@id='{ln_type}']")
+            ln_type_el = index.types.get('LNodeType', {}).get(ln_type)
 
             mlog.info('value types for %s/%s', logical_device, logical_node)
             value_types.extend(_get_value_types(
-                root_el, ln_type_el, logical_device, logical_node))
+                index, ln_type_el, logical_device, logical_node))
 
             datasets.extend(_get_datasets(
                 ied_name, logical_device, logical_node, ln_el))
 
             rcbs.extend(_get_rcbs(logical_device, logical_node, ln_el))
 
-            data.extend(_get_data(root_el=root_el,
+            data.extend(_get_data(index=index,
                                   ln_type_el=ln_type_el,
                                   ied_name=ied_name,
                                   ap_name=ap_name,
@@ -174,11 +267,11 @@ def _get_device(root_el, ied_el, ap_el, ied_name):
                                   datasets=datasets))
 
             commands.extend(_get_commands(
-                root_el, ln_el, ln_type_el, logical_device, logical_node))
+                index, ln_el, ln_type_el, logical_device, logical_node))
 
     device_conf = {
         'ied_name': ied_name,
-        'connection': _get_connection(root_el, ied_name, ap_name),
+        'connection': _get_connection(index, ied_name, ap_name),
         'value_types': value_types,
         'datasets': datasets,
         'rcbs': rcbs,
@@ -192,13 +285,13 @@ def _get_device(root_el, ied_el, ap_el, ied_name):
     return device_conf
 
 
-def _get_value_types(root_el, ln_type_el, logical_device, logical_node):
+def _get_value_types(index, ln_type_el, logical_device, logical_node):
     for do_el in ln_type_el:
         do_name = do_el.get('name')
         mlog.debug('value type %s/%s.%s',
                    logical_device, logical_node, do_name)
         try:
-            value_type_fc = _get_value_type(root_el, do_el, with_fc=True)
+            value_type_fc = _get_value_type(index, do_el, with_fc=True)
             fcs = set(_get_all_fcs(value_type_fc))
             for fc in fcs:
                 value_type = _get_value_type_for_fc(value_type_fc, fc)
@@ -320,14 +413,14 @@ def _get_rcb(rc_el, logical_device, logical_node):
             'integrity_period': int(rc_el.get('intgPd', '0'))}
 
 
-def _get_data(root_el, ln_type_el, ied_name, ap_name, logical_device,
+def _get_data(index, ln_type_el, ied_name, ap_name, logical_device,
               logical_node, datasets):
 
     def parse_node(node_el, names, fc):
         if not node_el.get('name'):
             return
 
-        type_el = _get_node_type_el(root_el, node_el)
+        type_el = _get_node_type_el(index, node_el)
         if type_el is None:
             return
 
@@ -336,7 +429,7 @@ def _get_data(root_el, ln_type_el, ied_name, ap_name, logical_device,
         cdc = type_el.get('cdc')
         if cdc:
             yield from _get_data_confs_for_cdc(
-                root_el, type_el, cdc, logical_device, logical_node, fc, names,
+                index, type_el, cdc, logical_device, logical_node, fc, names,
                 datasets)
 
         for nd_el in type_el:
@@ -353,10 +446,10 @@ def _get_data(root_el, ln_type_el, ied_name, ap_name, logical_device,
                          logical_device, logical_node, name, e, exc_info=e)
 
 
-def _get_commands(root_el, ln_el, ln_type_el, logical_device, logical_node):
+def _get_commands(index, ln_el, ln_type_el, logical_device, logical_node):
     for do_el in ln_type_el:
         do_name = do_el.get('name')
-        do_type_el = _get_node_type_el(root_el, do_el)
+        do_type_el = _get_node_type_el(index, do_el)
         if do_type_el is None:
             continue
 
@@ -383,7 +476,7 @@ def _get_commands(root_el, ln_el, ln_type_el, logical_device, logical_node):
                 # TODO: log for status-only command model?
                 continue
 
-            oper_type_el = _get_node_type_el(root_el, oper_el)
+            oper_type_el = _get_node_type_el(index, oper_el)
             if oper_type_el is None:
                 raise Exception('Oper type undefined')
 
@@ -393,7 +486,7 @@ def _get_commands(root_el, ln_el, ln_type_el, logical_device, logical_node):
             if ctl_val_el is None:
                 raise Exception('no ctlVal attribute')
 
-            value_type = _get_value_type(root_el, ctl_val_el)
+            value_type = _get_value_type(index, ctl_val_el)
             if value_type is None:
                 raise Exception('no value type')
 
@@ -408,7 +501,7 @@ def _get_commands(root_el, ln_el, ln_type_el, logical_device, logical_node):
 
             if ctl_val_el.get('bType') == 'Enum':
                 cmd['enumerated'] = _get_enumerated(
-                    root_el, ctl_val_el.get('type'))
+                    index, ctl_val_el.get('type'))
 
             yield cmd
 
@@ -417,11 +510,9 @@ def _get_commands(root_el, ln_el, ln_type_el, logical_device, logical_node):
                          logical_device, logical_node, do_name, e, exc_info=e)
 
 
-def _get_connection(root_el, ied_name, ap_name):
+def _get_connection(index, ied_name, ap_name):
     conn_conf = {}
-    connected_ap_el = root_el.find(f"./Communication/SubNetwork/ConnectedAP"
-                                   f"[@iedName='{ied_name}']"
-                                   f"[@apName='{ap_name}']")
+    connected_ap_el = index.connected_aps.get((ied_name, ap_name))
     if connected_ap_el is None:
         return conn_conf
 
@@ -447,7 +538,7 @@ def _get_connection(root_el, ied_name, ap_name):
     return conn_conf
 
 
-def _get_value_type(root_el, node_el, is_array_element=False, with_fc=False):
+def _get_value_type(index, node_el, is_array_element=False, with_fc=False):
     if node_el.tag == 'ProtNs':
         return
 
@@ -463,7 +554,7 @@ def _get_value_type(root_el, node_el, is_array_element=False, with_fc=False):
     array_length = int(node_el.get('count', '0'))
     if array_length and not is_array_element:
         element_type = _get_value_type(
-            root_el, node_el, is_array_element=True, with_fc=with_fc)
+            index, node_el, is_array_element=True, with_fc=with_fc)
         if element_type is None:
             return
 
@@ -480,20 +571,10 @@ def _get_value_type(root_el, node_el, is_array_element=False, with_fc=False):
         mlog.warning("attr 'type' does not exist for bType %s", node_btype)
         return
 
-    node_type_el = _get_node_type_el(root_el, node_el)
-    if node_type_el is None:
-        mlog.warning("type %s not defined", node_el.get('type'))
+    elements = _get_struct_elements(index, node_el, with_fc)
+    if elements is None:
         return
 
-    elements = []
-    for da_el in node_type_el:
-        el_type = _get_value_type(root_el, da_el, with_fc=with_fc)
-        if el_type is None:
-            continue
-
-        elements.append({'type': el_type,
-                         'name': da_el.get('name')})
-
     value_type = {'type': 'STRUCT',
                   'elements': elements}
     if with_fc:
@@ -501,6 +582,30 @@ def _get_value_type(root_el, node_el, is_array_element=False, with_fc=False):
     return value_type
 
 
+def _get_struct_elements(index, node_el, with_fc):
+    key = node_el.tag, node_el.get('type'), with_fc
+    if key in index.value_types:
+        return index.value_types[key]
+
+    node_type_el = _get_node_type_el(index, node_el)
+    if node_type_el is None:
+        mlog.warning("type %s not defined", node_el.get('type'))
+        elements = None
+
+    else:
+        elements = []
+        for da_el in node_type_el:
+            el_type = _get_value_type(index, da_el, with_fc=with_fc)
+            if el_type is None:
+                continue
+
+            elements.append({'type': el_type,
+                             'name': da_el.get('name')})
+
+    index.value_types[key] = elements
+    return elements
+
+
 def _get_all_fcs(value_type):
     if value_type is None:
         return
@@ -542,20 +647,28 @@ def _get_value_type_for_fc(value_type, fc):
         return value_type['type']
 
 
-def _get_node_type_el(root_el, node_el):
+def _get_node_type_el(index, node_el):
     node_type = node_el.get('type')
     if not node_type:
         return
 
+    type_tag = _get_node_type_tag(node_el)
+    if type_tag is not None:
+        return index.types.get(type_tag, {}).get(node_type)
+
+    mlog.warning('unexpected TAG %s', node_el.tag)
+    for type_els in index.types.values():
+        type_el = type_els.get(node_type)
+        if type_el is not None:
+            return type_el
+
+
+def _get_node_type_tag(node_el):
     if node_el.tag in {'DO', 'SDO'}:
-        type_tag = 'DOType'
-    elif node_el.tag in {'DA', 'BDA'}:
-        type_tag = 'DAType'
-    else:
-        mlog.warning('unexpected TAG %s', node_el.tag)
-        type_tag = '*'
-    return root_el.find(f"./DataTypeTemplates/{type_tag}"
-                        f"[@id='{node_type}']")
+        return 'DOType'
+
+    if node_el.tag in {'DA', 'BDA'}:
+        return 'DAType'
 
 
 def _names_from_fcda_name(name):
@@ -795,13 +908,19 @@ def _get_basic_value_type(node):
     # "SvOptFlds"
 
 
-def _get_enumerated(root_el, type_name):
-    type_el = root_el.find(f"./DataTypeTemplates/EnumType"
-                           f"[@id='{type_name}']")
-    return {'name': type_el.get('id'),
-            'values': [{'value': int(val_el.get('ord')),
-                        'label': val_el.text}
-                       for val_el in type_el if val_el.text]}
+def _get_enumerated(index, type_name):
+    enumerated = index.enumerated.get(type_name)
+    if enumerated is not None:
+        return enumerated
+
+    type_el = index.types.get('EnumType', {}).get(type_name)
+    enumerated = {'name': type_el.get('id'),
+                  'values': [{'value': int(val_el.get('ord')),
+                              'label': val_el.text}
+                             for val_el in type_el if val_el.text]}
+
+    index.enumerated[type_name] = enumerated
+    return enumerated
 
 
 def _create_logical_device(ied_name, inst):
@@ -812,7 +931,7 @@ def _create_logical_node(prefix, ln_class, inst):
     return f"{prefix or ''}{ln_class}{inst or ''}"
 
 
-def _get_data_conf(root_el, type_el, logical_device, logical_node, fc,
+def _get_data_conf(index, type_el, logical_device, logical_node, fc,
                    names, datasets, value_name=None, quality_name=None,
                    timestamp_name=None, selected_name=None, writable=False,
                    quality_ref=None, timestamp_ref=None, selected_ref=None):
@@ -836,7 +955,7 @@ def _get_data_conf(root_el, type_el, logical_device, logical_node, fc,
                     'logical_node': logical_node,
                     'fc': fc,
                     'names': names}
-        value_type = _get_value_type(root_el, value_da_el)
+        value_type = _get_value_type(index, value_da_el)
         if value_type is None:
             raise Exception('no value type')
 
@@ -882,7 +1001,7 @@ def _get_data_conf(root_el, type_el, logical_device, logical_node, fc,
 
         if value_da_el.get('bType') == 'Enum':
             data_conf['enumerated'] = _get_enumerated(
-                root_el, value_da_el.get('type'))
+                index, value_da_el.get('type'))
 
         yield data_conf
 
@@ -890,13 +1009,13 @@ def _get_data_conf(root_el, type_el, logical_device, logical_node, fc,
         if not value_da_type or btype != 'Struct':
             return
 
-        type_el = _get_node_type_el(root_el, value_da_el)
+        type_el = _get_node_type_el(index, value_da_el)
         if type_el is None:
             raise Exception('type undefined')
 
         names = [*data_ref['names'], da_name]
         yield from _get_data_conf(
-            root_el, type_el, logical_device, logical_node, fc, names,
+            index, type_el, logical_device, logical_node, fc, names,
             datasets,
             writable=writable,
             quality_ref=quality_ref,
@@ -938,10 +1057,10 @@ def _is_ref_in_dataset(ds_value_ref, ref):
     return ref['names'][:len(ds_value_ref['names'])] == ds_value_ref['names']
 
 
-def _get_data_confs_for_cdc(root_el, type_el, cdc,
+def _get_data_confs_for_cdc(index, type_el, cdc,
                             logical_device, logical_node, fc, names, datasets):
     get_data_conf = functools.partial(
-        _get_data_conf, root_el, type_el, logical_device, logical_node, fc,
+        _get_data_conf, index, type_el, logical_device, logical_node, fc,
         names, datasets)
     if cdc == 'SPS':
         yield from get_data_conf('stVal', 'q', 't')
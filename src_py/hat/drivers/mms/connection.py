@@ -109,9 +109,13 @@ async def connect(addr: tcp.Address,
         if initiate_res[0] != 'initiate-ResponsePDU':
             raise Exception("invalid initiate response")
 
-        return Connection(conn=conn,
-                          request_cb=request_cb,
-                          unconfirmed_cb=unconfirmed_cb)
+        return Connection(
+            conn=conn,
+            request_cb=request_cb,
+            unconfirmed_cb=unconfirmed_cb,
+            max_pdu_size=initiate_res[1].get('localDetailCalled'),
+            max_outstanding=initiate_res[1][
+                'negotiatedMaxServOutstandingCalling'])
 
     except Exception:
         await aio.uncancellable(conn.async_close())
@@ -200,9 +204,16 @@ class Server(aio.Resource):
     async def _on_connection(self, acse_conn):
         try:
             try:
-                conn = Connection(conn=acse_conn,
-                                  request_cb=self._request_cb,
-                                  unconfirmed_cb=self._unconfirmed_cb)
+                _, res_user_data = acse_conn.conn_res_user_data
+                initiate_res = _decode(res_user_data)
+
+                conn = Connection(
+                    conn=acse_conn,
+                    request_cb=self._request_cb,
+                    unconfirmed_cb=self._unconfirmed_cb,
+                    max_pdu_size=initiate_res[1].get('localDetailCalled'),
+                    max_outstanding=initiate_res[1][
+                        'negotiatedMaxServOutstandingCalled'])
 
             except Exception:
                 await aio.uncancellable(acse_conn.async_close())
@@ -241,8 +252,12 @@ class Connection(aio.Resource):
     def __init__(self,
                  conn: acse.Connection,
                  request_cb: RequestCb,
-                 unconfirmed_cb: UnconfirmedCb):
+                 unconfirmed_cb: UnconfirmedCb,
+                 max_pdu_size: int | None = None,
+                 max_outstanding: int = 1):
         self._conn = conn
+        self._max_pdu_size = max_pdu_size
+        self._max_outstanding = max_outstanding
         self._request_cb = request_cb
         self._unconfirmed_cb = unconfirmed_cb
         self._loop = asyncio.get_running_loop()
@@ -272,6 +287,20 @@ class Connection(aio.Resource):
         """Connection info"""
         return self._conn.info
 
+    @property
+    def max_pdu_size(self) -> int | None:
+        """Negotiated maximum MMS PDU size
+
+        `None` if maximum PDU size is not negotiated.
+
+        """
+        return self._max_pdu_size
+
+    @property
+    def max_outstanding(self) -> int:
+        """Negotiated maximum number of outstanding confirmed requests"""
+        return self._max_outstanding
+
     async def send_unconfirmed(self, unconfirmed: common.Unconfirmed):
         """Send unconfirmed message"""
         if not self.is_open:
@@ -1,3 +1,5 @@
+from hat.drivers.mqtt.broker import (listen,
+                                     Broker)
 from hat.drivers.mqtt.client import (Msg,
                                      MsgCb,
                                      connect,
@@ -11,9 +13,15 @@ from hat.drivers.mqtt.common import (UInt32,
                                      MqttError,
                                      Subscription,
                                      is_error_reason)
+from hat.drivers.mqtt.router import (TopicFilterTrie,
+                                     create_router,
+                                     Router,
+                                     Route)
 
 
-__all__ = ['Msg',
+__all__ = ['listen',
+           'Broker',
+           'Msg',
            'MsgCb',
            'connect',
            'Client',
@@ -25,4 +33,8 @@ __all__ = ['Msg',
            'Reason',
            'MqttError',
            'Subscription',
-           'is_error_reason']
+           'is_error_reason',
+           'TopicFilterTrie',
+           'create_router',
+           'Router',
+           'Route']
@@ -0,0 +1,495 @@
+"""Minimal MQTT 5 broker"""
+
+import collections
+import contextlib
+import itertools
+import logging
+import typing
+
+from hat import aio
+
+from hat.drivers import tcp
+from hat.drivers.mqtt import common
+from hat.drivers.mqtt import transport
+from hat.drivers.mqtt.router import TopicFilterTrie
+
+
+mlog: logging.Logger = logging.getLogger(__name__)
+
+
+async def listen(addr: tcp.Address,
+                 *,
+                 topic_alias_maximum: common.UInt16 = 0xffff,
+                 queue_size: int = 1024,
+                 connect_timeout: float = 30,
+                 **kwargs
+                 ) -> 'Broker':
+    """Create listening broker
+
+    Broker is intended as local stand-in for testing and benchmarking
+    clients. It supports publishing with all QoS levels, retained messages,
+    topic aliases and subscription identifiers. Sessions are not persisted,
+    will messages, shared subscriptions and authentication are not supported.
+
+    Each session has outgoing queue of size `queue_size`. Routing of
+    published messages waits for free space in subscriber's queue.
+
+    Additional arguments are passed directly to `hat.drivers.tcp.listen`.
+
+    """
+    broker = Broker()
+    broker._topic_alias_maximum = topic_alias_maximum
+    broker._queue_size = queue_size
+    broker._connect_timeout = connect_timeout
+    broker._sessions = {}
+    broker._subscriptions = TopicFilterTrie()
+    broker._retained = {}
+
+    broker._srv = await transport.listen(broker._on_connection, addr,
+                                         **kwargs)
+
+    return broker
+
+
+class Broker(aio.Resource):
+    """MQTT broker
+
+    For creating new instance of this class see `listen` coroutine.
+
+    """
+
+    @property
+    def async_group(self) -> aio.Group:
+        return self._srv.async_group
+
+    @property
+    def info(self) -> tcp.ServerInfo:
+        return self._srv.info
+
+    async def _on_connection(self, conn):
+        try:
+            req = await aio.wait_for(conn.receive(), self._connect_timeout)
+
+            if not isinstance(req, transport.ConnectPacket):
+                raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                       'unexpected packet')
+
+            client_id = (req.client_identifier if req.client_identifier
+                         else f'hat-{id(conn)}')
+
+            res = transport.ConnAckPacket(
+                session_present=False,
+                reason=common.Reason.SUCCESS,
+                session_expiry_interval=None,
+                receive_maximum=0xffff,
+                maximum_qos=common.QoS.EXACLTY_ONCE,
+                retain_available=True,
+                maximum_packet_size=None,
+                assigned_client_identifier=(None if req.client_identifier
+                                            else client_id),
+                topic_alias_maximum=self._topic_alias_maximum,
+                reason_string=None,
+                user_properties=[],
+                wildcard_subscription_available=True,
+                subscription_identifier_available=True,
+                shared_subscription_available=False,
+                server_keep_alive=None,
+                response_information=None,
+                server_reference=None,
+                authentication_method=None,
+                authentication_data=None)
+            await conn.send(res)
+
+        except Exception as e:
+            mlog.warning('connection error: %s', e, exc_info=e)
+            await aio.uncancellable(conn.async_close())
+            return
+
+        previous_session = self._sessions.pop(client_id, None)
+        if previous_session:
+            previous_session._set_disconnect_reason(
+                common.Reason.SESSION_TAKEN_OVER)
+            previous_session.close()
+
+        session = _Session()
+        session._async_group = self.async_group.create_subgroup()
+        session._broker = self
+        session._conn = conn
+        session._client_id = client_id
+        session._log = _create_logger(conn.info, client_id)
+        session._send_queue = aio.Queue(self._queue_size)
+        session._disconnect_reason = common.Reason.SUCCESS
+        session._subscriptions = {}
+        session._topic_aliases = {}
+        session._topic_alias_registry = common.TopicAliasRegistry(
+            req.topic_alias_maximum)
+        session._received_identifiers = set()
+        session._sent_identifiers = set()
+        session._next_identifier = 1
+
+        self._sessions[client_id] = session
+
+        try:
+            session.async_group.spawn(aio.call_on_cancel, session._on_close)
+            session.async_group.spawn(aio.call_on_done, conn.wait_closing(),
+                                      session.close)
+            session.async_group.spawn(session._receive_loop)
+            session.async_group.spawn(session._send_loop)
+
+        except BaseException:
+            await aio.uncancellable(session.async_close())
+            raise
+
+    def _remove_session(self, session):
+        if self._sessions.get(session._client_id) is session:
+            del self._sessions[session._client_id]
+
+        for topic_filter, entry in session._subscriptions.items():
+            self._subscriptions.remove(topic_filter, entry)
+
+    async def _publish(self, packet, sender):
+        if packet.retain:
+            if packet.payload:
+                self._retained[packet.topic_name] = packet
+
+            else:
+                self._retained.pop(packet.topic_name, None)
+
+        session_entries = collections.defaultdict(list)
+        for entry in self._subscriptions.match(packet.topic_name):
+            if entry.subscription.no_local and entry.session is sender:
+                continue
+
+            session_entries[entry.session].append(entry)
+
+        for session, entries in session_entries.items():
+            qos = min(packet.qos.value,
+                      max(entry.subscription.maximum_qos.value
+                          for entry in entries))
+            retain = packet.retain and any(
+                entry.subscription.retain_as_published for entry in entries)
+            subscription_identifiers = [entry.identifier for entry in entries
+                                        if entry.identifier is not None]
+
+            await session._send_publish(
+                packet._replace(qos=common.QoS(qos),
+                                retain=retain,
+                                subscription_identifiers=(
+                                    subscription_identifiers)))
+
+        return bool(session_entries)
+
+    def _get_retained(self, topic_filter):
+        trie = TopicFilterTrie()
+        trie.add(topic_filter, None)
+
+        for topic_name, packet in self._retained.items():
+            for _ in trie.match(topic_name):
+                yield packet
+
+
+class _Session(aio.Resource):
+
+    @property
+    def async_group(self) -> aio.Group:
+        return self._async_group
+
+    def _set_disconnect_reason(self, reason):
+        if common.is_error_reason(self._disconnect_reason):
+            return
+
+        self._disconnect_reason = reason
+
+    async def _on_close(self):
+        self._send_queue.close()
+        self._broker._remove_session(self)
+
+        if self._conn.is_open:
+            with contextlib.suppress(Exception):
+                await self._conn.send(
+                    transport.DisconnectPacket(
+                        reason=self._disconnect_reason,
+                        session_expiry_interval=None,
+                        reason_string=None,
+                        user_properties=[],
+                        server_reference=None))
+
+        await self._conn.async_close()
+
+    async def _send_publish(self, packet):
+        with contextlib.suppress(aio.QueueClosedError):
+            await self._send_queue.put(packet)
+
+    async def _send_loop(self):
+        try:
+            while True:
+                packet = await self._send_queue.get()
+
+                if packet.qos == common.QoS.AT_MOST_ONCE:
+                    identifier = None
+
+                else:
+                    identifier = self._get_free_identifier()
+                    if identifier is None:
+                        self._log.warning('free packet identifier not '
+                                          'available - dropping message')
+                        continue
+
+                    self._sent_identifiers.add(identifier)
+
+                topic_name, topic_alias = \
+                    self._topic_alias_registry.get_alias(packet.topic_name)
+
+                await self._conn.send(
+                    packet._replace(duplicate=False,
+                                    topic_name=topic_name,
+                                    topic_alias=topic_alias,
+                                    packet_identifier=identifier))
+
+        except (ConnectionError, aio.QueueClosedError):
+            pass
+
+        except Exception as e:
+            self._log.error('send loop error: %s', e, exc_info=e)
+            self._set_disconnect_reason(common.Reason.UNSPECIFIED_ERROR)
+
+        finally:
+            self.close()
+
+    async def _receive_loop(self):
+        try:
+            while True:
+                packet = await self._conn.receive()
+
+                if isinstance(packet, transport.PublishPacket):
+                    await self._process_publish(packet)
+
+                elif isinstance(packet, transport.PubRelPacket):
+                    self._received_identifiers.discard(
+                        packet.packet_identifier)
+
+                    await self._conn.send(transport.PubCompPacket(
+                        packet_identifier=packet.packet_identifier,
+                        reason=common.Reason.SUCCESS,
+                        reason_string=None,
+                        user_properties=[]))
+
+                elif isinstance(packet, transport.PubAckPacket):
+                    self._sent_identifiers.discard(packet.packet_identifier)
+
+                elif isinstance(packet, transport.PubRecPacket):
+                    if common.is_error_reason(packet.reason):
+                        self._sent_identifiers.discard(
+                            packet.packet_identifier)
+                        continue
+
+                    await self._conn.send(transport.PubRelPacket(
+                        packet_identifier=packet.packet_identifier,
+                        reason=common.Reason.SUCCESS,
+                        reason_string=None,
+                        user_properties=[]))
+
+                elif isinstance(packet, transport.PubCompPacket):
+                    self._sent_identifiers.discard(packet.packet_identifier)
+
+                elif isinstance(packet, transport.SubscribePacket):
+                    await self._process_subscribe(packet)
+
+                elif isinstance(packet, transport.UnsubscribePacket):
+                    await self._process_unsubscribe(packet)
+
+                elif isinstance(packet, transport.PingReqPacket):
+                    await self._conn.send(transport.PingResPacket())
+
+                elif isinstance(packet, transport.DisconnectPacket):
+                    self._log.debug('received disconnect packet: %s: %s',
+                                    packet.reason, packet.reason_string)
+
+                    self._conn.close()
+                    break
+
+                elif isinstance(packet, transport.AuthPacket):
+                    raise common.MqttError(
+                        common.Reason.IMPLEMENTATION_SPECIFIC_ERROR,
+                        'auth packet not supported')
+
+                else:
+                    raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                           'unexpected packet')
+
+        except ConnectionError:
+            pass
+
+        except common.MqttError as e:
+            self._log.error('receive loop mqtt error: %s', e, exc_info=e)
+            self._set_disconnect_reason(e.reason)
+
+        except Exception as e:
+            self._log.error('receive loop error: %s', e, exc_info=e)
+            self._set_disconnect_reason(common.Reason.UNSPECIFIED_ERROR)
+
+        finally:
+            self.close()
+
+    async def _process_publish(self, packet):
+        topic_name = self._resolve_topic_alias(packet)
+        identifier = packet.packet_identifier
+
+        if '+' in topic_name or '#' in topic_name:
+            raise common.MqttError(common.Reason.TOPIC_NAME_INVALID,
+                                   'invalid topic name')
+
+        packet = packet._replace(topic_name=topic_name,
+                                 topic_alias=None,
+                                 packet_identifier=None)
+
+        if packet.qos == common.QoS.AT_MOST_ONCE:
+            await self._broker._publish(packet, self)
+            return
+
+        if packet.qos == common.QoS.AT_LEAST_ONCE:
+            matched = await self._broker._publish(packet, self)
+
+            await self._conn.send(transport.PubAckPacket(
+                packet_identifier=identifier,
+                reason=(common.Reason.SUCCESS if matched
+                        else common.Reason.NO_MATCHING_SUBSCRIBERS),
+                reason_string=None,
+                user_properties=[]))
+            return
+
+        if identifier in self._received_identifiers:
+            matched = True
+
+        else:
+            self._received_identifiers.add(identifier)
+            matched = await self._broker._publish(packet, self)
+
+        await self._conn.send(transport.PubRecPacket(
+            packet_identifier=identifier,
+            reason=(common.Reason.SUCCESS if matched
+                    else common.Reason.NO_MATCHING_SUBSCRIBERS),
+            reason_string=None,
+            user_properties=[]))
+
+    async def _process_subscribe(self, packet):
+        reasons = collections.deque()
+        retained = collections.deque()
+
+        for subscription in packet.subscriptions:
+            topic_filter = subscription.topic_filter
+
+            if topic_filter.startswith('$share/'):
+                reasons.append(
+                    common.Reason.SHARED_SUBSCRIPTIONS_NOT_SUPPORTED)
+                continue
+
+            entry = _SubscriptionEntry(
+                session=self,
+                subscription=subscription,
+                identifier=packet.subscription_identifier)
+
+            try:
+                self._broker._subscriptions.add(topic_filter, entry)
+
+            except ValueError:
+                reasons.append(common.Reason.TOPIC_FILTER_INVALID)
+                continue
+
+            previous_entry = self._subscriptions.get(topic_filter)
+            if previous_entry:
+                self._broker._subscriptions.remove(topic_filter,
+                                                   previous_entry)
+
+            self._subscriptions[topic_filter] = entry
+            reasons.append(common.Reason(subscription.maximum_qos.value))
+
+            if (subscription.retain_handling ==
+                    common.RetainHandling.DONT_SEND or
+                    (subscription.retain_handling ==
+                     common.RetainHandling.SEND_ON_NEW_SUBSCRIBE and
+                     previous_entry)):
+                continue
+
+            for retained_packet in self._broker._get_retained(topic_filter):
+                retained.append(retained_packet._replace(
+                    qos=common.QoS(min(retained_packet.qos.value,
+                                       subscription.maximum_qos.value)),
+                    subscription_identifiers=(
+                        [entry.identifier] if entry.identifier is not None
+                        else [])))
+
+        await self._conn.send(transport.SubAckPacket(
+            packet_identifier=packet.packet_identifier,
+            reason_string=None,
+            user_properties=[],
+            reasons=reasons))
+
+        for retained_packet in retained:
+            await self._send_publish(retained_packet)
+
+    async def _process_unsubscribe(self, packet):
+        reasons = collections.deque()
+
+        for topic_filter in packet.topic_filters:
+            entry = self._subscriptions.pop(topic_filter, None)
+            if not entry:
+                reasons.append(common.Reason.NO_SUBSCRIPTION_EXISTED)
+                continue
+
+            self._broker._subscriptions.remove(topic_filter, entry)
+            reasons.append(common.Reason.SUCCESS)
+
+        await self._conn.send(transport.UnsubAckPacket(
+            packet_identifier=packet.packet_identifier,
+            reason_string=None,
+            user_properties=[],
+            reasons=reasons))
+
+    def _resolve_topic_alias(self, packet):
+        if packet.topic_alias is None:
+            if not packet.topic_name:
+                raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                       'missing topic name')
+
+            return packet.topic_name
+
+        if not (0 < packet.topic_alias <= self._broker._topic_alias_maximum):
+            raise common.MqttError(common.Reason.TOPIC_ALIAS_INVALID,
+                                   'invalid topic alias')
+
+        if packet.topic_name:
+            self._topic_aliases[packet.topic_alias] = packet.topic_name
+            return packet.topic_name
+
+        topic_name = self._topic_aliases.get(packet.topic_alias)
+        if topic_name is None:
+            raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                   'unknown topic alias')
+
+        return topic_name
+
+    def _get_free_identifier(self):
+        for i in itertools.chain(range(self._next_identifier, 0x10000),
+                                 range(1, self._next_identifier)):
+            if i not in self._sent_identifiers:
+                self._next_identifier = i % 0xffff + 1
+                return i
+
+
+class _SubscriptionEntry(typing.NamedTuple):
+    session: _Session
+    subscription: common.Subscription
+    identifier: common.UIntVar | None
+
+
+def _create_logger(info, client_id):
+    extra = {'meta': {'type': 'MqttBroker',
+                      'name': info.name,
+                      'client_id': client_id,
+                      'local_addr': {'host': info.local_addr.host,
+                                     'port': info.local_addr.port},
+                      'remote_addr': {'host': info.remote_addr.host,
+                                      'port': info.remote_addr.port}}}
+
+    return logging.LoggerAdapter(mlog, extra)
@@ -27,6 +27,7 @@ class Msg(typing.NamedTuple):
     correlation_data: common.Binary | None = None
     user_properties: Collection[tuple[common.String, common.String]] = []
     content_type: common.String | None = None
+    subscription_identifiers: Collection[common.UIntVar] = []
 
 
 MsgCb: typing.TypeAlias = aio.AsyncCallable[['Client', Msg], None]
@@ -41,6 +42,7 @@ async def connect(addr: tcp.Address,
                   password: common.Binary | None = None,
                   ping_delay: float | None = None,
                   response_timeout: float = 30,
+                  topic_alias_maximum: common.UInt16 = 0,
                   **kwargs
                   ) -> 'Client':
     conn = await transport.connect(addr, **kwargs)
@@ -51,7 +53,8 @@ async def connect(addr: tcp.Address,
                                      ping_delay=ping_delay,
                                      client_id=client_id,
                                      user_name=user_name,
-                                     password=password)
+                                     password=password,
+                                     topic_alias_maximum=topic_alias_maximum)
         await conn.send(req)
 
         res = await aio.wait_for(conn.receive(), response_timeout)
@@ -88,6 +91,12 @@ async def connect(addr: tcp.Address,
     client._keep_alive = (req.keep_alive if res.server_keep_alive is None
                           else res.server_keep_alive)
     client._response_information = res.response_information
+    client._subscription_identifier_available = \
+        res.subscription_identifier_available
+    client._topic_alias_maximum = topic_alias_maximum
+    client._topic_aliases = {}
+    client._topic_alias_registry = common.TopicAliasRegistry(
+        res.topic_alias_maximum)
 
     try:
         client.async_group.spawn(aio.call_on_cancel, client._on_close)
@@ -128,6 +137,10 @@ class Client(aio.Resource):
     def response_information(self) -> common.String | None:
         return self._response_information
 
+    @property
+    def subscription_identifier_available(self) -> bool:
+        return self._subscription_identifier_available
+
     async def publish(self, msg: Msg):
         if msg.qos.value > self._maximum_qos.value:
             raise Exception(f'maximum supported QoS is {self._maximum_qos}')
@@ -143,14 +156,17 @@ class Client(aio.Resource):
             raise ValueError('unsupported QoS')
 
         try:
+            topic_name, topic_alias = self._topic_alias_registry.get_alias(
+                msg.topic)
+
             req = transport.PublishPacket(
                 duplicate=False,
-                qos=self._maximum_qos,
+                qos=msg.qos,
                 retain=msg.retain,
-                topic_name=msg.topic,
+                topic_name=topic_name,
                 packet_identifier=identifier,
                 message_expiry_interval=msg.message_expiry_interval,
-                topic_alias=None,
+                topic_alias=topic_alias,
                 response_topic=msg.response_topic,
                 correlation_data=msg.correlation_data,
                 user_properties=msg.user_properties,
@@ -205,15 +221,17 @@ class Client(aio.Resource):
                 self._identifier_registry.release_identifier(identifier)
 
     async def subscribe(self,
-                        subscriptions: Collection[common.Subscription]
+                        subscriptions: Collection[common.Subscription],
+                        subscription_identifier: common.UIntVar | None = None
                         ) -> Collection[common.Reason]:
         identifier = await self._identifier_registry.allocate_identifier()
 
         try:
-            req = transport.SubscribePacket(packet_identifier=identifier,
-                                            subscription_identifier=None,
-                                            user_properties=[],
-                                            subscriptions=subscriptions)
+            req = transport.SubscribePacket(
+                packet_identifier=identifier,
+                subscription_identifier=subscription_identifier,
+                user_properties=[],
+                subscriptions=subscriptions)
 
             future = self._identifier_registry.create_future(identifier)
             await self._conn.send(req)
@@ -399,9 +417,11 @@ class Client(aio.Resource):
             self.close()
 
     async def _process_publish_packet(self, packet):
+        topic = self._resolve_topic_alias(packet)
+
         if self._msg_cb:
             msg = Msg(
-                topic=packet.topic_name,
+                topic=topic,
                 payload=packet.payload,
                 qos=packet.qos,
                 retain=packet.retain,
@@ -409,14 +429,15 @@ class Client(aio.Resource):
                 response_topic=packet.response_topic,
                 correlation_data=packet.correlation_data,
                 user_properties=packet.user_properties,
-                content_type=packet.content_type)
+                content_type=packet.content_type,
+                subscription_identifiers=packet.subscription_identifiers)
 
             await aio.call(self._msg_cb, self, msg)
 
-        if msg.qos == common.QoS.AT_MOST_ONCE:
+        if packet.qos == common.QoS.AT_MOST_ONCE:
             return
 
-        if msg.qos == common.QoS.AT_LEAST_ONCE:
+        if packet.qos == common.QoS.AT_LEAST_ONCE:
             res = transport.PubAckPacket(
                 packet_identifier=packet.packet_identifier,
                 reason=common.Reason.SUCCESS,
@@ -426,7 +447,7 @@ class Client(aio.Resource):
             await self._send(res)
             return
 
-        if msg.qos != common.QoS.EXACLTY_ONCE:
+        if packet.qos != common.QoS.EXACLTY_ONCE:
             raise ValueError('unsupported QoS')
 
         req = transport.PubRecPacket(
@@ -437,6 +458,29 @@ class Client(aio.Resource):
 
         await self._conn.send(req)
 
+    def _resolve_topic_alias(self, packet):
+        if packet.topic_alias is None:
+            if not packet.topic_name:
+                raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                       'missing topic name')
+
+            return packet.topic_name
+
+        if not (0 < packet.topic_alias <= self._topic_alias_maximum):
+            raise common.MqttError(common.Reason.TOPIC_ALIAS_INVALID,
+                                   'invalid topic alias')
+
+        if packet.topic_name:
+            self._topic_aliases[packet.topic_alias] = packet.topic_name
+            return packet.topic_name
+
+        topic = self._topic_aliases.get(packet.topic_alias)
+        if topic is None:
+            raise common.MqttError(common.Reason.PROTOCOL_ERROR,
+                                   'unknown topic alias')
+
+        return topic
+
     async def _process_publish_release_packet(self, packet):
 
         # TODO should remember previous publish packet and check response
@@ -563,7 +607,7 @@ class _IdentifierRegistry(aio.Resource):
 
 
 def _create_connect_packet(will_msg, will_delay, ping_delay, client_id,
-                           user_name, password):
+                           user_name, password, topic_alias_maximum):
     if will_msg:
         will = transport.Will(
             qos=will_msg.qos,
@@ -598,7 +642,7 @@ def _create_connect_packet(will_msg, will_delay, ping_delay, client_id,
         session_expiry_interval=0,
         receive_maximum=0xffff,
         maximum_packet_size=None,
-        topic_alias_maximum=0,
+        topic_alias_maximum=topic_alias_maximum,
         request_response_information=True,
         request_problem_information=True,
         user_properties=[],
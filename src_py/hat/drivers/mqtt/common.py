@@ -1,3 +1,4 @@
+import collections
 import enum
 import typing
 
@@ -109,3 +110,35 @@ class Subscription(typing.NamedTuple):
 
 def is_error_reason(reason: Reason) -> bool:
     return reason.value >= 0x80
+
+
+class TopicAliasRegistry:
+    """Outbound topic alias registry"""
+
+    def __init__(self, topic_alias_maximum: UInt16):
+        self._topic_alias_maximum = topic_alias_maximum
+        self._topic_aliases = collections.OrderedDict()
+
+    def get_alias(self, topic: String) -> tuple[String, UInt16 | None]:
+        """Get topic name and topic alias used for publishing `topic`
+
+        Once alias is established, empty topic name is returned. If all
+        aliases are in use, least recently used alias is reassigned.
+
+        """
+        if not self._topic_alias_maximum:
+            return topic, None
+
+        alias = self._topic_aliases.get(topic)
+        if alias is not None:
+            self._topic_aliases.move_to_end(topic)
+            return '', alias
+
+        if len(self._topic_aliases) < self._topic_alias_maximum:
+            alias = len(self._topic_aliases) + 1
+
+        else:
+            _, alias = self._topic_aliases.popitem(last=False)
+
+        self._topic_aliases[topic] = alias
+        return topic, alias
@@ -0,0 +1,324 @@
+from collections.abc import Iterable
+import contextlib
+import itertools
+import logging
+import typing
+
+from hat import aio
+
+from hat.drivers import tcp
+from hat.drivers.mqtt import common
+from hat.drivers.mqtt.client import Client, MsgCb, connect
+
+
+mlog: logging.Logger = logging.getLogger(__name__)
+
+
+class TopicFilterTrie:
+    """Topic filter trie
+
+    Values are stored under topic filters which can contain ``+`` and ``#``
+    wildcards. Matching topic name against all stored topic filters takes
+    time proportional to topic name depth, regardless of number of stored
+    topic filters.
+
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def add(self, topic_filter: common.String, value: typing.Any):
+        node = self._root
+        for level in _get_topic_filter_levels(topic_filter):
+            child = node.children.get(level)
+            if child is None:
+                child = _TrieNode()
+                node.children[level] = child
+
+            node = child
+
+        node.values.append(value)
+
+    def remove(self, topic_filter: common.String, value: typing.Any):
+        levels = _get_topic_filter_levels(topic_filter)
+        nodes = [self._root]
+
+        for level in levels:
+            node = nodes[-1].children.get(level)
+            if node is None:
+                return
+
+            nodes.append(node)
+
+        with contextlib.suppress(ValueError):
+            nodes[-1].values.remove(value)
+
+        for level, parent, node in zip(reversed(levels),
+                                       reversed(nodes[:-1]),
+                                       reversed(nodes[1:])):
+            if node.values or node.children:
+                break
+
+            del parent.children[level]
+
+    def match(self, topic_name: common.String) -> Iterable[typing.Any]:
+        """Get values of all topic filters matching `topic_name`
+
+        Wildcards don't match first topic level starting with ``$``.
+
+        """
+        nodes = [self._root]
+
+        for i, level in enumerate(topic_name.split('/')):
+            wildcards = i > 0 or not level.startswith('$')
+            next_nodes = []
+
+            for node in nodes:
+                if wildcards:
+                    multi_level_node = node.children.get('#')
+                    if multi_level_node:
+                        yield from multi_level_node.values
+
+                    single_level_node = node.children.get('+')
+                    if single_level_node:
+                        next_nodes.append(single_level_node)
+
+                child = node.children.get(level)
+                if child:
+                    next_nodes.append(child)
+
+            nodes = next_nodes
+            if not nodes:
+                return
+
+        for node in nodes:
+            yield from node.values
+
+            multi_level_node = node.children.get('#')
+            if multi_level_node:
+                yield from multi_level_node.values
+
+
+async def create_router(addr: tcp.Address,
+                        *,
+                        subscription_identifiers: bool = True,
+                        **kwargs
+                        ) -> 'Router':
+    """Connect client and create router
+
+    If `subscription_identifiers` is set and broker supports subscription
+    identifiers, each topic filter is subscribed with its own subscription
+    identifier and received messages are dispatched based on subscription
+    identifiers. Otherwise, received messages are dispatched by matching
+    topic name against registered topic filters.
+
+    Additional arguments are passed directly to `hat.drivers.mqtt.connect`.
+
+    """
+    router = Router()
+    router._trie = TopicFilterTrie()
+    router._entries = {}
+    router._identifier_entries = {}
+    router._next_identifier = 1
+
+    router._client = await connect(addr, msg_cb=router._on_msg, **kwargs)
+    router._subscription_identifiers = (
+        subscription_identifiers and
+        router._client.subscription_identifier_available)
+
+    return router
+
+
+class Router(aio.Resource):
+    """Subscription router
+
+    For creating new instance of this class see `create_router` coroutine.
+
+    """
+
+    @property
+    def async_group(self) -> aio.Group:
+        return self._client.async_group
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    async def subscribe(self,
+                        subscription: common.Subscription,
+                        msg_cb: MsgCb,
+                        queue_size: int = 1024
+                        ) -> 'Route':
+        """Register `msg_cb` for messages matching subscription topic filter
+
+        Each route has its own queue of received messages, so slow `msg_cb`
+        doesn't delay processing of other messages until route's queue is
+        full. Topic filter is subscribed with broker only once - subscription
+        options of first route registered for topic filter are used.
+
+        Closing route unsubscribes topic filter once no other route uses it.
+
+        """
+        topic_filter = subscription.topic_filter
+        entry = self._entries.get(topic_filter)
+
+        if entry is None:
+            _get_topic_filter_levels(topic_filter)
+
+            identifier = (self._get_free_identifier()
+                          if self._subscription_identifiers else None)
+            entry = _Entry(topic_filter=topic_filter,
+                           identifier=identifier,
+                           routes=[])
+
+            self._add_entry(entry)
+
+            try:
+                reasons = await self._client.subscribe(
+                    [subscription], subscription_identifier=identifier)
+
+                reason = next(iter(reasons))
+                if common.is_error_reason(reason):
+                    raise common.MqttError(reason, None)
+
+            except BaseException:
+                if not entry.routes:
+                    self._remove_entry(entry)
+
+                raise
+
+        route = Route()
+        route._async_group = self.async_group.create_subgroup()
+        route._topic_filter = topic_filter
+        route._client = self._client
+        route._msg_cb = msg_cb
+        route._queue = aio.Queue(queue_size)
+
+        entry.routes.append(route)
+
+        route.async_group.spawn(aio.call_on_cancel, self._on_route_close,
+                                entry, route)
+        route.async_group.spawn(route._receive_loop)
+
+        return route
+
+    async def _on_msg(self, _, msg):
+        if self._subscription_identifiers and msg.subscription_identifiers:
+            entries = [self._identifier_entries.get(i)
+                       for i in msg.subscription_identifiers]
+
+        else:
+            entries = list(self._trie.match(msg.topic))
+
+        routes = [route
+                  for entry in entries if entry
+                  for route in entry.routes]
+
+        for route in routes:
+            with contextlib.suppress(aio.QueueClosedError):
+                await route._queue.put(msg)
+
+    def _on_route_close(self, entry, route):
+        route._queue.close()
+
+        with contextlib.suppress(ValueError):
+            entry.routes.remove(route)
+
+        if entry.routes or self._entries.get(entry.topic_filter) is not entry:
+            return
+
+        self._remove_entry(entry)
+
+        if self.is_open:
+            self.async_group.spawn(self._unsubscribe, entry.topic_filter)
+
+    async def _unsubscribe(self, topic_filter):
+        try:
+            await self._client.unsubscribe([topic_filter])
+
+        except ConnectionError:
+            pass
+
+        except Exception as e:
+            mlog.warning('unsubscribe error: %s', e, exc_info=e)
+
+    def _add_entry(self, entry):
+        self._entries[entry.topic_filter] = entry
+        self._trie.add(entry.topic_filter, entry)
+
+        if entry.identifier is not None:
+            self._identifier_entries[entry.identifier] = entry
+
+    def _remove_entry(self, entry):
+        self._entries.pop(entry.topic_filter, None)
+        self._trie.remove(entry.topic_filter, entry)
+
+        if entry.identifier is not None:
+            self._identifier_entries.pop(entry.identifier, None)
+
+    def _get_free_identifier(self):
+        for i in itertools.chain(range(self._next_identifier, 0x1000_0000),
+                                 range(1, self._next_identifier)):
+            if i not in self._identifier_entries:
+                self._next_identifier = i + 1
+                return i
+
+        raise Exception('free subscription identifier unavailable')
+
+
+class Route(aio.Resource):
+    """Message route registered with `Router.subscribe`"""
+
+    @property
+    def async_group(self) -> aio.Group:
+        return self._async_group
+
+    @property
+    def topic_filter(self) -> common.String:
+        return self._topic_filter
+
+    async def _receive_loop(self):
+        try:
+            while True:
+                msg = await self._queue.get()
+                await aio.call(self._msg_cb, self._client, msg)
+
+        except aio.QueueClosedError:
+            pass
+
+        except Exception as e:
+            mlog.error('route receive loop error: %s', e, exc_info=e)
+
+        finally:
+            self.close()
+
+
+class _TrieNode:
+
+    __slots__ = ('children', 'values')
+
+    def __init__(self):
+        self.children = {}
+        self.values = []
+
+
+class _Entry(typing.NamedTuple):
+    topic_filter: common.String
+    identifier: common.UIntVar | None
+    routes: list[Route]
+
+
+def _get_topic_filter_levels(topic_filter):
+    if not topic_filter:
+        raise ValueError('invalid topic filter')
+
+    levels = topic_filter.split('/')
+
+    for i, level in enumerate(levels):
+        if '#' in level and (level != '#' or i != len(levels) - 1):
+            raise ValueError('invalid topic filter')
+
+        if '+' in level and level != '+':
+            raise ValueError('invalid topic filter')
+
+    return levels
@@ -21,6 +21,7 @@ from hat.drivers.mqtt.transport.connection import (ConnectionCb,
                                                    Connection)
 from hat.drivers.mqtt.transport.encoder import (get_next_packet_size,
                                                 encode_packet,
+                                                encode_packet_buffers,
                                                 decode_packet)
 
 
@@ -47,4 +48,5 @@ __all__ = ['Will',
            'Connection',
            'get_next_packet_size',
            'encode_packet',
+           'encode_packet_buffers',
            'decode_packet']
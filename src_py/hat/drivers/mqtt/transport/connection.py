@@ -1,3 +1,4 @@
+import collections
 import typing
 
 from hat import aio
@@ -34,6 +35,7 @@ class Connection(aio.Resource):
 
     def __init__(self, conn: tcp.Connection):
         self._conn = conn
+        self._frames = collections.deque()
 
     @property
     def async_group(self):
@@ -44,19 +46,12 @@ class Connection(aio.Resource):
         return self._conn.info
 
     async def send(self, packet: common.Packet):
-        packet_bytes = encoder.encode_packet(packet)
-        await self._conn.write(packet_bytes)
+        packet_buffers = encoder.encode_packet_buffers(packet)
+        await self._conn.writelines(packet_buffers)
 
     async def receive(self) -> common.Packet:
-        data = bytearray()
+        if not self._frames:
+            self._frames.extend(
+                await self._conn.read_frames(encoder.get_next_packet_size))
 
-        while True:
-            next_packet_size = encoder.get_next_packet_size(memoryview(data))
-            remaining_len = next_packet_size - len(data)
-            if remaining_len < 1:
-                break
-
-            remaining = await self._conn.readexactly(remaining_len)
-            data.extend(remaining)
-
-        return encoder.decode_packet(memoryview(data))
+        return encoder.decode_packet(self._frames.popleft())
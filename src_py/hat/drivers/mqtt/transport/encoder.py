@@ -78,6 +78,22 @@ def get_next_packet_size(data: util.Bytes) -> int:
 
 
 def encode_packet(packet: common.Packet) -> util.Bytes:
+    buffers = encode_packet_buffers(packet)
+
+    if len(buffers) == 1:
+        return buffers[0]
+
+    return b''.join(buffers)
+
+
+def encode_packet_buffers(packet: common.Packet) -> list[util.Bytes]:
+    """Encode packet as list of buffers
+
+    Publish packet payload is returned as separate buffer without copying.
+
+    """
+    payload = b''
+
     if isinstance(packet, common.ConnectPacket):
         packet_type = _PacketType.CONNECT
         duplicate = False
@@ -98,6 +114,8 @@ def encode_packet(packet: common.Packet) -> util.Bytes:
         qos = packet.qos
         retain = packet.retain
         packet_data = collections.deque(_encode_publish_packet(packet))
+        payload = (packet.payload.encode()
+                   if isinstance(packet.payload, str) else packet.payload)
 
     elif isinstance(packet, common.PubAckPacket):
         packet_type = _PacketType.PUBACK
@@ -186,18 +204,23 @@ def encode_packet(packet: common.Packet) -> util.Bytes:
     else:
         raise ValueError('unsupported packet type')
 
-    data = collections.deque()
+    data = bytearray()
     data.append((packet_type.value << 4) |
                 (0x08 if duplicate else 0x00) |
                 (qos.value << 1) |
                 (0x01 if retain else 0x00))
-    data.extend(_encode_uintvar(len(packet_data)))
+    data.extend(_encode_uintvar(len(packet_data) + len(payload)))
     data.extend(packet_data)
 
-    return bytes(data)
+    if not payload:
+        return [bytes(data)]
+
+    return [data, payload]
 
 
 def decode_packet(data: util.Bytes) -> common.Packet:
+    data = memoryview(data)
+
     if len(data) < 2:
         raise common.MqttError(common.Reason.MALFORMED_PACKET,
                                'insufficient packet data')
@@ -628,19 +651,13 @@ def _encode_publish_packet(packet):
 
     if packet.subscription_identifiers:
         props[_PropertyType.SUBSCRIPTION_IDENTIFIER] = \
-            packet.subscription_identifier
+            packet.subscription_identifiers
 
     if packet.content_type is not None:
         props[_PropertyType.CONTENT_TYPE] = packet.content_type
 
     yield from _encode_props(props)
 
-    if isinstance(packet.payload, str):
-        yield from packet.payload.encode()
-
-    else:
-        yield from packet.payload
-
 
 def _decode_publish_packet(data, duplicate, qos, retain):
     topic_name, data = _decode_string(data)
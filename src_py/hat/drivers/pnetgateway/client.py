@@ -27,6 +27,7 @@ async def connect(addr: tcp.Address,
                   status_cb: StatusCb,
                   data_cb: DataCb,
                   subscriptions: list[str] | None = None,
+                  data_delay: float | None = None,
                   **kwargs
                   ) -> 'Connection':
     """Connect to PNET Gateway server
@@ -40,16 +41,25 @@ async def connect(addr: tcp.Address,
         status_cb: status change callback
         data_cb: data change callback
         subscriptions: list of data keys for subscriptions
+        data_delay: data change notification delay in seconds
 
     If subscription is ``None``, client is subscribed to all data changes
     from the server.
 
+    If `data_delay` is ``None``, `data_cb` is called for each received
+    data change message. Otherwise, data changes received during `data_delay`
+    period are merged per data key (only the latest data is kept) and
+    notified with single `data_cb` call.
+
     """
     conn = Connection()
     conn._pnet_status = common.Status.DISCONNECTED
     conn._data = {}
     conn._status_cb = status_cb
     conn._data_cb = data_cb
+    conn._data_delay = data_delay
+    conn._pending_data = {}
+    conn._pending_data_event = asyncio.Event()
     conn._next_ids = itertools.count(0)
     conn._id_futures = {}
 
@@ -71,9 +81,7 @@ async def connect(addr: tcp.Address,
             raise Exception('authentication failed')
 
         conn._pnet_status = common.Status(msg['body']['status'])
-        for i in msg['body']['data']:
-            data = encoder.data_from_json(i)
-            conn._data[data.key] = data
+        conn._data = _data_from_json(msg['body']['data'])
 
     except BaseException:
         await aio.uncancellable(conn.async_close())
@@ -81,6 +89,9 @@ async def connect(addr: tcp.Address,
 
     conn.async_group.spawn(conn._read_loop)
 
+    if data_delay is not None:
+        conn.async_group.spawn(conn._data_loop)
+
     return conn
 
 
@@ -170,6 +181,29 @@ class Connection(aio.Resource):
                 if not future.done():
                     future.set_exception(ConnectionError())
 
+    async def _data_loop(self):
+        try:
+            while True:
+                await self._pending_data_event.wait()
+                await asyncio.sleep(self._data_delay)
+
+                self._pending_data_event.clear()
+                await self._notify_pending_data()
+
+        except Exception as e:
+            self._log.warning('data loop error: %s', e, exc_info=e)
+
+        finally:
+            self.close()
+
+    async def _notify_pending_data(self):
+        if not self._pending_data:
+            return
+
+        data = list(self._pending_data.values())
+        self._pending_data = {}
+        await aio.call(self._data_cb, data)
+
     def _on_change_data_response(self, body):
         future = self._id_futures.get(body.get('id'))
         if not future or future.done():
@@ -192,22 +226,30 @@ class Connection(aio.Resource):
 
         self._log.debug('received data change unsolicited')
         data = [encoder.data_from_json(i) for i in body['data']]
-        for i in data:
-            self._data[i.key] = i
-        await aio.call(self._data_cb, data)
+        self._data.update((i.key, i) for i in data)
+
+        if self._data_delay is None:
+            await aio.call(self._data_cb, data)
+            return
+
+        self._pending_data.update((i.key, i) for i in data)
+        self._pending_data_event.set()
 
     async def _on_status_changed_unsolicited(self, body):
         self._log.debug('received status changed unsolicited')
-        self._pnet_status = common.Status(body['status'])
+        await self._notify_pending_data()
 
-        self._data = {}
-        for i in body['data']:
-            data = encoder.data_from_json(i)
-            self._data[data.key] = data
+        self._pnet_status = common.Status(body['status'])
+        self._data = _data_from_json(body['data'])
 
         await aio.call(self._status_cb, self._pnet_status)
 
 
+def _data_from_json(data_json):
+    data = (encoder.data_from_json(i) for i in data_json)
+    return {i.key: i for i in data}
+
+
 def _create_logger(info):
     extra = {'meta': {'type': 'PnetGatewayClient',
                       'name': info.name,
@@ -1,3 +1,5 @@
+import collections
+
 from hat import aio
 from hat import json
 from hat.drivers import tcp
@@ -7,6 +9,7 @@ class Transport(aio.Resource):
 
     def __init__(self, conn: tcp.Connection):
         self._conn = conn
+        self._frames = collections.deque()
 
     @property
     def async_group(self):
@@ -17,9 +20,11 @@ class Transport(aio.Resource):
         return self._conn.info
 
     async def receive(self) -> json.Data:
-        size_bytes = await self._conn.readexactly(4)
-        size = int.from_bytes(size_bytes, 'big')
-        msg_bytes = await self._conn.readexactly(size)
+        if not self._frames:
+            self._frames.extend(
+                await self._conn.read_frames(_get_next_frame_size))
+
+        msg_bytes = self._frames.popleft()[4:]
         msg_str = str(msg_bytes, 'utf-8')
         msg = json.decode(msg_str)
         return msg
@@ -29,4 +34,11 @@ class Transport(aio.Resource):
         msg_bytes = msg_str.encode('utf-8')
         size = len(msg_bytes)
         size_bytes = size.to_bytes(4, 'big')
-        await self._conn.write(size_bytes + msg_bytes)
+        await self._conn.writelines([size_bytes, msg_bytes])
+
+
+def _get_next_frame_size(data):
+    if len(data) < 4:
+        return 4
+
+    return 4 + int.from_bytes(data[:4], 'big')
@@ -82,40 +82,10 @@ class Connection(aio.Resource):
     async def _receive_loop(self):
         try:
             while True:
-                header_bytes = await self._conn.readexactly(
-                    encoder.header_length)
+                pdus = await self._conn.read_frames(_get_next_pdu_size)
 
-                try:
-                    header = encoder.decode_header(header_bytes)
-
-                except encoder.CommandStatusError as e:
-                    sequence_number = encoder.decode_sequence_number(
-                        header_bytes)
-
-                    await self._send(command_id=encoder.CommandId.GENERIC_NACK,
-                                     command_status=e.command_status,
-                                     sequence_number=sequence_number,
-                                     body=None)
-
-                    raise
-
-                body_bytes = await self._conn.readexactly(
-                    header.command_length - encoder.header_length)
-
-                if header.command_id in _request_command_ids:
-                    await self._process_request(header=header,
-                                                body_bytes=body_bytes)
-
-                elif header.command_id in _response_command_ids:
-                    self._process_response(header=header,
-                                           body_bytes=body_bytes)
-
-                elif header.command_id in _notification_command_ids:
-                    await self._process_notification(header=header,
-                                                     body_bytes=body_bytes)
-
-                else:
-                    raise Exception('invalid command id')
+                for pdu_bytes in pdus:
+                    await self._process_pdu(pdu_bytes)
 
         except ConnectionError:
             pass
@@ -130,6 +100,39 @@ class Connection(aio.Resource):
                 if not future.done():
                     future.cancel()
 
+    async def _process_pdu(self, pdu_bytes):
+        header_bytes = pdu_bytes[:encoder.header_length]
+
+        try:
+            header = encoder.decode_header(header_bytes)
+
+        except encoder.CommandStatusError as e:
+            sequence_number = encoder.decode_sequence_number(header_bytes)
+
+            await self._send(command_id=encoder.CommandId.GENERIC_NACK,
+                             command_status=e.command_status,
+                             sequence_number=sequence_number,
+                             body=None)
+
+            raise
+
+        body_bytes = pdu_bytes[encoder.header_length:]
+
+        if header.command_id in _request_command_ids:
+            await self._process_request(header=header,
+                                        body_bytes=body_bytes)
+
+        elif header.command_id in _response_command_ids:
+            self._process_response(header=header,
+                                   body_bytes=body_bytes)
+
+        elif header.command_id in _notification_command_ids:
+            await self._process_notification(header=header,
+                                             body_bytes=body_bytes)
+
+        else:
+            raise Exception('invalid command id')
+
     async def _process_request(self, header, body_bytes):
         if not self._request_cb:
             res_command_status = common.CommandStatus.ESME_RINVCMDID
@@ -219,11 +222,20 @@ class Connection(aio.Resource):
             sequence_number=sequence_number)
         header_bytes = encoder.encode_header(header)
 
-        pdu_bytes = bytearray(len(header_bytes) + len(body_bytes))
-        pdu_bytes[:len(header_bytes)] = header_bytes
-        pdu_bytes[len(header_bytes):] = body_bytes
+        await self._conn.writelines([header_bytes, body_bytes])
+
+
+def _get_next_pdu_size(data):
+    if len(data) < encoder.header_length:
+        return encoder.header_length
+
+    try:
+        header = encoder.decode_header(data[:encoder.header_length])
+
+    except encoder.CommandStatusError:
+        return encoder.header_length
 
-        await self._conn.write(pdu_bytes)
+    return header.command_length
 
 
 def _get_request_command_id(request):
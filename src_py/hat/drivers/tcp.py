@@ -1,5 +1,6 @@
 """Asyncio TCP wrapper"""
 
+from collections.abc import Iterable
 import asyncio
 import collections
 import functools
@@ -37,6 +38,16 @@ class ServerInfo(typing.NamedTuple):
 ConnectionCb: typing.TypeAlias = aio.AsyncCallable[['Connection'], None]
 """Connection callback"""
 
+FrameSizeCb: typing.TypeAlias = typing.Callable[[memoryview], int]
+"""Frame size callback
+
+Callback receives data starting at the beginning of next frame. If frame
+size can be determined, callback returns frame size. Otherwise, it returns
+number of bytes, greater than length of received data, required for
+determining frame size.
+
+"""
+
 
 async def connect(addr: Address,
                   *,
@@ -210,6 +221,19 @@ class Connection(aio.Resource):
 
         await self._protocol.write(data)
 
+    async def writelines(self, buffers: Iterable[util.Bytes]):
+        """Write data from multiple buffers
+
+        Buffers are passed to underlying transport without joining them into
+        single buffer. This coroutine will wait until `buffers` can be added
+        to output buffer.
+
+        """
+        if not self.is_open:
+            raise ConnectionError()
+
+        await self._protocol.writelines(buffers)
+
     async def drain(self):
         """Drain output buffer"""
         await self._protocol.drain()
@@ -232,6 +256,19 @@ class Connection(aio.Resource):
         """
         return await self._protocol.readexactly(n)
 
+    async def read_frames(self, size_cb: FrameSizeCb) -> list[util.Bytes]:
+        """Read all available frames
+
+        Frame boundaries are determined with `size_cb`. All complete frames
+        available in input buffer are returned without waiting for new data.
+        If no complete frame is available, this coroutine waits until at
+        least one frame is received.
+
+        If frame could not be read, `ConnectionError` is raised.
+
+        """
+        return await self._protocol.read_frames(size_cb)
+
     def clear_input_buffer(self) -> int:
         """Clear input buffer
 
@@ -334,13 +371,11 @@ class Protocol(asyncio.Protocol):
         drain_futures, self._drain_futures = self._drain_futures, None
 
         while self._write_queue is None and write_queue:
-            data, future = write_queue.popleft()
+            buffers, future = write_queue.popleft()
             if future.done():
                 continue
 
-            self._comm_log.log(common.CommLogAction.SEND, data)
-
-            self._transport.write(data)
+            self._write(buffers)
             future.set_result(None)
 
         if write_queue:
@@ -387,13 +422,25 @@ class Protocol(asyncio.Protocol):
             raise ConnectionError()
 
         if self._write_queue is None:
-            self._comm_log.log(common.CommLogAction.SEND, data)
+            self._write((data, ))
+            return
+
+        future = self._loop.create_future()
+        self._write_queue.append(((data, ), future))
+        await future
 
-            self._transport.write(data)
+    async def writelines(self, buffers: Iterable[util.Bytes]):
+        if self._transport is None:
+            raise ConnectionError()
+
+        buffers = tuple(buffers)
+
+        if self._write_queue is None:
+            self._write(buffers)
             return
 
         future = self._loop.create_future()
-        self._write_queue.append((data, future))
+        self._write_queue.append((buffers, future))
         await future
 
     async def drain(self):
@@ -439,6 +486,47 @@ class Protocol(asyncio.Protocol):
         self._process_input_buffer()
         return await future
 
+    async def read_frames(self, size_cb: FrameSizeCb) -> list[util.Bytes]:
+        data = b''
+
+        while True:
+            if self._input_buffer and not self._read_queue:
+                buffered_data = self._input_buffer.read()
+                data = (b''.join((data, buffered_data)) if data
+                        else buffered_data)
+
+            view = memoryview(data)
+            frames = []
+            size = 0
+
+            while True:
+                frame_size = size_cb(view[size:])
+                if frame_size < 1:
+                    raise ValueError('invalid frame size')
+
+                if size + frame_size > len(view):
+                    break
+
+                frames.append(view[size:size + frame_size])
+                size += frame_size
+
+            if frames:
+                self._input_buffer.add(view[size:])
+                self._process_input_buffer()
+                return frames
+
+            try:
+                frame_data = await self.readexactly(frame_size - len(data))
+
+            except asyncio.CancelledError:
+                input_buffer = util.BytesBuffer()
+                input_buffer.add(data)
+                input_buffer.add(self._input_buffer.read())
+                self._input_buffer = input_buffer
+                raise
+
+            data = b''.join((data, frame_data))
+
     def clear_input_buffer(self) -> int:
         count = self._input_buffer.clear()
         self._transport.resume_reading()
@@ -458,6 +546,15 @@ class Protocol(asyncio.Protocol):
         self._closed_futures.append(future)
         await future
 
+    def _write(self, buffers):
+        self._comm_log.log(common.CommLogAction.SEND, *buffers)
+
+        if len(buffers) == 1:
+            self._transport.write(buffers[0])
+
+        else:
+            self._transport.writelines(buffers)
+
     def _on_read_future_done(self, future):
         if not self._read_queue:
             return
@@ -546,13 +643,13 @@ class _CommunicationLogger:
 
     def log(self,
             action: common.CommLogAction,
-            data: util.Bytes | None = None):
+            *data: util.Bytes):
         if not self._log.isEnabledFor(logging.DEBUG):
             return
 
-        if data is None:
+        if not data:
             self._log.debug(action.value, stacklevel=2)
 
         else:
-            self._log.debug('%s (%s)', action.value, data.hex(' '),
-                            stacklevel=2)
+            self._log.debug('%s (%s)', action.value,
+                            b''.join(data).hex(' '), stacklevel=2)
@@ -1,7 +1,6 @@
 """Transport Service on top of TCP"""
 
 import asyncio
-import itertools
 import logging
 import typing
 
@@ -129,11 +128,9 @@ class Connection(aio.Resource):
             raise ValueError("data length less than 3")
 
         packet_length = data_len + 4
-        packet = bytes(itertools.chain(
-            [3, 0, packet_length >> 8, packet_length & 0xFF],
-            data))
+        header = bytes([3, 0, packet_length >> 8, packet_length & 0xFF])
 
-        await self._conn.write(packet)
+        await self._conn.writelines([header, data])
 
     async def drain(self):
         """Drain output buffer"""
@@ -144,20 +141,10 @@ class Connection(aio.Resource):
 
         try:
             while True:
-                header = await self._conn.readexactly(4)
-                if header[0] != 3:
-                    raise Exception(f"invalid vrsn number "
-                                    f"(received {header[0]})")
+                packets = await self._conn.read_frames(_get_next_packet_size)
 
-                packet_length = (header[2] << 8) | header[3]
-                if packet_length < 7:
-                    raise Exception(f"invalid packet length "
-                                    f"(received {packet_length})")
-
-                data_length = packet_length - 4
-                data = await self._conn.readexactly(data_length)
-
-                await self._receive_queue.put(data)
+                for packet in packets:
+                    await self._receive_queue.put(packet[4:])
 
         except ConnectionError:
             pass
@@ -172,6 +159,22 @@ class Connection(aio.Resource):
             self._receive_queue.close()
 
 
+def _get_next_packet_size(data):
+    if len(data) < 4:
+        return 4
+
+    if data[0] != 3:
+        raise Exception(f"invalid vrsn number "
+                        f"(received {data[0]})")
+
+    packet_length = (data[2] << 8) | data[3]
+    if packet_length < 7:
+        raise Exception(f"invalid packet length "
+                        f"(received {packet_length})")
+
+    return packet_length
+
+
 def _create_server_logger(name, info):
     extra = {'meta': {'type': 'TpktServer',
                       'name': name}}
@@ -22,3 +22,20 @@ def nullmodem(request, tmp_path):
     atexit.register(finalizer)
     request.addfinalizer(finalizer)
     return path1, path2, p
+
+
+def pytest_addoption(parser):
+    parser.addoption('--perf-payload-sizes',
+                     default='16,1024,16384',
+                     help='comma separated loopback benchmark payload sizes')
+    parser.addoption('--perf-concurrency',
+                     default='1,10',
+                     help='comma separated loopback benchmark '
+                          'connection counts')
+    parser.addoption('--perf-count',
+                     type=int,
+                     default=1000,
+                     help='loopback benchmark round trips per connection')
+    parser.addoption('--perf-results',
+                     default='build/perf/loopback.jsonl',
+                     help='loopback benchmark results path (JSON lines)')
@@ -6,6 +6,12 @@ from hat import util
 from hat.drivers import chatter
 from hat.drivers import tcp
 
+try:
+    from hat.drivers.chatter import _encoder
+
+except ImportError:
+    _encoder = None
+
 
 @pytest.fixture
 def addr():
@@ -77,6 +83,30 @@ async def test_send_receive(addr):
         await conn2.receive()
 
 
+@pytest.mark.parametrize("data_count", [1, 10, 1000])
+@pytest.mark.parametrize("data_size", [0, 1, 256, 100000])
+async def test_send_receive_multiple(addr, data_count, data_size):
+    conn_queue = aio.Queue()
+    srv = await chatter.listen(conn_queue.put_nowait, addr)
+    conn1 = await chatter.connect(addr)
+    conn2 = await conn_queue.get()
+
+    data = [chatter.Data(str(i), bytes([i % 0x100]) * data_size)
+            for i in range(data_count)]
+
+    for i in data:
+        await conn1.send(i)
+    await conn1.drain()
+
+    for i in data:
+        msg = await conn2.receive()
+        assert msg.data == i
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
 async def test_ping_timeout(addr):
     conn_queue = aio.Queue()
     srv = await tcp.listen(conn_queue.put_nowait, addr)
@@ -88,3 +118,43 @@ async def test_ping_timeout(addr):
     await aio.wait_for(conn.wait_closed(), 0.1)
 
     await srv.async_close()
+
+
+@pytest.mark.skipif(_encoder is None, reason="native encoder not available")
+@pytest.mark.parametrize("msg_id, first", [(0, 0),
+                                           (63, 1),
+                                           (64, 64),
+                                           (8192, 8191),
+                                           (2**62, 12345)])
+@pytest.mark.parametrize("owner, token, last", [(True, True, True),
+                                                (False, True, False),
+                                                (True, False, True),
+                                                (False, False, False)])
+@pytest.mark.parametrize("data_type", ['', 'abc', 'čćž'])
+@pytest.mark.parametrize("data", [b'',
+                                  b'xyz',
+                                  bytearray(b'x' * 100000),
+                                  memoryview(b'abc')])
+def test_native_encoder(msg_id, first, owner, token, last, data_type, data):
+    msg = {'id': msg_id,
+           'first': first,
+           'owner': owner,
+           'token': token,
+           'last': last,
+           'data': {'type': data_type,
+                    'data': bytes(data)}}
+
+    msg_bytes = chatter._sbs_repo.encode('HatChatter.Msg', msg)
+    msg_len_bytes = chatter._uint_to_bebytes(len(msg_bytes))
+    frame = bytes([len(msg_len_bytes), *msg_len_bytes]) + msg_bytes
+
+    assert _encoder.encode_msg(msg_id, first, owner, token, last,
+                               data_type, data) == frame
+
+    msgs, size = _encoder.decode_msgs(frame + frame[:-1])
+    assert size == len(frame)
+    assert msgs == [msg]
+
+    msgs, size = _encoder.decode_msgs(frame[:-1])
+    assert size == 0
+    assert msgs == []
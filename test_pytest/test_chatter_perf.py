@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import chatter
+from hat.drivers import tcp
+
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+@pytest.mark.parametrize("data_count", [1, 100, 10000])
+@pytest.mark.parametrize("data_size", [1, 1000, 100000])
+async def test_send_receive(duration, addr, data_count, data_size):
+    conn_queue = aio.Queue()
+    srv = await chatter.listen(conn_queue.put_nowait, addr)
+    conn1 = await chatter.connect(addr)
+    conn2 = await conn_queue.get()
+
+    data = chatter.Data('abc', b'x' * data_size)
+
+    async def send():
+        for _ in range(data_count):
+            await conn1.send(data)
+
+    async def receive():
+        for _ in range(data_count):
+            await conn2.receive()
+
+    with duration(f'data_count: {data_count}; data_size: {data_size}'):
+        await asyncio.gather(send(), receive())
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
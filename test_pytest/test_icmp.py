@@ -64,6 +64,57 @@ async def test_ping_failure():
     await endpoint.async_close()
 
 
+async def test_ping_rtt():
+    endpoint = await icmp.create_endpoint()
+
+    rtt = await endpoint.ping('127.0.0.1')
+    assert 0 <= rtt < 1
+
+    await endpoint.async_close()
+
+
+async def test_sweep():
+    endpoint = await icmp.create_endpoint()
+
+    result = await endpoint.sweep(['127.0.0.1', unused_local_ip, '127.0.0.1'],
+                                  count=3,
+                                  rate=1000,
+                                  timeout=0.05)
+    assert len(result) == 3
+
+    for stats in [result[0], result[2]]:
+        assert stats.remote_host == '127.0.0.1'
+        assert stats.sent == 3
+        assert stats.received == 3
+        assert 0 <= stats.rtt_min <= stats.rtt_avg <= stats.rtt_max < 1
+        assert stats.rtt_jitter >= 0
+
+    assert result[1] == icmp.PingStats(remote_host=unused_local_ip,
+                                       sent=3,
+                                       received=0,
+                                       rtt_min=None,
+                                       rtt_avg=None,
+                                       rtt_max=None,
+                                       rtt_jitter=None)
+
+    await endpoint.async_close()
+
+
+async def test_sweep_rate():
+    endpoint = await icmp.create_endpoint()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await endpoint.sweep(['127.0.0.1'] * 10,
+                                  rate=100)
+    duration = loop.time() - start
+
+    assert duration >= 0.09
+    assert all(i.received == 1 for i in result)
+
+    await endpoint.async_close()
+
+
 async def test_ping_closed_endoint():
     endpoint = await icmp.create_endpoint()
 
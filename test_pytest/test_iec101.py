@@ -36,6 +36,14 @@ class MockMasterConnection(aio.Resource):
         return await self._data_queue.get()
 
 
+class MockSlaveConnection(MockMasterConnection):
+
+    async def send(self, data, sent_cb=None, *, data_class=None, key=None):
+        self._data_queue.put_nowait((data, data_class, key))
+        if sent_cb:
+            await aio.call(sent_cb)
+
+
 def gen_qualities(amount, quality_class):
     samples = {
         'invalid': [True, False, True],
@@ -831,3 +839,55 @@ async def test_sequence_of_ioes():
     for i, msg in enumerate(msgs):
         assert msg.data.value.value == i
         assert msg.io_address == io_address + i
+
+
+@pytest.mark.parametrize("data_class", link.DataClass)
+async def test_send_data_class(data_class):
+    conn_link = MockSlaveConnection()
+    conn = iec101.Connection(
+        conn=conn_link,
+        cause_size=iec101.CauseSize.TWO,
+        asdu_address_size=iec101.AsduAddressSize.TWO,
+        io_address_size=iec101.IoAddressSize.TWO)
+
+    quality = iec101.MeasurementQuality(invalid=False,
+                                        not_topical=False,
+                                        substituted=False,
+                                        blocked=False,
+                                        overflow=False)
+    msgs = [iec101.DataMsg(is_test=False,
+                           originator_address=0,
+                           asdu_address=13,
+                           io_address=io_address,
+                           data=iec101.ScaledData(
+                               value=iec101.ScaledValue(value=io_address),
+                               quality=quality),
+                           time=None,
+                           cause=iec101.DataResCause.PERIODIC)
+            for io_address in [1, 2, 1]]
+    msgs.append(iec101.InitializationMsg(
+        is_test=False,
+        originator_address=0,
+        asdu_address=13,
+        param_change=False,
+        cause=iec101.InitializationResCause.LOCAL_POWER))
+
+    sent_sizes = []
+
+    def on_sent():
+        sent_sizes.append(conn_link._data_queue.qsize())
+
+    await conn.send(msgs, sent_cb=on_sent, data_class=data_class)
+    assert sent_sizes == [len(msgs)]
+
+    for msg in msgs:
+        data, msg_data_class, key = conn_link._data_queue.get_nowait()
+        assert msg_data_class == data_class
+        assert list(conn._encoder.decode(data)) == [msg]
+
+        if (data_class == link.DataClass.CLASS_2 and
+                isinstance(msg, iec101.DataMsg)):
+            assert key == (msg.asdu_address, msg.io_address)
+
+        else:
+            assert key is None
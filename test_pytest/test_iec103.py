@@ -535,25 +535,223 @@ async def test_generic_command():
     pass
 
 
-async def test_transmission_of_disturbance_data():
+async def test_get_disturbances():
     conn, slave = create_connection_slave_pair()
     master_conn = iec103.MasterConnection(conn=conn)
+
+    disturbances_future = asyncio.ensure_future(
+        master_conn.get_disturbances(asdu_address=1, function_type=128))
+
+    asdu = await slave.receive()
+    assert asdu.type == encoding.AsduType.ORDER_FOR_DISTURBANCE_DATA_TRANSMISSION  # NOQA
+    assert asdu.cause == encoding.Cause.TRANSMISSION_OF_DISTURBANCE_DATA
+    assert asdu.address == 1
+    assert asdu.ios[0].address == encoding.IoAddress(function_type=128,
+                                                     information_number=0)
+    assert asdu.ios[0].elements[0].order_type == encoding.OrderType.REQUEST_FOR_LIST_OF_RECORDED_DISTURBANCES  # NOQA
+    assert not disturbances_future.done()
+
     slave_asdu = encoding.ASDU(
         type=encoding.AsduType.LIST_OF_RECORDED_DISTURBANCES,
         cause=encoding.Cause.TRANSMISSION_OF_DISTURBANCE_DATA,
         address=1,
         ios=[encoding.IO(
-            address=encoding.IoAddress(function_type=1,
-                                       information_number=1),
+            address=encoding.IoAddress(function_type=128,
+                                       information_number=0),
             elements=[encoding.IoElement_LIST_OF_RECORDED_DISTURBANCES(
-                fault_number=3,
+                fault_number=fault_number,
                 trip=True,
                 transmitted=False,
                 test=False,
                 other=False,
-                time=default_time_seven)])])
+                time=default_time_seven)
+                for fault_number in [3, 4]])])
     await slave.send(slave_asdu)
-    # TODO: finish sequence when functionality implemented
+
+    disturbances = await disturbances_future
+    assert disturbances == [iec103.Disturbance(fault_number=fault_number,
+                                               trip=True,
+                                               transmitted=False,
+                                               test=False,
+                                               other=False,
+                                               time=default_time_seven)
+                            for fault_number in [3, 4]]
+
+    await slave.async_close()
+    await master_conn.async_close()
+
+
+async def test_read_disturbance():
+    conn, slave = create_connection_slave_pair()
+    master_conn = iec103.MasterConnection(conn=conn)
+    io_address = encoding.IoAddress(function_type=128,
+                                    information_number=0)
+    fault_number = 3
+    channels = [encoding.Channel.I_L1, encoding.Channel.V_L1E]
+    values = [0.5, -0.25, 0]
+
+    async def send(asdu_type, element):
+        await slave.send(encoding.ASDU(
+            type=asdu_type,
+            cause=encoding.Cause.TRANSMISSION_OF_DISTURBANCE_DATA,
+            address=1,
+            ios=[encoding.IO(address=io_address,
+                             elements=[element])]))
+
+    async def receive(asdu_type, order_type,
+                      channel=encoding.Channel.GLOBAL):
+        asdu = await slave.receive()
+        assert asdu.type == asdu_type
+        assert asdu.address == 1
+        assert asdu.ios[0].address == io_address
+        assert asdu.ios[0].elements[0].order_type == order_type
+        assert asdu.ios[0].elements[0].fault_number == fault_number
+        assert asdu.ios[0].elements[0].channel == channel
+
+    async def run_slave():
+        order = encoding.AsduType.ORDER_FOR_DISTURBANCE_DATA_TRANSMISSION
+        ack = encoding.AsduType.ACKNOWLEDGEMENT_FOR_DISTURBANCE_DATA_TRANSMISSION  # NOQA
+
+        await receive(order, encoding.OrderType.SELECTION_OF_FAULT)
+        await send(
+            encoding.AsduType.READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA,
+            encoding.IoElement_READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA(
+                fault_number=fault_number,
+                number_of_faults=1,
+                number_of_channels=len(channels),
+                number_of_elements=len(values),
+                interval=1000,
+                time=default_time_four))
+
+        await receive(order, encoding.OrderType.REQUEST_FOR_DISTURBANCE_DATA)
+        await send(
+            encoding.AsduType.READY_FOR_TRANSMISSION_OF_TAGS,
+            encoding.IoElement_READY_FOR_TRANSMISSION_OF_TAGS(
+                fault_number=fault_number))
+
+        await receive(order, encoding.OrderType.REQUEST_FOR_TAGS)
+        await send(
+            encoding.AsduType.TRANSMISSION_OF_TAGS,
+            encoding.IoElement_TRANSMISSION_OF_TAGS(
+                fault_number=fault_number,
+                tag_position=0,
+                values=[(io_address, encoding.DoubleValue.ON)]))
+        await send(
+            encoding.AsduType.END_OF_TRANSMISSION,
+            encoding.IoElement_END_OF_TRANSMISSION(
+                order_type=encoding.OrderType.END_OF_TAG_TRANSMISSION_WITHOUT_ABORTION,  # NOQA
+                fault_number=fault_number,
+                channel=encoding.Channel.GLOBAL))
+        await receive(ack, encoding.OrderType.TAGS_TRANSMITTED_SUCCESSFULLY)
+
+        for channel in channels:
+            await send(
+                encoding.AsduType.READY_FOR_TRANSMISSION_OF_A_CHANNEL,
+                encoding.IoElement_READY_FOR_TRANSMISSION_OF_A_CHANNEL(
+                    fault_number=fault_number,
+                    channel=channel,
+                    primary=encoding.Real32Value(100),
+                    secondary=encoding.Real32Value(1),
+                    reference=encoding.Real32Value(2)))
+
+            await receive(order, encoding.OrderType.REQUEST_FOR_CHANNEL,
+                          channel)
+            for element_number, value in enumerate(values):
+                await send(
+                    encoding.AsduType.TRANSMISSION_OF_DISTURBANCE_VALUES,
+                    encoding.IoElement_TRANSMISSION_OF_DISTURBANCE_VALUES(
+                        fault_number=fault_number,
+                        channel=channel,
+                        element_number=element_number,
+                        values=[value]))
+            await send(
+                encoding.AsduType.END_OF_TRANSMISSION,
+                encoding.IoElement_END_OF_TRANSMISSION(
+                    order_type=encoding.OrderType.END_OF_CHANNEL_TRANSMISSION_WITHOUT_ABORTION,  # NOQA
+                    fault_number=fault_number,
+                    channel=channel))
+            await receive(ack,
+                          encoding.OrderType.CHANNEL_TRANSMITTED_SUCCESSFULLY,
+                          channel)
+
+        await send(
+            encoding.AsduType.END_OF_TRANSMISSION,
+            encoding.IoElement_END_OF_TRANSMISSION(
+                order_type=encoding.OrderType.END_OF_DISTURBANCE_DATA_TRANSMISSION_WITHOUT_ABORTION,  # NOQA
+                fault_number=fault_number,
+                channel=encoding.Channel.GLOBAL))
+        await receive(ack,
+                      encoding.OrderType.DISTURBANCE_DATA_TRANSMITTED_SUCCESSFULLY)  # NOQA
+
+    slave_future = asyncio.ensure_future(run_slave())
+
+    result = [i async for i in master_conn.read_disturbance(
+        asdu_address=1,
+        function_type=128,
+        fault_number=fault_number)]
+
+    await slave_future
+
+    assert result == [
+        iec103.DisturbanceRecord(fault_number=fault_number,
+                                 number_of_faults=1,
+                                 number_of_channels=len(channels),
+                                 number_of_elements=len(values),
+                                 interval=1000,
+                                 time=default_time_four),
+        iec103.DisturbanceTags(tag_position=0,
+                               values=[(io_address,
+                                        iec103.DoubleValue.ON)]),
+        *(i
+          for channel in channels
+          for i in [iec103.DisturbanceChannel(channel=channel,
+                                              primary=100,
+                                              secondary=1,
+                                              reference=2),
+                    *(iec103.DisturbanceValues(channel=channel,
+                                               element_number=element_number,
+                                               values=[value])
+                      for element_number, value in enumerate(values))])]
+
+    await slave.async_close()
+    await master_conn.async_close()
+
+
+async def test_read_disturbance_abort():
+    conn, slave = create_connection_slave_pair()
+    master_conn = iec103.MasterConnection(conn=conn)
+
+    disturbance_data = master_conn.read_disturbance(asdu_address=1,
+                                                    function_type=128,
+                                                    fault_number=3)
+    next_future = asyncio.ensure_future(anext(disturbance_data))
+
+    asdu = await slave.receive()
+    assert asdu.ios[0].elements[0].order_type == encoding.OrderType.SELECTION_OF_FAULT  # NOQA
+
+    await slave.send(encoding.ASDU(
+        type=encoding.AsduType.READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA,
+        cause=encoding.Cause.TRANSMISSION_OF_DISTURBANCE_DATA,
+        address=1,
+        ios=[encoding.IO(
+            address=encoding.IoAddress(function_type=128,
+                                       information_number=0),
+            elements=[encoding.IoElement_READY_FOR_TRANSMISSION_OF_DISTURBANCE_DATA(  # NOQA
+                fault_number=3,
+                number_of_faults=1,
+                number_of_channels=1,
+                number_of_elements=1,
+                interval=1000,
+                time=default_time_four)])]))
+
+    record = await next_future
+    assert record.fault_number == 3
+
+    await disturbance_data.aclose()
+
+    asdu = await slave.receive()
+    assert asdu.ios[0].elements[0].order_type == encoding.OrderType.ABORTION_OF_DISTURBANCE_DATA  # NOQA
+
     await slave.async_close()
     await master_conn.async_close()
 
@@ -0,0 +1,167 @@
+import asyncio
+import datetime
+
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import iec104
+from hat.drivers import tcp
+
+
+pytestmark = pytest.mark.timeout(2)
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+def create_msg(io_address, data, time=None,
+               cause=iec104.DataResCause.SPONTANEOUS):
+    return iec104.DataMsg(is_test=False,
+                          originator_address=0,
+                          asdu_address=1,
+                          io_address=io_address,
+                          data=data,
+                          time=time,
+                          cause=cause)
+
+
+def create_floating_data(value):
+    return iec104.FloatingData(
+        value=iec104.FloatingValue(value),
+        quality=iec104.MeasurementQuality(invalid=False,
+                                          not_topical=False,
+                                          substituted=False,
+                                          blocked=False,
+                                          overflow=False))
+
+
+def create_single_data(value):
+    return iec104.SingleData(
+        value=value,
+        quality=iec104.IndicationQuality(invalid=False,
+                                         not_topical=False,
+                                         substituted=False,
+                                         blocked=False))
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+async def test_coalesce_spontaneous_data(addr, coalesce):
+    time = iec104.time_from_datetime(datetime.datetime.now())
+
+    conn2_future = asyncio.Future()
+    srv = await iec104.listen(conn2_future.set_result, addr,
+                              send_window_size=1,
+                              coalesce_spontaneous_data=coalesce)
+    conn1 = await iec104.connect(addr,
+                                 supervisory_timeout=0.05,
+                                 receive_window_size=15)
+    conn2 = await conn2_future
+
+    # first message occupies send window, second one waits for window
+    await conn2.send([create_msg(1, create_floating_data(0))])
+    await asyncio.sleep(0.01)
+    await conn2.send([create_msg(1, create_floating_data(1))])
+    await asyncio.sleep(0.01)
+
+    msgs = [create_msg(1, create_floating_data(2)),
+            create_msg(2, create_single_data(iec104.SingleValue.ON), time),
+            create_msg(1, create_floating_data(3)),
+            create_msg(2, create_single_data(iec104.SingleValue.OFF), time),
+            create_msg(1, create_floating_data(4),
+                       cause=iec104.DataResCause.PERIODIC),
+            create_msg(1, create_floating_data(5))]
+    await conn2.send(msgs)
+
+    if coalesce:
+        expected = [0, 1, 5, iec104.SingleValue.ON, iec104.SingleValue.OFF, 4]
+        assert conn2.send_queue_stats.coalesced == 2
+
+    else:
+        expected = [0, 1, 2, iec104.SingleValue.ON, 3, iec104.SingleValue.OFF,
+                    4, 5]
+        assert conn2.send_queue_stats.coalesced == 0
+
+    for value in expected:
+        msgs = await conn1.receive()
+        assert len(msgs) == 1
+
+        if isinstance(value, iec104.SingleValue):
+            assert msgs[0].data.value == value
+
+        else:
+            assert msgs[0].data.value.value == value
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
+async def test_broadcaster(addr, monkeypatch):
+    encode_count = 0
+    encode = iec104.encoder.Encoder.encode
+
+    def encode_counting(self, msgs):
+        nonlocal encode_count
+        encode_count += 1
+        return encode(self, msgs)
+
+    monkeypatch.setattr(iec104.encoder.Encoder, 'encode', encode_counting)
+
+    broadcaster_conns = aio.Queue()
+    broadcaster = await iec104.create_broadcaster(
+        addr, connection_cb=broadcaster_conns.put_nowait)
+
+    conns = []
+    srv_conns = []
+    for _ in range(3):
+        conns.append(await iec104.connect(addr))
+        srv_conns.append(await broadcaster_conns.get())
+
+    assert broadcaster.connections == srv_conns
+
+    msgs = [create_msg(i, create_floating_data(i)) for i in range(10)]
+    await broadcaster.broadcast(msgs)
+    assert encode_count == 1
+
+    for conn in conns:
+        received = []
+        while len(received) < len(msgs):
+            received.extend(await conn.receive())
+        assert received == msgs
+
+    await conns[0].async_close()
+    await srv_conns[0].wait_closed()
+    assert broadcaster.connections == srv_conns[1:]
+
+    for conn in conns[1:]:
+        await conn.async_close()
+    await broadcaster.async_close()
+
+
+async def test_broadcaster_lagging(addr):
+    broadcaster_conns = aio.Queue()
+    broadcaster = await iec104.create_broadcaster(
+        addr,
+        connection_cb=broadcaster_conns.put_nowait,
+        max_lag=5,
+        send_window_size=1)
+
+    conn = await iec104.connect(addr,
+                                supervisory_timeout=1,
+                                receive_window_size=15)
+    broadcaster_conn = await broadcaster_conns.get()
+
+    for i in range(5):
+        await broadcaster.broadcast([create_msg(1, create_floating_data(i))])
+        assert broadcaster_conn.is_open
+
+    await broadcaster.broadcast([create_msg(1, create_floating_data(5)),
+                                 create_msg(1, create_floating_data(6))])
+    await broadcaster_conn.wait_closed()
+    await conn.wait_closed()
+
+    await broadcaster.async_close()
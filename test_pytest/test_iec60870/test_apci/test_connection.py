@@ -157,6 +157,41 @@ async def test_window_size_supervisory_timeout(addr):
     await srv.async_close()
 
 
+async def test_send_coalesce(addr):
+    conn_queue = aio.Queue()
+    srv = await apci.listen(conn_queue.put_nowait, addr,
+                            supervisory_timeout=0.05,
+                            receive_window_size=15)
+    conn1 = await apci.connect(addr,
+                               send_window_size=1)
+    conn2 = await conn_queue.get()
+
+    # first entry occupies send window, second one waits for window
+    await conn1.send(b'\x00')
+    await asyncio.sleep(0.01)
+    await conn1.send(b'\x01', key='a')
+    await asyncio.sleep(0.01)
+
+    await conn1.send(b'\x02', key='a')
+    await conn1.send(b'\x10', key='b')
+    await conn1.send(b'\x03', key='a')
+    await conn1.send(b'\x20')
+    await conn1.send(b'\x04', key='a')
+    await conn1.send(b'\x05', wait_ack=False, key=None)
+
+    stats = conn1.send_queue_stats
+    assert stats == common.SendQueueStats(queued=4,
+                                          waiting_ack=1,
+                                          coalesced=2)
+
+    for i in [b'\x00', b'\x01', b'\x04', b'\x10', b'\x20', b'\x05']:
+        assert await conn2.receive() == i
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
 async def test_test_timeout(addr):
     conn_queue = aio.Queue()
 
@@ -0,0 +1,30 @@
+import pytest
+
+from hat.drivers.iec60870.encodings import encoder
+
+
+@pytest.fixture(autouse=True)
+def native_parity(monkeypatch):
+    if encoder._encoder is None:
+        return
+
+    decode_asdu = encoder.Encoder.decode_asdu
+    encode_asdu = encoder.Encoder.encode_asdu
+
+    def python_call(fn, *args):
+        with monkeypatch.context() as m:
+            m.setattr(encoder, '_encoder', None)
+            return fn(*args)
+
+    def decode_asdu_parity(self, asdu_bytes):
+        result = decode_asdu(self, asdu_bytes)
+        assert result == python_call(decode_asdu, self, asdu_bytes)
+        return result
+
+    def encode_asdu_parity(self, asdu):
+        result = encode_asdu(self, asdu)
+        assert result == python_call(encode_asdu, self, asdu)
+        return result
+
+    monkeypatch.setattr(encoder.Encoder, 'decode_asdu', decode_asdu_parity)
+    monkeypatch.setattr(encoder.Encoder, 'encode_asdu', encode_asdu_parity)
@@ -0,0 +1,99 @@
+import datetime
+
+import pytest
+
+from hat.drivers.iec60870.encodings import encoder
+from hat.drivers.iec60870.encodings import iec101
+
+
+quality = iec101.MeasurementQuality(invalid=False,
+                                    not_topical=True,
+                                    substituted=False,
+                                    blocked=False,
+                                    overflow=True)
+
+time = iec101.time_from_datetime(datetime.datetime(2020, 1, 2, 3, 4, 5))
+
+cause = iec101.Cause(type=iec101.CauseType.SPONTANEOUS,
+                     is_negative_confirm=False,
+                     is_test=False,
+                     originator_address=0)
+
+
+@pytest.fixture(params=['native', 'python'])
+def native(request, monkeypatch):
+    if request.param == 'native':
+        if encoder._encoder is None:
+            pytest.skip('native encoder not available')
+
+    else:
+        monkeypatch.setattr(encoder, '_encoder', None)
+
+
+@pytest.mark.parametrize("io_address_size", iec101.IoAddressSize)
+@pytest.mark.parametrize("asdu", [
+    iec101.ASDU(type=iec101.AsduType.M_ME_TF,
+                cause=cause,
+                address=0x1234,
+                ios=[iec101.IO(address=i,
+                               elements=[iec101.IoElement_M_ME_TF(
+                                   value=iec101.FloatingValue(i / 3),
+                                   quality=quality)],
+                               time=time)
+                     for i in range(10)]),
+    iec101.ASDU(type=iec101.AsduType.M_ME_NC,
+                cause=cause,
+                address=1,
+                ios=[iec101.IO(address=123,
+                               elements=[iec101.IoElement_M_ME_NC(
+                                   value=iec101.FloatingValue(i),
+                                   quality=quality)
+                                         for i in range(100)],
+                               time=None)]),
+    iec101.ASDU(type=iec101.AsduType.M_ME_ND,
+                cause=cause,
+                address=0xFFFF,
+                ios=[iec101.IO(address=i,
+                               elements=[iec101.IoElement_M_ME_ND(
+                                   value=iec101.NormalizedValue(i / 200))],
+                               time=None)
+                     for i in range(127)])])
+def test_multiple_ios(native, io_address_size, asdu):
+    asdu_encoder = iec101.Encoder(
+        cause_size=iec101.CauseSize.TWO,
+        asdu_address_size=iec101.AsduAddressSize.TWO,
+        io_address_size=io_address_size)
+
+    asdu_bytes = asdu_encoder.encode_asdu(asdu)
+    result, rest = asdu_encoder.decode_asdu(asdu_bytes + b'\x01\x02')
+
+    assert result.type == asdu.type
+    assert result.cause == asdu.cause
+    assert result.address == asdu.address
+    assert len(result.ios) == len(asdu.ios)
+    for result_io, io in zip(result.ios, asdu.ios):
+        assert result_io.address == io.address
+        assert result_io.time == io.time
+        assert len(result_io.elements) == len(io.elements)
+    assert rest == b'\x01\x02'
+
+
+@pytest.mark.parametrize("size", range(1, 15))
+def test_invalid_length(native, size):
+    asdu_encoder = iec101.Encoder(
+        cause_size=iec101.CauseSize.TWO,
+        asdu_address_size=iec101.AsduAddressSize.TWO,
+        io_address_size=iec101.IoAddressSize.THREE)
+
+    asdu = iec101.ASDU(type=iec101.AsduType.M_ME_TF,
+                       cause=cause,
+                       address=1,
+                       ios=[iec101.IO(address=1,
+                                      elements=[iec101.IoElement_M_ME_TF(
+                                          value=iec101.FloatingValue(1),
+                                          quality=quality)],
+                                      time=time)])
+    asdu_bytes = asdu_encoder.encode_asdu(asdu)
+
+    with pytest.raises(Exception):
+        asdu_encoder.decode_asdu(asdu_bytes[:-size])
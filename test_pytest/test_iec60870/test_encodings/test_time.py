@@ -98,3 +98,32 @@ def test_time_to_datetime_sizes():
     for size in [common.TimeSize.FOUR]:
         with pytest.raises(ValueError):
             common.time_to_datetime(now_t._replace(size=size))
+
+
+@pytest.mark.parametrize("ns", [True, False])
+def test_times_to_timestamps(ns):
+    now_dt = datetime.datetime.now(datetime.timezone.utc)
+    dts = [now_dt + datetime.timedelta(milliseconds=i * 1234)
+           for i in range(-1000, 1000)]
+    dts = [dt.replace(microsecond=(dt.microsecond // 1000) * 1000)
+           for dt in dts]
+    times = [common.time_from_datetime(dt) for dt in dts]
+
+    timestamps = common.times_to_timestamps(times, ns=ns)
+    assert len(timestamps) == len(dts)
+
+    for dt, t, timestamp in zip(dts, times, timestamps):
+        assert common.time_to_datetime(t) == dt
+
+        if ns:
+            assert isinstance(timestamp, int)
+            assert timestamp == (int(dt.replace(microsecond=0).timestamp()) *
+                                 1_000_000_000 + dt.microsecond * 1_000)
+
+        else:
+            assert timestamp == pytest.approx(dt.timestamp(), abs=1e-6)
+
+    timestamps = common.times_to_timestamps(
+        [times[0]._replace(size=common.TimeSize.TWO)], ns=ns)
+    now_timestamp = (now_dt.timestamp() * 1e9 if ns else now_dt.timestamp())
+    assert abs(timestamps[0] - now_timestamp) < (1e9 * 31 if ns else 31)
@@ -179,6 +179,142 @@ async def test_slave_send_master_poll_class2(mock_serial):
     await slave.async_close()
 
 
+async def _open_slave_connection(slave, **kwargs):
+    ep = await endpoint.create(port='1',
+                               address_size=common.AddressSize.ONE,
+                               direction_valid=False)
+
+    slave_conn_fut = slave.async_group.spawn(slave.open_connection,
+                                             addr=1, **kwargs)
+    await asyncio.sleep(0)
+
+    await ep.send(common.ReqFrame(direction=None,
+                                  frame_count_bit=False,
+                                  frame_count_valid=False,
+                                  function=common.ReqFunction.RESET_LINK,
+                                  address=1,
+                                  data=b''))
+    res = await ep.receive()
+    assert isinstance(res, common.ShortFrame)
+
+    slave_conn = await slave_conn_fut
+    return ep, slave_conn
+
+
+async def _request(ep, function, frame_count_bit):
+    await ep.send(common.ReqFrame(direction=None,
+                                  frame_count_bit=frame_count_bit,
+                                  frame_count_valid=True,
+                                  function=function,
+                                  address=1,
+                                  data=b''))
+    return await ep.receive()
+
+
+async def test_slave_data_classes(mock_serial):
+    slave = await unbalanced.slave.create_slave_link(
+        port='1', address_size=common.AddressSize.ONE, silent_interval=0)
+    ep, slave_conn = await _open_slave_connection(slave)
+
+    await slave_conn.send(b'x1', data_class=common.DataClass.CLASS_2, key=1)
+    await slave_conn.send(b'y', data_class=common.DataClass.CLASS_2, key=2)
+    await slave_conn.send(b'x2', data_class=common.DataClass.CLASS_2, key=1)
+    await slave_conn.send(b'e1')
+    await slave_conn.send(b'e2', data_class=common.DataClass.CLASS_1)
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_2, True)
+    assert res.function == common.ResFunction.RES_DATA
+    assert res.data == b'x2'
+    assert res.access_demand
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, False)
+    assert res.data == b'e1'
+    assert res.access_demand
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, True)
+    assert res.data == b'e2'
+    assert not res.access_demand
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, False)
+    assert isinstance(res, common.ShortFrame)
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_2, True)
+    assert res.data == b'y'
+    assert not res.access_demand
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_2, False)
+    assert isinstance(res, common.ShortFrame)
+
+    await ep.async_close()
+    await slave.async_close()
+
+
+async def test_slave_overflow_drop_oldest(mock_serial):
+    slave = await unbalanced.slave.create_slave_link(
+        port='1', address_size=common.AddressSize.ONE, silent_interval=0)
+    ep, slave_conn = await _open_slave_connection(
+        slave,
+        send_queue_size=2,
+        overflow_policy=common.OverflowPolicy.DROP_OLDEST)
+
+    await slave_conn.send(b'a')
+    await slave_conn.send(b'b')
+    assert not slave_conn.overflow
+
+    await slave_conn.send(b'c')
+    assert slave_conn.overflow
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, True)
+    assert res.data == b'b'
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, False)
+    assert res.data == b'c'
+
+    slave_conn.reset_overflow()
+    assert not slave_conn.overflow
+
+    await ep.async_close()
+    await slave.async_close()
+
+
+async def test_slave_overflow_block(mock_serial):
+    slave = await unbalanced.slave.create_slave_link(
+        port='1', address_size=common.AddressSize.ONE, silent_interval=0)
+    ep, slave_conn = await _open_slave_connection(
+        slave,
+        send_queue_size=1,
+        overflow_policy=common.OverflowPolicy.BLOCK)
+
+    await slave_conn.send(b'a')
+
+    send_future = slave.async_group.spawn(slave_conn.send, b'b')
+    await asyncio.sleep(0.01)
+    assert not send_future.done()
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, True)
+    assert res.data == b'a'
+    assert not res.access_demand
+
+    await send_future
+    assert not slave_conn.overflow
+
+    res = await _request(ep, common.ReqFunction.REQ_DATA_1, False)
+    assert res.data == b'b'
+
+    await slave_conn.send(b'c')
+
+    send_future = asyncio.create_task(slave_conn.send(b'd'))
+    await asyncio.sleep(0.01)
+    assert not send_future.done()
+
+    await slave_conn.async_close()
+    with pytest.raises(ConnectionError):
+        await send_future
+
+    await ep.async_close()
+    await slave.async_close()
+
+
 @pytest.mark.parametrize("slave_count, poll_delay", [
     (1, 0.01),
     (2, 0.01),
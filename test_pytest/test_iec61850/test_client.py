@@ -1,5 +1,6 @@
 from collections.abc import Collection
 import asyncio
+import collections
 import datetime
 import math
 import pytest
@@ -906,6 +907,78 @@ async def test_write_data(mms_srv_addr, ref, value_type, value,
     await mms_srv.async_close()
 
 
+@pytest.mark.parametrize('local_detail_calling, data_count, request_count', [
+    (None, 10, 1),
+    (None, 3000, 2),
+    (1000, 100, 4),
+])
+async def test_read_data(mms_srv_addr, local_detail_calling, data_count,
+                         request_count):
+    request_queue = aio.Queue()
+
+    def on_request(conn, req):
+        request_queue.put_nowait(req)
+        results = collections.deque()
+
+        for i in req.value:
+            index = int(i.name.item_id.split('$')[2][1:])
+
+            if index % 3 == 0:
+                results.append(mms.DataAccessError.OBJECT_NON_EXISTENT)
+
+            elif index % 3 == 1:
+                results.append(mms.IntegerData(index))
+
+            else:
+                results.append(mms.VisibleStringData(str(index)))
+
+        return mms.ReadResponse(list(results))
+
+    mms_srv = await mms.listen(
+        connection_cb=lambda _: None,
+        addr=mms_srv_addr,
+        request_cb=on_request)
+
+    refs = [iec61850.DataRef(logical_device='ld',
+                             logical_node='ln',
+                             fc='ST',
+                             names=(f'd{i}', 'stVal'))
+            for i in range(data_count)]
+
+    conn = await iec61850.connect(
+        addr=mms_srv_addr,
+        data_value_types={ref: iec61850.BasicValueType.INTEGER
+                          for ref in refs},
+        local_detail_calling=local_detail_calling)
+
+    results = await conn.read_data(refs)
+    assert len(results) == data_count
+
+    for i, result in enumerate(results):
+        if i % 3 == 0:
+            assert result == iec61850.ServiceError.INSTANCE_NOT_AVAILABLE
+
+        elif i % 3 == 1:
+            assert result == i
+
+        else:
+            assert result == iec61850.ServiceError.TYPE_CONFLICT
+
+    assert request_queue.qsize() == request_count
+
+    item_ids = collections.deque()
+    while not request_queue.empty():
+        req = request_queue.get_nowait()
+        assert isinstance(req, mms.ReadRequest)
+        item_ids.extend(i.name.item_id for i in req.value)
+
+    assert sorted(item_ids) == sorted(f'ln$ST$d{i}$stVal'
+                                      for i in range(data_count))
+
+    await conn.async_close()
+    await mms_srv.async_close()
+
+
 @pytest.mark.parametrize('ref, mms_request', [
     (iec61850.CommandRef(
         logical_device='ld1',
@@ -0,0 +1,72 @@
+import pytest
+
+from hat.drivers import mms
+from hat.drivers.iec61850 import encoder
+import hat.drivers.iec61850 as iec61850
+
+
+data_defs = [
+    encoder.DataDef(ref=iec61850.DataRef('ld1', 'ln1', 'ST', ('d1', 'Pos')),
+                    value_type=iec61850.AcsiValueType.DOUBLE_POINT),
+    encoder.DataDef(ref=iec61850.DataRef('ld1', 'ln1', 'MX', ('d2', 'mag')),
+                    value_type=iec61850.StructValueType([
+                        ('f', iec61850.BasicValueType.FLOAT),
+                        ('q', iec61850.ArrayValueType(
+                            iec61850.BasicValueType.INTEGER, 2))]))]
+
+
+@pytest.mark.parametrize('value_type, mms_data, value', [
+    (iec61850.BasicValueType.UNSIGNED,
+     mms.UnsignedData(123),
+     123),
+    (iec61850.AcsiValueType.STEP_POSITION,
+     mms.StructureData([mms.IntegerData(3), mms.BooleanData(True)]),
+     iec61850.StepPosition(value=3, transient=True)),
+    (iec61850.ArrayValueType(iec61850.AcsiValueType.DIRECTION, 2),
+     mms.ArrayData([mms.IntegerData(1), mms.IntegerData(2)]),
+     [iec61850.Direction.FORWARD, iec61850.Direction.BACKWARD]),
+])
+def test_value_decoder(value_type, mms_data, value):
+    decoder = encoder.create_value_decoder(value_type)
+
+    assert decoder(mms_data) == value
+    assert decoder(mms_data) == encoder.value_from_mms_data(mms_data,
+                                                            value_type)
+
+    with pytest.raises(Exception):
+        decoder(mms.VisibleStringData('abc'))
+
+
+@pytest.mark.parametrize('data_refs, success', [
+    (['ld1/ln1$ST$d1$Pos', 'ld1/ln1$MX$d2$mag'], True),
+    (['ld1/ln1$ST$d1$Pos', 'ld1/ln1$MX$d3$mag'], False),
+])
+def test_report_decoder(data_refs, success):
+    decoder = encoder.create_report_decoder(data_defs)
+    mms_data = [
+        mms.VisibleStringData('rpt_xyz'),
+        mms.BitStringData([False, False, False, False, False,
+                           True, False, False, False, False]),
+        mms.BitStringData([True, True]),
+        *(mms.VisibleStringData(i) for i in data_refs),
+        mms.BitStringData([True, False]),
+        mms.StructureData([mms.FloatingPointData(1.5),
+                           mms.ArrayData([mms.IntegerData(1),
+                                          mms.IntegerData(2)])])]
+
+    if not success:
+        with pytest.raises(Exception):
+            decoder(mms_data)
+        return
+
+    report = decoder(mms_data)
+
+    assert report.report_id == 'rpt_xyz'
+    assert list(report.data) == [
+        iec61850.ReportData(ref=data_defs[0].ref,
+                            value=iec61850.DoublePoint.ON,
+                            reasons=None),
+        iec61850.ReportData(ref=data_defs[1].ref,
+                            value={'f': 1.5, 'q': [1, 2]},
+                            reasons=None)]
+    assert report == encoder.report_from_mms_data(mms_data, data_defs)
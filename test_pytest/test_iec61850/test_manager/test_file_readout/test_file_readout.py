@@ -6,7 +6,8 @@ from hat import json
 from hat import util
 
 from hat.drivers.iec61850.manager.common import json_schema_repo
-from hat.drivers.iec61850.manager.file_readout import readout
+from hat.drivers.iec61850.manager.file_readout import (readout,
+                                                       iter_devices)
 
 
 json_schema_id = "hat-drivers://iec61850/readout.yaml"
@@ -552,3 +553,24 @@ def test_9(validator):
     device_json = res['devices'][0]
 
     assert len(device_json['rcbs']) == 134
+
+
+@pytest.mark.parametrize('ied_names', [None, [], ['E1_REL'],
+                                       ['E1_7SA', 'E1_REL', 'unknown']])
+def test_ied_names(validator, ied_names):
+    with importlib.resources.open_text(__package__, 'test3.scd') as f:
+        all_devices = readout(f)['devices']
+
+    with importlib.resources.as_file(
+            importlib.resources.files(__package__) / 'test3.scd') as path:
+        path_devices = list(iter_devices(path, ied_names))
+
+    with importlib.resources.open_text(__package__, 'test3.scd') as f:
+        res = readout(f, ied_names)
+
+    validator.validate(json_schema_id, res)
+
+    devices = [i for i in all_devices
+               if ied_names is None or i['ied_name'] in ied_names]
+    assert res['devices'] == devices
+    assert path_devices == devices
@@ -0,0 +1,463 @@
+"""End-to-end loopback benchmarks of all protocol stacks
+
+Each connection sequentially performs round trips (request and its echo or
+response) and measures their latency. Connections run concurrently. CPU time
+includes both client and server side, as both run in the same process.
+
+Payload sizes, connection counts and number of round trips are configured
+with ``--perf-payload-sizes``, ``--perf-concurrency`` and ``--perf-count``.
+Results are appended as JSON lines to ``--perf-results`` path.
+
+"""
+
+from collections.abc import Awaitable, Callable
+import asyncio
+import contextlib
+import datetime
+import importlib.metadata
+import json
+import pathlib
+import platform
+import statistics
+import time
+import typing
+
+import pytest
+
+from hat import aio
+from hat import asn1
+from hat import util
+
+from hat.drivers import acse
+from hat.drivers import chatter
+from hat.drivers import copp
+from hat.drivers import cosp
+from hat.drivers import cotp
+from hat.drivers import iec104
+from hat.drivers import mms
+from hat.drivers import snmp
+from hat.drivers import tcp
+from hat.drivers import tpkt
+from hat.drivers import udp
+from hat.drivers.mqtt import transport as mqtt_transport
+from hat.drivers.pnetgateway import transport as pnetgateway_transport
+from hat.drivers.smpp import transport as smpp_transport
+
+
+pytestmark = pytest.mark.perf
+
+
+_syntax_name = (1, 3, 6, 1, 4, 1, 0, 1)
+_app_context_name = (1, 3, 6, 1, 4, 1, 0, 2)
+
+Roundtrip: typing.TypeAlias = Callable[[], Awaitable[None]]
+
+StackCb: typing.TypeAlias = Callable[
+    [int | None, int],
+    contextlib.AbstractAsyncContextManager[list[Roundtrip]]]
+
+
+class Stack(typing.NamedTuple):
+    create: StackCb
+    payload: bool
+
+
+def pytest_generate_tests(metafunc):
+    if 'stack' not in metafunc.fixturenames:
+        return
+
+    payload_sizes = _parse_ints(
+        metafunc.config.getoption('--perf-payload-sizes'))
+    concurrencies = _parse_ints(
+        metafunc.config.getoption('--perf-concurrency'))
+
+    params = [pytest.param(name, payload_size, concurrency,
+                           id=f'{name}-{payload_size}-{concurrency}')
+              for name, stack in _stacks.items()
+              for payload_size in (payload_sizes if stack.payload
+                                   else [None])
+              for concurrency in concurrencies]
+
+    metafunc.parametrize('stack, payload_size, concurrency', params)
+
+
+@pytest.fixture
+def count(pytestconfig):
+    return pytestconfig.getoption('--perf-count')
+
+
+@pytest.fixture
+def results(pytestconfig):
+    path = pathlib.Path(pytestconfig.getoption('--perf-results'))
+
+    def write(result):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result) + '\n')
+
+    return write
+
+
+async def test_roundtrip(duration, results, stack, payload_size, concurrency,
+                         count):
+    create_stack = _stacks[stack].create
+
+    async with create_stack(payload_size, concurrency) as roundtrips:
+        for roundtrip in roundtrips:
+            await roundtrip()
+
+        description = (f'stack: {stack}; payload_size: {payload_size}; '
+                       f'concurrency: {concurrency}; count: {count}')
+
+        with duration(description):
+            latencies, wall_time, cpu_time = await _measure(roundtrips,
+                                                            count)
+
+    msg_count = len(latencies)
+    p50, p99 = _get_percentiles(latencies, [50, 99])
+
+    results({'stack': stack,
+             'payload_size': payload_size,
+             'concurrency': concurrency,
+             'count': msg_count,
+             'msgs_per_s': msg_count / wall_time,
+             'latency_p50': p50,
+             'latency_p99': p99,
+             'cpu_per_msg': cpu_time / msg_count,
+             'timestamp': datetime.datetime.now(
+                 datetime.timezone.utc).isoformat(),
+             'version': _get_version(),
+             'python': platform.python_version(),
+             'platform': platform.platform()})
+
+
+async def _measure(roundtrips, count):
+    latencies = []
+
+    async def run(roundtrip):
+        for _ in range(count):
+            start = time.perf_counter()
+            await roundtrip()
+            latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    await asyncio.gather(*(run(roundtrip) for roundtrip in roundtrips))
+
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return latencies, wall_time, cpu_time
+
+
+def _get_percentiles(values, percentiles):
+    if len(values) < 2:
+        return [values[0] for _ in percentiles]
+
+    quantiles = statistics.quantiles(values, n=100, method='inclusive')
+    return [quantiles[percentile - 1] for percentile in percentiles]
+
+
+def _get_version():
+    with contextlib.suppress(importlib.metadata.PackageNotFoundError):
+        return importlib.metadata.version('hat-drivers')
+
+
+def _parse_ints(value):
+    return [int(i) for i in value.split(',') if i.strip()]
+
+
+def _get_tcp_addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+async def _echo_loop(conn):
+    with contextlib.suppress(ConnectionError):
+        while True:
+            data = await conn.receive()
+            await conn.send(data)
+
+
+def _create_stream_stack(listen, connect, create_data):
+
+    @contextlib.asynccontextmanager
+    async def create(payload_size, concurrency):
+        addr = _get_tcp_addr()
+        data = create_data(payload_size)
+        conn_queue = aio.Queue()
+        group = aio.Group()
+        conns = []
+        srv_conns = []
+
+        srv = await listen(conn_queue.put_nowait, addr)
+
+        try:
+            for _ in range(concurrency):
+                conn = await connect(addr)
+                conns.append(conn)
+
+                srv_conn = await conn_queue.get()
+                srv_conns.append(srv_conn)
+                group.spawn(_echo_loop, srv_conn)
+
+            yield [_create_stream_roundtrip(conn, data) for conn in conns]
+
+        finally:
+            await group.async_close()
+
+            for conn in [*conns, *srv_conns]:
+                await conn.async_close()
+
+            await srv.async_close()
+
+    return create
+
+
+def _create_stream_roundtrip(conn, data):
+
+    async def roundtrip():
+        await conn.send(data)
+        await conn.receive()
+
+    return roundtrip
+
+
+async def _listen_pnetgateway(connection_cb, addr):
+    return await tcp.listen(
+        lambda conn: connection_cb(pnetgateway_transport.Transport(conn)),
+        addr,
+        bind_connections=True)
+
+
+async def _connect_pnetgateway(addr):
+    conn = await tcp.connect(addr)
+    return pnetgateway_transport.Transport(conn)
+
+
+def _create_entity(payload_size):
+    return _syntax_name, asn1.ber.Entity(
+        class_type=asn1.ClassType.UNIVERSAL,
+        tag_number=4,
+        content=asn1.ber.PrimitiveContent(b'x' * payload_size))
+
+
+def _create_iec104_msgs(payload_size):
+    return [iec104.DataMsg(
+        is_test=False,
+        originator_address=0,
+        asdu_address=123,
+        io_address=321,
+        data=iec104.DoubleData(
+            value=iec104.DoubleValue.ON,
+            quality=iec104.IndicationQuality(invalid=False,
+                                             not_topical=False,
+                                             substituted=False,
+                                             blocked=False)),
+        time=None,
+        cause=iec104.DataResCause.SPONTANEOUS)]
+
+
+def _create_mqtt_packet(payload_size):
+    return mqtt_transport.PublishPacket(
+        duplicate=False,
+        qos=mqtt_transport.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name='a/b/c',
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=b'x' * payload_size)
+
+
+@contextlib.asynccontextmanager
+async def _create_mms_stack(payload_size, concurrency):
+    addr = _get_tcp_addr()
+    req = mms.WriteRequest(
+        specification=[mms.NameVariableSpecification(
+            mms.VmdSpecificObjectName('x'))],
+        data=[mms.OctetStringData(b'x' * payload_size)])
+    res = mms.WriteResponse([None])
+    conns = []
+
+    srv = await mms.listen(lambda conn: None, addr,
+                           request_cb=lambda conn, req: res,
+                           bind_connections=True)
+
+    try:
+        for _ in range(concurrency):
+            conn = await mms.connect(addr)
+            conns.append(conn)
+
+        yield [_create_request_roundtrip(conn.send_confirmed, req)
+               for conn in conns]
+
+    finally:
+        for conn in conns:
+            await conn.async_close()
+
+        await srv.async_close()
+
+
+@contextlib.asynccontextmanager
+async def _create_smpp_stack(payload_size, concurrency):
+    addr = _get_tcp_addr()
+    req = smpp_transport.DataSmReq(
+        service_type='',
+        source_addr_ton=smpp_transport.TypeOfNumber.UNKNOWN,
+        source_addr_npi=smpp_transport.NumericPlanIndicator.UNKNOWN,
+        source_addr='',
+        dest_addr_ton=smpp_transport.TypeOfNumber.UNKNOWN,
+        dest_addr_npi=smpp_transport.NumericPlanIndicator.UNKNOWN,
+        destination_addr='abc',
+        esm_class=smpp_transport.EsmClass(
+            messaging_mode=smpp_transport.MessagingMode.DEFAULT,
+            message_type=smpp_transport.MessageType.DEFAULT,
+            gsm_features=set()),
+        registered_delivery=smpp_transport.RegisteredDelivery(
+            delivery_receipt=smpp_transport.DeliveryReceipt.NO_RECEIPT,
+            acknowledgements=set(),
+            intermediate_notification=False),
+        data_coding=smpp_transport.DataCoding.DEFAULT,
+        optional_params={
+            smpp_transport.OptionalParamTag.MESSAGE_PAYLOAD:
+                b'x' * payload_size})
+    res = smpp_transport.DataSmRes(message_id=b'abc',
+                                   optional_params={})
+    conns = []
+
+    def on_connection(conn):
+        conns.append(smpp_transport.Connection(conn=conn,
+                                               request_cb=lambda req: res,
+                                               notification_cb=None))
+
+    srv = await tcp.listen(on_connection, addr,
+                           bind_connections=True)
+
+    try:
+        roundtrips = []
+        for _ in range(concurrency):
+            conn = smpp_transport.Connection(conn=await tcp.connect(addr),
+                                             request_cb=None,
+                                             notification_cb=None)
+            conns.append(conn)
+            roundtrips.append(_create_request_roundtrip(conn.send, req))
+
+        yield roundtrips
+
+    finally:
+        for conn in conns:
+            await conn.async_close()
+
+        await srv.async_close()
+
+
+@contextlib.asynccontextmanager
+async def _create_snmp_stack(payload_size, concurrency):
+    addr = udp.Address('127.0.0.1', util.get_unused_udp_port())
+    name = (1, 3, 6, 1, 4, 1, 0, 1)
+    req = snmp.GetDataReq(names=[name])
+    res = [snmp.StringData(name=name, value=b'x' * payload_size)]
+    managers = []
+
+    agent = await snmp.create_agent(local_addr=addr,
+                                    v2c_request_cb=lambda addr, comm, req: res)
+
+    try:
+        for _ in range(concurrency):
+            manager = await snmp.create_v2c_manager(addr)
+            managers.append(manager)
+
+        yield [_create_request_roundtrip(manager.send, req)
+               for manager in managers]
+
+    finally:
+        for manager in managers:
+            await manager.async_close()
+
+        await agent.async_close()
+
+
+def _create_request_roundtrip(send, req):
+
+    async def roundtrip():
+        await send(req)
+
+    return roundtrip
+
+
+_stacks = {
+    'tpkt': Stack(
+        create=_create_stream_stack(
+            listen=tpkt.listen,
+            connect=tpkt.connect,
+            create_data=lambda payload_size: b'x' * payload_size),
+        payload=True),
+    'cotp': Stack(
+        create=_create_stream_stack(
+            listen=cotp.listen,
+            connect=cotp.connect,
+            create_data=lambda payload_size: b'x' * payload_size),
+        payload=True),
+    'cosp': Stack(
+        create=_create_stream_stack(
+            listen=lambda cb, addr: cosp.listen(lambda user_data: None,
+                                                cb, addr),
+            connect=cosp.connect,
+            create_data=lambda payload_size: b'x' * payload_size),
+        payload=True),
+    'copp': Stack(
+        create=_create_stream_stack(
+            listen=lambda cb, addr: copp.listen(
+                lambda syntax_names, user_data: user_data, cb, addr),
+            connect=lambda addr: copp.connect(
+                addr, copp.SyntaxNames([_syntax_name]), _create_entity(0)),
+            create_data=_create_entity),
+        payload=True),
+    'acse': Stack(
+        create=_create_stream_stack(
+            listen=lambda cb, addr: acse.listen(
+                lambda syntax_names, user_data: user_data, cb, addr),
+            connect=lambda addr: acse.connect(
+                addr, [_syntax_name], _app_context_name, _create_entity(0)),
+            create_data=_create_entity),
+        payload=True),
+    'mms': Stack(
+        create=_create_mms_stack,
+        payload=True),
+    'iec104': Stack(
+        create=_create_stream_stack(
+            listen=iec104.listen,
+            connect=iec104.connect,
+            create_data=_create_iec104_msgs),
+        payload=False),
+    'chatter': Stack(
+        create=_create_stream_stack(
+            listen=chatter.listen,
+            connect=chatter.connect,
+            create_data=lambda payload_size: chatter.Data(
+                'benchmark', b'x' * payload_size)),
+        payload=True),
+    'mqtt': Stack(
+        create=_create_stream_stack(
+            listen=mqtt_transport.listen,
+            connect=mqtt_transport.connect,
+            create_data=_create_mqtt_packet),
+        payload=True),
+    'smpp': Stack(
+        create=_create_smpp_stack,
+        payload=True),
+    'pnetgateway': Stack(
+        create=_create_stream_stack(
+            listen=_listen_pnetgateway,
+            connect=_connect_pnetgateway,
+            create_data=lambda payload_size: 'x' * payload_size),
+        payload=True),
+    'snmp': Stack(
+        create=_create_snmp_stack,
+        payload=True)}
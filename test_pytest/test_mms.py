@@ -54,6 +54,26 @@ async def test_connect(addr, conn_count):
     await server.async_close()
 
 
+@pytest.mark.parametrize("local_detail_calling", [None, 1234])
+async def test_negotiated_parameters(addr, local_detail_calling):
+    server_conn_queue = aio.Queue()
+    server = await mms.listen(server_conn_queue.put_nowait, addr)
+
+    client_conn = await mms.connect(addr,
+                                    local_detail_calling=local_detail_calling)
+    server_conn = await server_conn_queue.get()
+
+    assert client_conn.max_pdu_size == local_detail_calling
+    assert server_conn.max_pdu_size == local_detail_calling
+
+    assert client_conn.max_outstanding == 5
+    assert server_conn.max_outstanding == 5
+
+    await client_conn.async_close()
+    await server_conn.async_close()
+    await server.async_close()
+
+
 async def test_connection_info(addr):
     server_conn_queue = aio.Queue()
     server = await mms.listen(server_conn_queue.put_nowait, addr)
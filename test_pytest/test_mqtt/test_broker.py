@@ -0,0 +1,213 @@
+import asyncio
+
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import mqtt
+from hat.drivers import tcp
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+def create_subscription(topic_filter,
+                        maximum_qos=mqtt.QoS.EXACLTY_ONCE,
+                        retain_handling=mqtt.RetainHandling.SEND_ON_SUBSCRIBE):
+    return mqtt.Subscription(topic_filter=topic_filter,
+                             maximum_qos=maximum_qos,
+                             no_local=False,
+                             retain_as_published=False,
+                             retain_handling=retain_handling)
+
+
+async def test_connect(addr):
+    broker = await mqtt.listen(addr)
+
+    client1 = await mqtt.connect(addr)
+    client2 = await mqtt.connect(addr, client_id='abc')
+
+    assert client1.client_id
+    assert client1.client_id != 'abc'
+    assert client2.client_id == 'abc'
+    assert client1.maximum_qos == mqtt.QoS.EXACLTY_ONCE
+
+    await client1.async_close()
+    await client2.async_close()
+    await broker.async_close()
+
+
+async def test_session_taken_over(addr):
+    broker = await mqtt.listen(addr)
+
+    client1 = await mqtt.connect(addr, client_id='abc')
+    client2 = await mqtt.connect(addr, client_id='abc')
+
+    await client1.wait_closed()
+    assert client2.is_open
+
+    await client2.async_close()
+    await broker.async_close()
+
+
+@pytest.mark.parametrize('qos', list(mqtt.QoS))
+async def test_publish_subscribe(addr, qos):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    subscriber = await mqtt.connect(
+        addr, msg_cb=lambda _, msg: msg_queue.put_nowait(msg))
+    publisher = await mqtt.connect(addr)
+
+    reasons = await subscriber.subscribe([create_subscription('a/+')])
+    assert list(reasons) == [mqtt.Reason.GRANTED_QOS_2]
+
+    for i in range(3):
+        await publisher.publish(mqtt.Msg(topic=f'a/{i}',
+                                         payload=str(i),
+                                         qos=qos,
+                                         retain=False))
+
+    await publisher.publish(mqtt.Msg(topic='b/0',
+                                     payload=b'',
+                                     qos=qos,
+                                     retain=False))
+
+    for i in range(3):
+        msg = await msg_queue.get()
+        assert msg.topic == f'a/{i}'
+        assert msg.payload == str(i)
+        assert msg.qos == qos
+
+    await asyncio.sleep(0.01)
+    assert msg_queue.empty()
+
+    reasons = await subscriber.unsubscribe(['a/+', 'b/+'])
+    assert list(reasons) == [mqtt.Reason.SUCCESS,
+                             mqtt.Reason.NO_SUBSCRIPTION_EXISTED]
+
+    await publisher.publish(mqtt.Msg(topic='a/0',
+                                     payload=b'',
+                                     qos=qos,
+                                     retain=False))
+
+    await asyncio.sleep(0.01)
+    assert msg_queue.empty()
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
+
+
+async def test_maximum_qos(addr):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    subscriber = await mqtt.connect(
+        addr, msg_cb=lambda _, msg: msg_queue.put_nowait(msg))
+    publisher = await mqtt.connect(addr)
+
+    await subscriber.subscribe([
+        create_subscription('a', maximum_qos=mqtt.QoS.AT_LEAST_ONCE)])
+
+    await publisher.publish(mqtt.Msg(topic='a',
+                                     payload=b'',
+                                     qos=mqtt.QoS.EXACLTY_ONCE))
+
+    msg = await msg_queue.get()
+    assert msg.qos == mqtt.QoS.AT_LEAST_ONCE
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
+
+
+async def test_retained(addr):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    publisher = await mqtt.connect(addr)
+    subscriber = await mqtt.connect(
+        addr, msg_cb=lambda _, msg: msg_queue.put_nowait(msg))
+
+    await publisher.publish(mqtt.Msg(topic='a/b', payload='1', retain=True))
+    await publisher.publish(mqtt.Msg(topic='a/c', payload='2', retain=True))
+    await publisher.publish(mqtt.Msg(topic='a/c', payload='', retain=True))
+    await publisher.publish(mqtt.Msg(topic='b', payload='3', retain=True))
+    await publisher.publish(mqtt.Msg(topic='a/d', payload='4', retain=False))
+
+    await subscriber.subscribe([create_subscription('a/#')])
+
+    msg = await msg_queue.get()
+    assert msg.topic == 'a/b'
+    assert msg.payload == '1'
+    assert msg.retain is True
+
+    await subscriber.subscribe([
+        create_subscription(
+            'a/#', retain_handling=mqtt.RetainHandling.SEND_ON_NEW_SUBSCRIBE)])
+    await subscriber.subscribe([
+        create_subscription(
+            'a/+', retain_handling=mqtt.RetainHandling.DONT_SEND)])
+
+    await asyncio.sleep(0.01)
+    assert msg_queue.empty()
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
+
+
+@pytest.mark.parametrize('topic_alias_maximum', [0, 1, 10])
+async def test_topic_alias(addr, topic_alias_maximum):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr, topic_alias_maximum=topic_alias_maximum)
+
+    subscriber = await mqtt.connect(
+        addr,
+        msg_cb=lambda _, msg: msg_queue.put_nowait(msg),
+        topic_alias_maximum=topic_alias_maximum)
+    publisher = await mqtt.connect(addr)
+
+    await subscriber.subscribe([create_subscription('#')])
+
+    topics = ['a/b/c', 'x/y/z', 'a/b/c', 'a/b/c', 'q', 'x/y/z']
+    for topic in topics:
+        await publisher.publish(mqtt.Msg(topic=topic, payload=b''))
+
+    for topic in topics:
+        msg = await msg_queue.get()
+        assert msg.topic == topic
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
+
+
+async def test_router(addr):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    router = await mqtt.create_router(addr)
+    publisher = await mqtt.connect(addr)
+
+    await router.subscribe(create_subscription('a/+'),
+                           lambda _, msg: msg_queue.put_nowait(('a/+', msg)))
+    await router.subscribe(create_subscription('#'),
+                           lambda _, msg: msg_queue.put_nowait(('#', msg)))
+
+    await publisher.publish(mqtt.Msg(topic='a/b', payload=b''))
+
+    results = [await msg_queue.get(), await msg_queue.get()]
+    assert {topic_filter for topic_filter, _ in results} == {'a/+', '#'}
+    assert all(msg.topic == 'a/b' for _, msg in results)
+
+    await asyncio.sleep(0.01)
+    assert msg_queue.empty()
+
+    await publisher.async_close()
+    await router.async_close()
+    await broker.async_close()
@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import mqtt
+from hat.drivers import tcp
+from hat.drivers.mqtt import transport
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+def create_connack_packet(topic_alias_maximum=0):
+    return transport.ConnAckPacket(
+        session_present=False,
+        reason=mqtt.Reason.SUCCESS,
+        session_expiry_interval=None,
+        receive_maximum=0xffff,
+        maximum_qos=mqtt.QoS.EXACLTY_ONCE,
+        retain_available=True,
+        maximum_packet_size=None,
+        assigned_client_identifier=None,
+        topic_alias_maximum=topic_alias_maximum,
+        reason_string=None,
+        user_properties=[],
+        wildcard_subscription_available=True,
+        subscription_identifier_available=True,
+        shared_subscription_available=True,
+        server_keep_alive=None,
+        response_information=None,
+        server_reference=None,
+        authentication_method=None,
+        authentication_data=None)
+
+
+def create_publish_packet(topic_name, topic_alias):
+    return transport.PublishPacket(
+        duplicate=False,
+        qos=mqtt.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name=topic_name,
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=topic_alias,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=b'')
+
+
+async def accept(conn_queue, connack):
+    conn = await conn_queue.get()
+
+    req = await conn.receive()
+    assert isinstance(req, transport.ConnectPacket)
+
+    await conn.send(connack)
+    return conn, req
+
+
+async def test_connect(addr):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    client_future = asyncio.create_task(mqtt.connect(addr))
+    conn, req = await accept(conn_queue, create_connack_packet())
+    client = await client_future
+
+    assert client.is_open
+    assert req.topic_alias_maximum == 0
+
+    await client.async_close()
+    await conn.async_close()
+    await srv.async_close()
+
+
+async def test_publish_topic_alias(addr):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    client_future = asyncio.create_task(mqtt.connect(addr))
+    conn, _ = await accept(conn_queue, create_connack_packet(2))
+    client = await client_future
+
+    topics = ['a/b/c', 'x/y/z', 'a/b/c', 'q', 'x/y/z', 'a/b/c']
+    for topic in topics:
+        await client.publish(mqtt.Msg(topic=topic, payload=b''))
+
+    packets = [await conn.receive() for _ in topics]
+    assert [(packet.topic_name, packet.topic_alias)
+            for packet in packets] == [('a/b/c', 1),
+                                       ('x/y/z', 2),
+                                       ('', 1),
+                                       ('q', 2),
+                                       ('x/y/z', 1),
+                                       ('a/b/c', 2)]
+
+    await client.async_close()
+    await conn.async_close()
+    await srv.async_close()
+
+
+async def test_publish_without_topic_alias(addr):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    client_future = asyncio.create_task(mqtt.connect(addr))
+    conn, _ = await accept(conn_queue, create_connack_packet(0))
+    client = await client_future
+
+    for _ in range(2):
+        await client.publish(mqtt.Msg(topic='a/b/c', payload=b''))
+
+        packet = await conn.receive()
+        assert packet.topic_name == 'a/b/c'
+        assert packet.topic_alias is None
+
+    await client.async_close()
+    await conn.async_close()
+    await srv.async_close()
+
+
+async def test_receive_topic_alias(addr):
+    conn_queue = aio.Queue()
+    msg_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    client_future = asyncio.create_task(
+        mqtt.connect(addr,
+                     msg_cb=lambda _, msg: msg_queue.put_nowait(msg),
+                     topic_alias_maximum=2))
+    conn, req = await accept(conn_queue, create_connack_packet())
+    client = await client_future
+
+    assert req.topic_alias_maximum == 2
+
+    await conn.send(create_publish_packet('a/b/c', 1))
+    await conn.send(create_publish_packet('', 1))
+    await conn.send(create_publish_packet('x/y/z', 1))
+    await conn.send(create_publish_packet('', 1))
+
+    topics = [(await msg_queue.get()).topic for _ in range(4)]
+    assert topics == ['a/b/c', 'a/b/c', 'x/y/z', 'x/y/z']
+
+    await client.async_close()
+    await conn.async_close()
+    await srv.async_close()
+
+
+@pytest.mark.parametrize('topic_name, topic_alias', [
+    ('a/b/c', 3),
+    ('a/b/c', 0),
+    ('', 1),
+    ('', None),
+])
+async def test_receive_invalid_topic_alias(addr, topic_name, topic_alias):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    client_future = asyncio.create_task(
+        mqtt.connect(addr, topic_alias_maximum=2))
+    conn, _ = await accept(conn_queue, create_connack_packet())
+    client = await client_future
+
+    await conn.send(create_publish_packet(topic_name, topic_alias))
+
+    packet = await conn.receive()
+    assert isinstance(packet, transport.DisconnectPacket)
+    assert mqtt.is_error_reason(packet.reason)
+
+    await client.wait_closed()
+    await conn.async_close()
+    await srv.async_close()
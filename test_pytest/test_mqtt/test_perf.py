@@ -0,0 +1,150 @@
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import mqtt
+from hat.drivers import tcp
+from hat.drivers.mqtt import common
+from hat.drivers.mqtt import transport
+
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+def create_publish_packet(payload_size):
+    return transport.PublishPacket(
+        duplicate=False,
+        qos=common.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name='a/b/c',
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=b'x' * payload_size)
+
+
+def create_subscription(topic_filter, qos):
+    return mqtt.Subscription(topic_filter=topic_filter,
+                             maximum_qos=qos,
+                             no_local=False,
+                             retain_as_published=False,
+                             retain_handling=mqtt.RetainHandling.DONT_SEND)
+
+
+@pytest.mark.parametrize("packet_count", [1000])
+@pytest.mark.parametrize("payload_size", [0, 16, 1024, 64 * 1024])
+def test_encode_publish(duration, packet_count, payload_size):
+    packet = create_publish_packet(payload_size)
+
+    with duration(f'packet_count: {packet_count}; '
+                  f'payload_size: {payload_size}'):
+        for _ in range(packet_count):
+            transport.encode_packet(packet)
+
+
+@pytest.mark.parametrize("packet_count", [1000])
+@pytest.mark.parametrize("payload_size", [0, 16, 1024, 64 * 1024])
+def test_decode_publish(duration, packet_count, payload_size):
+    packet = create_publish_packet(payload_size)
+    packet_bytes = transport.encode_packet(packet)
+
+    with duration(f'packet_count: {packet_count}; '
+                  f'payload_size: {payload_size}'):
+        for _ in range(packet_count):
+            transport.decode_packet(packet_bytes)
+
+
+@pytest.mark.parametrize("packet_count", [1000])
+@pytest.mark.parametrize("payload_size", [0, 16, 1024, 64 * 1024])
+async def test_send_receive_publish(duration, addr, packet_count,
+                                    payload_size):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+    conn1 = await transport.connect(addr)
+    conn2 = await conn_queue.get()
+
+    packet = create_publish_packet(payload_size)
+
+    with duration(f'packet_count: {packet_count}; '
+                  f'payload_size: {payload_size}'):
+        for _ in range(packet_count):
+            await conn1.send(packet)
+            await conn2.receive()
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
+@pytest.mark.parametrize("msg_count", [1000])
+@pytest.mark.parametrize("payload_size", [16, 1024, 64 * 1024])
+@pytest.mark.parametrize("qos", list(common.QoS))
+async def test_broker_throughput(duration, addr, msg_count, payload_size,
+                                 qos):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    subscriber = await mqtt.connect(
+        addr, msg_cb=lambda _, msg: msg_queue.put_nowait(msg))
+    publisher = await mqtt.connect(addr)
+
+    await subscriber.subscribe([create_subscription('a/#', qos)])
+
+    msg = mqtt.Msg(topic='a/b/c',
+                   payload=b'x' * payload_size,
+                   qos=qos,
+                   retain=False)
+
+    with duration(f'msg_count: {msg_count}; '
+                  f'payload_size: {payload_size}; '
+                  f'qos: {qos.name}'):
+        for _ in range(msg_count):
+            await publisher.publish(msg)
+
+        for _ in range(msg_count):
+            await msg_queue.get()
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
+
+
+@pytest.mark.parametrize("msg_count", [1000])
+@pytest.mark.parametrize("payload_size", [16, 1024, 64 * 1024])
+@pytest.mark.parametrize("qos", list(common.QoS))
+async def test_broker_latency(duration, addr, msg_count, payload_size, qos):
+    msg_queue = aio.Queue()
+    broker = await mqtt.listen(addr)
+
+    subscriber = await mqtt.connect(
+        addr, msg_cb=lambda _, msg: msg_queue.put_nowait(msg))
+    publisher = await mqtt.connect(addr)
+
+    await subscriber.subscribe([create_subscription('a/#', qos)])
+
+    msg = mqtt.Msg(topic='a/b/c',
+                   payload=b'x' * payload_size,
+                   qos=qos,
+                   retain=False)
+
+    with duration(f'msg_count: {msg_count}; '
+                  f'payload_size: {payload_size}; '
+                  f'qos: {qos.name}'):
+        for _ in range(msg_count):
+            await publisher.publish(msg)
+            await msg_queue.get()
+
+    await publisher.async_close()
+    await subscriber.async_close()
+    await broker.async_close()
@@ -0,0 +1,288 @@
+import asyncio
+
+import pytest
+
+from hat import aio
+from hat import util
+
+from hat.drivers import mqtt
+from hat.drivers import tcp
+from hat.drivers.mqtt import transport
+
+
+@pytest.fixture
+def addr():
+    return tcp.Address('127.0.0.1', util.get_unused_tcp_port())
+
+
+def create_connack_packet(subscription_identifier_available):
+    return transport.ConnAckPacket(
+        session_present=False,
+        reason=mqtt.Reason.SUCCESS,
+        session_expiry_interval=None,
+        receive_maximum=0xffff,
+        maximum_qos=mqtt.QoS.EXACLTY_ONCE,
+        retain_available=True,
+        maximum_packet_size=None,
+        assigned_client_identifier=None,
+        topic_alias_maximum=0,
+        reason_string=None,
+        user_properties=[],
+        wildcard_subscription_available=True,
+        subscription_identifier_available=subscription_identifier_available,
+        shared_subscription_available=True,
+        server_keep_alive=None,
+        response_information=None,
+        server_reference=None,
+        authentication_method=None,
+        authentication_data=None)
+
+
+def create_publish_packet(topic_name, subscription_identifiers=[]):
+    return transport.PublishPacket(
+        duplicate=False,
+        qos=mqtt.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name=topic_name,
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=subscription_identifiers,
+        content_type=None,
+        payload=b'')
+
+
+def create_subscription(topic_filter):
+    return mqtt.Subscription(topic_filter=topic_filter,
+                             maximum_qos=mqtt.QoS.AT_MOST_ONCE,
+                             no_local=False,
+                             retain_as_published=False,
+                             retain_handling=mqtt.RetainHandling.DONT_SEND)
+
+
+class Broker(aio.Resource):
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._packet_queue = aio.Queue()
+        self.async_group.spawn(self._receive_loop)
+
+    @property
+    def async_group(self):
+        return self._conn.async_group
+
+    async def send(self, packet):
+        await self._conn.send(packet)
+
+    async def receive(self):
+        return await self._packet_queue.get()
+
+    async def _receive_loop(self):
+        try:
+            while True:
+                packet = await self._conn.receive()
+
+                if isinstance(packet, transport.SubscribePacket):
+                    await self._conn.send(transport.SubAckPacket(
+                        packet_identifier=packet.packet_identifier,
+                        reason_string=None,
+                        user_properties=[],
+                        reasons=[mqtt.Reason.SUCCESS]))
+
+                elif isinstance(packet, transport.UnsubscribePacket):
+                    await self._conn.send(transport.UnsubAckPacket(
+                        packet_identifier=packet.packet_identifier,
+                        reason_string=None,
+                        user_properties=[],
+                        reasons=[mqtt.Reason.SUCCESS]))
+
+                self._packet_queue.put_nowait(packet)
+
+        except ConnectionError:
+            pass
+
+        finally:
+            self.close()
+
+
+async def create_router(addr, subscription_identifier_available):
+    conn_queue = aio.Queue()
+    srv = await transport.listen(conn_queue.put_nowait, addr)
+
+    router_task = asyncio.create_task(mqtt.create_router(addr))
+
+    conn = await conn_queue.get()
+    await conn.receive()
+    await conn.send(
+        create_connack_packet(subscription_identifier_available))
+
+    router = await router_task
+    broker = Broker(conn)
+
+    await srv.async_close()
+    return router, broker
+
+
+@pytest.mark.parametrize('topic_filter, topic_name, matches', [
+    ('a/b/c', 'a/b/c', True),
+    ('a/b/c', 'a/b', False),
+    ('a/b', 'a/b/c', False),
+    ('a/+/c', 'a/b/c', True),
+    ('a/+/c', 'a/b/d', False),
+    ('a/+', 'a/b/c', False),
+    ('+/+', 'a/b', True),
+    ('+', '', True),
+    ('+/b', '/b', True),
+    ('a/#', 'a', True),
+    ('a/#', 'a/b/c', True),
+    ('a/#', 'b/c', False),
+    ('#', 'a/b/c', True),
+    ('#', '$SYS/a', False),
+    ('+/a', '$SYS/a', False),
+    ('$SYS/#', '$SYS/a', True),
+    ('$SYS/+', '$SYS/a', True),
+])
+def test_trie_match(topic_filter, topic_name, matches):
+    trie = mqtt.TopicFilterTrie()
+    trie.add(topic_filter, 123)
+
+    result = list(trie.match(topic_name))
+    assert result == ([123] if matches else [])
+
+
+def test_trie_multiple_filters():
+    trie = mqtt.TopicFilterTrie()
+    trie.add('a/b/c', 1)
+    trie.add('a/+/c', 2)
+    trie.add('a/#', 3)
+    trie.add('x/#', 4)
+    trie.add('a/b/c', 5)
+
+    assert set(trie.match('a/b/c')) == {1, 2, 3, 5}
+    assert set(trie.match('a/x/c')) == {2, 3}
+    assert set(trie.match('x')) == {4}
+
+    trie.remove('a/b/c', 1)
+    trie.remove('a/#', 3)
+    trie.remove('a/#', 3)
+    trie.remove('y', 4)
+
+    assert set(trie.match('a/b/c')) == {2, 5}
+
+    trie.remove('a/+/c', 2)
+    trie.remove('a/b/c', 5)
+    trie.remove('x/#', 4)
+
+    assert trie._root.children == {}
+
+
+@pytest.mark.parametrize('topic_filter', ['', 'a/#/b', 'a#', 'a/b+', '+a'])
+def test_trie_invalid_filter(topic_filter):
+    trie = mqtt.TopicFilterTrie()
+
+    with pytest.raises(ValueError):
+        trie.add(topic_filter, 123)
+
+
+@pytest.mark.parametrize('subscription_identifier_available', [True, False])
+async def test_subscribe(addr, subscription_identifier_available):
+    router, broker = await create_router(addr,
+                                         subscription_identifier_available)
+
+    msg_queues = {}
+    identifiers = {}
+
+    for topic_filter in ['a/b', 'a/+', '#']:
+        msg_queue = aio.Queue()
+        msg_queues[topic_filter] = msg_queue
+
+        route = await router.subscribe(
+            create_subscription(topic_filter),
+            lambda _, msg, msg_queue=msg_queue: msg_queue.put_nowait(msg))
+        assert route.topic_filter == topic_filter
+
+        packet = await broker.receive()
+        assert isinstance(packet, transport.SubscribePacket)
+
+        if subscription_identifier_available:
+            assert packet.subscription_identifier is not None
+
+        else:
+            assert packet.subscription_identifier is None
+
+        identifiers[topic_filter] = packet.subscription_identifier
+
+    if subscription_identifier_available:
+        await broker.send(create_publish_packet(
+            'a/b', [identifiers['a/b'], identifiers['#']]))
+
+    else:
+        await broker.send(create_publish_packet('a/b'))
+
+    assert (await msg_queues['a/b'].get()).topic == 'a/b'
+    assert (await msg_queues['#'].get()).topic == 'a/b'
+
+    await asyncio.sleep(0.01)
+    if subscription_identifier_available:
+        assert msg_queues['a/+'].empty()
+
+    else:
+        assert (await msg_queues['a/+'].get()).topic == 'a/b'
+
+    await router.async_close()
+    await broker.async_close()
+
+
+async def test_slow_route(addr):
+    router, broker = await create_router(addr, False)
+
+    slow_event = asyncio.Event()
+    msg_queue = aio.Queue()
+
+    async def on_slow_msg(client, msg):
+        await slow_event.wait()
+
+    await router.subscribe(create_subscription('a'), on_slow_msg)
+    await router.subscribe(create_subscription('#'),
+                           lambda _, msg: msg_queue.put_nowait(msg))
+
+    for _ in range(10):
+        await broker.send(create_publish_packet('a'))
+
+    for _ in range(10):
+        msg = await aio.wait_for(msg_queue.get(), 1)
+        assert msg.topic == 'a'
+
+    slow_event.set()
+
+    await router.async_close()
+    await broker.async_close()
+
+
+async def test_route_close(addr):
+    router, broker = await create_router(addr, True)
+
+    route1 = await router.subscribe(create_subscription('a'),
+                                    lambda _, msg: None)
+    route2 = await router.subscribe(create_subscription('a'),
+                                    lambda _, msg: None)
+
+    packet = await broker.receive()
+    assert isinstance(packet, transport.SubscribePacket)
+
+    await route1.async_close()
+    await route2.async_close()
+
+    packet = await broker.receive()
+    assert isinstance(packet, transport.UnsubscribePacket)
+    assert list(packet.topic_filters) == ['a']
+
+    assert router.is_open
+
+    await router.async_close()
+    assert route1.is_closed
+
+    await broker.async_close()
@@ -73,6 +73,51 @@ packets = [
         server_reference=None,
         authentication_method=None,
         authentication_data=None),
+
+    transport.PublishPacket(
+        duplicate=False,
+        qos=common.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name='a/b/c',
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=b''),
+
+    transport.PublishPacket(
+        duplicate=True,
+        qos=common.QoS.AT_LEAST_ONCE,
+        retain=True,
+        topic_name='a/b/c',
+        packet_identifier=123,
+        message_expiry_interval=321,
+        topic_alias=None,
+        response_topic='x/y/z',
+        correlation_data=b'xyz',
+        user_properties=[('abc', '123')],
+        subscription_identifiers=[],
+        content_type='text/plain',
+        payload='abc'),
+
+    transport.PublishPacket(
+        duplicate=False,
+        qos=common.QoS.EXACLTY_ONCE,
+        retain=False,
+        topic_name='a',
+        packet_identifier=1,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=bytes(range(256)) * 256),
 ]
 
 
@@ -110,6 +155,32 @@ def test_encode_decode(packet):
     assert_packet_equal(decoded_packet, packet)
 
 
+@pytest.mark.parametrize('payload', [b'', b'abc', bytes(range(256)) * 256])
+def test_publish_payload(payload):
+    packet = transport.PublishPacket(
+        duplicate=False,
+        qos=common.QoS.AT_MOST_ONCE,
+        retain=False,
+        topic_name='a/b/c',
+        packet_identifier=None,
+        message_expiry_interval=None,
+        topic_alias=None,
+        response_topic=None,
+        correlation_data=None,
+        user_properties=[],
+        subscription_identifiers=[],
+        content_type=None,
+        payload=memoryview(payload))
+
+    encoded_packet = transport.encode_packet(packet)
+    assert encoded_packet.endswith(payload)
+
+    decoded_packet = transport.decode_packet(encoded_packet)
+    assert isinstance(decoded_packet.payload, memoryview)
+    assert decoded_packet.payload.obj is encoded_packet
+    assert decoded_packet.payload == payload
+
+
 @pytest.mark.parametrize('packet', packets)
 async def test_send_receive(addr, packet):
     conn_queue = aio.Queue()
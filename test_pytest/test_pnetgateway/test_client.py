@@ -113,6 +113,68 @@ async def test_data_changed(addr):
     await srv.async_close()
 
 
+async def test_data_changed_delay(addr):
+    conn_queue = aio.Queue()
+    srv = await tcp.listen(conn_queue.put_nowait, addr)
+
+    status_queue = aio.Queue()
+    data_queue = aio.Queue()
+    conn1_future = asyncio.ensure_future(
+        client.connect(addr=addr,
+                       username='user1',
+                       password='pass1',
+                       status_cb=status_queue.put_nowait,
+                       data_cb=data_queue.put_nowait,
+                       data_delay=0.1))
+
+    conn2 = await conn_queue.get()
+    conn2 = transport.Transport(conn2)
+    msg = await conn2.receive()
+    assert msg['type'] == 'authentication_request'
+    await conn2.send({'type': 'authentication_response',
+                      'body': {'success': True,
+                               'status': 'CONNECTED',
+                               'data': []}})
+    conn1 = await conn1_future
+
+    other_data = data._replace(key='other')
+
+    for i in range(10):
+        new_data = data._replace(value=i)
+        await conn2.send({'type': 'data_changed_unsolicited',
+                          'body': {'data': [encoder.data_to_json(new_data)]}})
+
+    await conn2.send({'type': 'data_changed_unsolicited',
+                      'body': {'data': [encoder.data_to_json(other_data)]}})
+
+    change = await data_queue.get()
+    assert change == [new_data, other_data]
+    assert conn1.data == {new_data.key: new_data,
+                          other_data.key: other_data}
+
+    await asyncio.sleep(0.2)
+    assert data_queue.empty()
+
+    await conn2.send({'type': 'data_changed_unsolicited',
+                      'body': {'data': [encoder.data_to_json(data)]}})
+    await conn2.send({'type': 'status_changed_unsolicited',
+                      'body': {'status': 'DISCONNECTED',
+                               'data': []}})
+
+    change = await data_queue.get()
+    assert change == [data]
+
+    status = await status_queue.get()
+    assert status == common.Status.DISCONNECTED
+    assert conn1.data == {}
+
+    assert data_queue.empty()
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
 async def test_status_changed(addr):
     conn_queue = aio.Queue()
     srv = await tcp.listen(conn_queue.put_nowait, addr)
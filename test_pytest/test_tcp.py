@@ -252,6 +252,110 @@ async def test_large(addr, write_block_count, write_block_size,
     await srv.async_close()
 
 
+@pytest.mark.parametrize("write_count", [1, 1000])
+async def test_writelines(addr, write_count):
+    conn_queue = aio.Queue()
+    srv = await tcp.listen(conn_queue.put_nowait, addr)
+    conn1 = await tcp.connect(addr)
+    conn2 = await conn_queue.get()
+
+    buffers = [b'abc', bytearray(b'x' * 102400), memoryview(b'123'), b'']
+    data = b''.join(buffers)
+
+    for _ in range(write_count):
+        conn1.async_group.spawn(conn1.writelines, buffers)
+
+    for _ in range(write_count):
+        result = await conn2.readexactly(len(data))
+        assert result == data
+
+    await conn1.async_close()
+
+    with pytest.raises(ConnectionError):
+        await conn1.writelines(buffers)
+
+    await conn2.async_close()
+    await srv.async_close()
+
+
+async def test_read_frames(addr):
+
+    def get_next_frame_size(data):
+        if len(data) < 1:
+            return 1
+
+        return 1 + data[0]
+
+    conn_queue = aio.Queue()
+    srv = await tcp.listen(conn_queue.put_nowait, addr)
+    conn1 = await tcp.connect(addr)
+    conn2 = await conn_queue.get()
+
+    await conn1.write(b'\x01a\x02bc\x00\x03d')
+    await asyncio.sleep(0.01)
+
+    frames = await conn2.read_frames(get_next_frame_size)
+    assert [bytes(frame) for frame in frames] == [b'\x01a', b'\x02bc',
+                                                  b'\x00']
+
+    read_task = asyncio.create_task(conn2.read_frames(get_next_frame_size))
+    await asyncio.sleep(0.01)
+    assert not read_task.done()
+
+    await conn1.write(b'e')
+    await asyncio.sleep(0.01)
+    assert not read_task.done()
+
+    await conn1.write(b'f\x01')
+    frames = await read_task
+    assert [bytes(frame) for frame in frames] == [b'\x03def']
+
+    await conn1.write(b'g')
+    data = await conn2.readexactly(2)
+    assert data == b'\x01g'
+
+    await conn1.async_close()
+
+    with pytest.raises(ConnectionError):
+        await conn2.read_frames(get_next_frame_size)
+
+    await conn2.async_close()
+    await srv.async_close()
+
+
+async def test_read_frames_cancel(addr):
+
+    def get_next_frame_size(data):
+        return 4
+
+    conn_queue = aio.Queue()
+    srv = await tcp.listen(conn_queue.put_nowait, addr)
+    conn1 = await tcp.connect(addr)
+    conn2 = await conn_queue.get()
+
+    await conn1.write(b'ab')
+    await asyncio.sleep(0.01)
+
+    read_task = asyncio.create_task(conn2.read_frames(get_next_frame_size))
+    await asyncio.sleep(0.01)
+
+    await conn1.write(b'c')
+    await asyncio.sleep(0.01)
+
+    read_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await read_task
+
+    await conn1.write(b'de')
+
+    data = await conn2.readexactly(5)
+    assert data == b'abcde'
+
+    await conn1.async_close()
+    await conn2.async_close()
+    await srv.async_close()
+
+
 # TODO
 async def test_input_buffer():
     pass